@@ -7,7 +7,9 @@ Architecture:
     - Services: Business logic layer
     - Routes: API endpoints (Blueprints)
     - Utils: Helper functions and decorators
+    - Commands: flask CLI commands (bulk import/export, stats rebuild)
     - Config: Configuration management
+    - Entry points: wsgi.py (production servers), asgi.py (optional async reads)
 
 OOP Principles Implemented:
     - Encapsulation: Data and methods bundled in classes
@@ -21,35 +23,64 @@ from flask import Flask
 from flask_cors import CORS
 from config import config
 from models import db
-from routes import auth_bp, experience_bp, health_bp
-
-
-def create_app(config_name='development'):
+from commands import register_commands
+from routes import auth_bp, experience_bp, health_bp, company_bp
+from services.search_index import SearchIndex
+from services.response_cache import ResponseCache
+from services.fragment_cache import FragmentCache
+from services.session_store import SessionStore
+from services.signed_token_store import SignedTokenStore
+from services.rate_limiter import RateLimiter
+from services.company_index import CompanyIndex
+from services.database_profile import DatabaseProfile
+from services.request_metrics import RequestMetrics
+from services.query_instrumentation import QueryInstrumentation
+from services.health_checker import HealthChecker
+from models.migrations import SchemaMigrator
+from utils.json_provider import FastJSONProvider
+from utils.startup_timer import StartupTimer
+
+
+def create_app(config_name='development', timer=None):
     """
     Application factory pattern
     Creates and configures the Flask application
     
     Args:
         config_name (str): Configuration to use (development/production/testing)
+        timer (StartupTimer): Timer that already holds earlier startup
+            phases (a new one is used if omitted)
     
     Returns:
         Flask: Configured Flask application instance
     """
-    # Create Flask app
-    app = Flask(__name__)
+    timer = timer if timer is not None else StartupTimer()
     
-    # Load configuration
-    app.config.from_object(config[config_name])
-    config[config_name].init_app(app)
+    with timer.phase('config'):
+        # Create Flask app
+        app = Flask(__name__)
+        app.extensions[StartupTimer.EXTENSION_KEY] = timer
+        
+        # Load configuration
+        app.config.from_object(config[config_name])
+        config[config_name].init_app(app)
+        
+        # Use the fast JSON provider (orjson when installed)
+        app.json = FastJSONProvider(app)
     
     # Initialize extensions
-    initialize_extensions(app)
+    with timer.phase('extensions'):
+        initialize_extensions(app)
     
-    # Register blueprints
-    register_blueprints(app)
+    # Register blueprints, error handlers and CLI commands
+    with timer.phase('routes'):
+        register_blueprints(app)
+        register_error_handlers(app)
+        register_commands(app)
     
     # Initialize database
-    initialize_database(app)
+    with timer.phase('database'):
+        initialize_database(app)
     
     return app
 
@@ -61,16 +92,43 @@ def initialize_extensions(app):
     Args:
         app (Flask): Flask application instance
     """
-    # Initialize database
+    # Initialize database, its SQLite connection profile and read engine
     db.init_app(app)
+    DatabaseProfile.init_app(app)
+    
+    # Initialize request, session and connection pool metrics
+    RequestMetrics.init_app(app)
+    
+    # Initialize per-request SQL timing, N+1 detection and the slow query log
+    QueryInstrumentation.init_app(app)
+    
+    # Initialize response and fragment caches for public experience reads
+    ResponseCache.init_app(app)
+    FragmentCache.init_app(app)
+    
+    # Initialize login token storage
+    if app.config['AUTH_TOKEN_MODE'] == 'signed':
+        SignedTokenStore.init_app(app)
+    else:
+        SessionStore.init_app(app)
+    
+    # Initialize login and write throttling
+    RateLimiter.init_app(app)
+    
+    # Initialize the in-process company name index for autocomplete
+    CompanyIndex.init_app(app)
+    
+    # Initialize the readiness probes behind /api/health/ready
+    HealthChecker.init_app(app)
     
     # Initialize CORS - Allow all origins with credentials
     CORS(app, 
          resources={r"/api/*": {
              "origins": "*",
              "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-             "allow_headers": ["Content-Type", "Authorization"],
-             "expose_headers": ["Content-Type", "Authorization"],
+             "allow_headers": ["Content-Type", "Authorization", "If-None-Match"],
+             "expose_headers": ["Content-Type", "Authorization", "ETag", "Server-Timing",
+                                 "X-DB-Query-Count", "X-DB-Time-Ms", "X-DB-Repeated-Statements"],
              "supports_credentials": False
          }})
 
@@ -86,44 +144,73 @@ def register_blueprints(app):
     app.register_blueprint(auth_bp)
     app.register_blueprint(experience_bp)
     app.register_blueprint(health_bp)
+    app.register_blueprint(company_bp)
 
 
-def initialize_database(app):
+def register_error_handlers(app):
     """
-    Initialize database tables
+    Register JSON error handlers
     
     Args:
         app (Flask): Flask application instance
     """
-    with app.app_context():
-        db.create_all()
+    app.register_error_handler(404, not_found)
+    app.register_error_handler(500, internal_error)
+    app.register_error_handler(400, bad_request)
 
 
-# Create application instance
-app = create_app()
+def initialize_database(app):
+    """
+    Initialize database tables and apply schema migrations (skipped when
+    the database is stamped with the current schema version),
+    install the full-text search index and load the company name index
+    
+    Args:
+        app (Flask): Flask application instance
+    """
+    with app.app_context():
+        if not SchemaMigrator.is_current(db.engine):
+            db.create_all()
+            SchemaMigrator.upgrade(db.engine)
+        SearchIndex.install(db.engine, app.config['FULL_TEXT_SEARCH_ENABLED'])
+        CompanyIndex.current().load()
 
 
 # Error handlers
-@app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
     return {'error': 'Resource not found'}, 404
 
 
-@app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors"""
     return {'error': 'Internal server error'}, 500
 
 
-@app.errorhandler(400)
 def bad_request(error):
     """Handle 400 errors"""
     return {'error': 'Bad request'}, 400
 
 
+_app = None
+
+
+def __getattr__(name):
+    """
+    Create the development application on first access to app.app
+    (flask run), so importing this module has no side effects.
+    Production servers should use wsgi.py or asgi.py
+    """
+    global _app
+    if name == 'app':
+        if _app is None:
+            _app = create_app()
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Main entry point
 if __name__ == '__main__':
     # Use port 8000 to avoid conflicts with macOS services
     # (5000=AirPlay, 5001=Control Center)
-    app.run(debug=True, host='0.0.0.0', port=8000)
+    create_app().run(debug=True, host='0.0.0.0', port=8000)
@@ -0,0 +1,231 @@
+"""
+InterviewHub ASGI Entry Point (optional)
+Serves the read-only routes on an async database driver with OOP principles:
+- Single Responsibility: Only runs read requests on the async engine
+- Encapsulation: The Flask views, services and caches are reused unchanged
+- Separation of Concerns: Writes and every other route stay on the WSGI app
+
+The list, detail and company stats GETs run the same Flask view functions
+as the WSGI app, inside AsyncSession.run_sync(): db.session is bound to the
+async session for the request, so every query awaits the async driver
+(aiosqlite) instead of blocking a worker thread, and the responses are the
+same bytes the blueprints return. All other requests are passed to the
+Flask app through asgiref's WSGI adapter.
+
+Requires the optional packages in requirements.txt (asgiref, aiosqlite,
+greenlet) and an ASGI server. The Flask application is built like wsgi.py's,
+with the configuration chosen by APP_CONFIG (default: production), when
+the server first reads asgi.app:
+    uvicorn asgi:app --workers 4
+"""
+import io
+import sys
+from werkzeug.exceptions import HTTPException
+
+try:
+    from asgiref.wsgi import WsgiToAsgi
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+except ImportError as error:  # pragma: no cover - optional dependencies
+    raise ImportError(
+        'asgi.py needs the optional async dependencies: '
+        'pip install asgiref aiosqlite greenlet'
+    ) from error
+
+from models import db
+from services.database_profile import DatabaseProfile
+from services.search_index import SearchIndex
+from wsgi import application as wsgi_application
+
+
+class AsyncReadApp:
+    """
+    ASGI application running read-only endpoints on an async engine
+    
+    The async engine opens the database read-only (ASYNC_DATABASE_URL, or
+    the SQLite file with mode=ro through aiosqlite) and gets the same
+    pragmas as DatabaseProfile's read engine.
+    """
+    
+    # Flask endpoints served on the async engine (GET and HEAD only)
+    READ_ENDPOINTS = frozenset({
+        'experience.get_experiences',
+        'experience.get_experience',
+        'company.get_top_companies',
+        'company.get_company_stats'
+    })
+    
+    def __init__(self, flask_app):
+        """
+        Initialize the ASGI application
+        
+        Args:
+            flask_app (Flask): Application created by create_app()
+        
+        Raises:
+            RuntimeError: If no async database URL can be derived
+        """
+        self.flask_app = flask_app
+        self.fallback = WsgiToAsgi(flask_app)
+        
+        with flask_app.app_context():
+            url = flask_app.config['ASYNC_DATABASE_URL'] or \
+                DatabaseProfile.read_only_url(db.engine.url, driver='sqlite+aiosqlite')
+            if url is None:
+                raise RuntimeError(
+                    'Set ASYNC_DATABASE_URL to serve this database from asgi.py'
+                )
+            # Resolve the cached full-text search check before the event loop runs
+            SearchIndex.is_enabled(db.engine, flask_app.config['FULL_TEXT_SEARCH_ENABLED'])
+            profile = DatabaseProfile.current()
+        
+        self.engine = create_async_engine(
+            url,
+            pool_size=flask_app.config['SQLITE_READ_POOL_SIZE'],
+            max_overflow=flask_app.config['SQLITE_READ_POOL_OVERFLOW']
+        )
+        if self.engine.dialect.name == 'sqlite':
+            profile.apply(self.engine.sync_engine, read_only=True)
+        self.sessions = async_sessionmaker(self.engine, expire_on_commit=False)
+    
+    async def __call__(self, scope, receive, send):
+        """
+        Handle one ASGI connection
+        
+        Args:
+            scope (dict): ASGI connection scope
+            receive (callable): ASGI receive channel
+            send (callable): ASGI send channel
+        """
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        
+        if scope['type'] != 'http' or scope['method'] not in ('GET', 'HEAD'):
+            await self.fallback(scope, receive, send)
+            return
+        
+        environ = self._build_environ(scope)
+        try:
+            endpoint, _ = self.flask_app.url_map.bind_to_environ(environ).match()
+        except HTTPException:
+            endpoint = None
+        if endpoint not in self.READ_ENDPOINTS:
+            await self.fallback(scope, receive, send)
+            return
+        
+        async with self.sessions() as session:
+            status, headers, body = await session.run_sync(self._dispatch, environ)
+        
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [
+                (name.lower().encode('latin-1'), value.encode('latin-1'))
+                for name, value in headers
+            ]
+        })
+        await send({'type': 'http.response.body', 'body': body})
+    
+    def _dispatch(self, session, environ):
+        """
+        Run the Flask view for a request on the async session
+        Encapsulation: Private method (runs inside run_sync's greenlet, so
+        blocking database calls become awaits on the async driver)
+        
+        Args:
+            session (Session): Synchronous facade of the AsyncSession
+            environ (dict): WSGI environment of the request
+        
+        Returns:
+            tuple: (status code, header list, body bytes)
+        """
+        with self.flask_app.request_context(environ):
+            # db.session is scoped to the app context pushed above; the
+            # teardown's db.session.remove() closes it again
+            db.session.registry.set(session)
+            try:
+                response = self.flask_app.full_dispatch_request()
+            except Exception as error:
+                response = self.flask_app.handle_exception(error)
+            
+            app_iter, status, headers = response.get_wsgi_response(environ)
+            try:
+                body = b''.join(app_iter)
+            finally:
+                if hasattr(app_iter, 'close'):
+                    app_iter.close()
+        
+        return int(status.split(' ', 1)[0]), headers, body
+    
+    async def _lifespan(self, receive, send):
+        """
+        Handle the ASGI lifespan protocol (dispose the pool on shutdown)
+        Encapsulation: Private method
+        """
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.engine.dispose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+    
+    @staticmethod
+    def _build_environ(scope):
+        """
+        Build the WSGI environment of a bodiless ASGI HTTP request
+        Encapsulation: Private method
+        
+        Args:
+            scope (dict): ASGI HTTP scope
+        
+        Returns:
+            dict: WSGI environ
+        """
+        server = scope.get('server') or ('localhost', 80)
+        environ = {
+            'REQUEST_METHOD': scope['method'],
+            'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+            'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+            'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+            'SERVER_NAME': server[0],
+            'SERVER_PORT': str(server[1] or 80),
+            'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': scope.get('scheme', 'http'),
+            'wsgi.input': io.BytesIO(b''),
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': True,
+            'wsgi.run_once': False
+        }
+        if scope.get('client'):
+            environ['REMOTE_ADDR'] = scope['client'][0]
+            environ['REMOTE_PORT'] = str(scope['client'][1])
+        
+        for raw_name, raw_value in scope.get('headers', []):
+            name = raw_name.decode('latin-1').upper().replace('-', '_')
+            if name not in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+                name = f'HTTP_{name}'
+            value = raw_value.decode('latin-1')
+            environ[name] = f'{environ[name]},{value}' if name in environ else value
+        
+        return environ
+
+
+_app = None
+
+
+def __getattr__(name):
+    """
+    Create the ASGI application on first access to asgi.app (uvicorn asgi:app)
+    around the Flask application of wsgi.py, so importing this module does
+    not open the database
+    """
+    global _app
+    if name == 'app':
+        if _app is None:
+            _app = AsyncReadApp(wsgi_application.load())
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
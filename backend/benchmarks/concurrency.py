@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Benchmark: concurrent reads and writes against a SQLite database file
+
+Runs reader threads (GET /api/experiences with random pages and filters)
+next to writer threads (POST /api/experiences) for a fixed time, once with
+the default connection settings and once with the production profile
+(WAL, tuned pragmas and the read-only engine). Response caches and rate
+limits are disabled so every request reaches the database.
+
+Usage (from backend/):
+    python benchmarks/concurrency.py [--rows 20000] [--readers 8] [--writers 2]
+                                     [--duration 10] [--profile default|production|both]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from config import config, DevelopmentConfig, ProductionConfig
+from models import db, Experience, User, CompanyStats
+
+BENCH_SETTINGS = {
+    'DEBUG': False,
+    'RATE_LIMIT_ENABLED': False,
+    'RESPONSE_CACHE_ENABLED': False,
+    'FRAGMENT_CACHE_ENABLED': False,
+    'SESSION_SWEEP_INTERVAL': 0
+}
+
+PROFILES = {
+    'default': DevelopmentConfig,
+    'production': ProductionConfig
+}
+
+
+def make_app(profile, path, rows):
+    """
+    Create an application on a fresh database file and seed it
+    
+    Args:
+        profile (str): Key of PROFILES
+        path (str): Database file path
+        rows (int): Experiences to insert
+    
+    Returns:
+        tuple: (app, author token)
+    """
+    name = f'bench-{profile}'
+    config[name] = type(name, (PROFILES[profile],), dict(
+        BENCH_SETTINGS, SQLALCHEMY_DATABASE_URI=f'sqlite:///{path}'
+    ))
+    app = create_app(name)
+    
+    client = app.test_client()
+    token = client.post('/api/auth/register', json={
+        'username': 'bench_author', 'password': 'bench-password'
+    }).get_json()['token']
+    
+    rng = random.Random(7)
+    now = datetime.utcnow()
+    with app.app_context():
+        user_id = db.session.query(User.id).filter(User.username == 'bench_author').scalar()
+        batch = []
+        for i in range(rows):
+            applied = date(2025, 1, 1) + timedelta(days=rng.randint(0, 300))
+            batch.append({
+                'job_title': f'Engineer {i}',
+                'company_name': f'Company {rng.randint(0, 499):03d}',
+                'experience_description': 'Phone screen, onsite loop and a system design round. ' * 5,
+                'difficulty': rng.choice(['Easy', 'Medium', 'Hard']),
+                'offer_received': rng.random() < 0.3,
+                'application_date': applied,
+                'final_decision_date': applied + timedelta(days=rng.randint(0, 60)),
+                'user_id': user_id,
+                'created_at': now - timedelta(minutes=i),
+                'updated_at': now - timedelta(minutes=i)
+            })
+        with db.engine.begin() as conn:
+            conn.execute(Experience.__table__.insert(), batch)
+            CompanyStats.rebuild(conn)
+    
+    return app, token
+
+
+def reader(app, deadline, latencies, errors):
+    """Issue list requests until the deadline"""
+    client = app.test_client()
+    rng = random.Random(threading.get_ident())
+    while time.perf_counter() < deadline:
+        query = f'/api/experiences?page={rng.randint(1, 50)}&per_page=20'
+        query += rng.choice(['', '&difficulty=Hard', '&offer_received=true', '&sort_by=difficulty'])
+        started = time.perf_counter()
+        status = client.get(query).status_code
+        latencies.append(time.perf_counter() - started)
+        if status != 200:
+            errors.append(status)
+
+
+def writer(app, token, deadline, latencies, errors):
+    """Create experiences until the deadline"""
+    client = app.test_client()
+    headers = {'Authorization': f'Bearer {token}'}
+    body = {
+        'job_title': 'Backend Engineer',
+        'company_name': 'Company 001',
+        'experience_description': 'Two coding rounds and a behavioral interview.',
+        'difficulty': 'Medium',
+        'offer_received': False,
+        'application_date': '2025-03-01',
+        'final_decision_date': '2025-03-20'
+    }
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        status = client.post('/api/experiences', json=body, headers=headers).status_code
+        latencies.append(time.perf_counter() - started)
+        if status != 201:
+            errors.append(status)
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile in milliseconds"""
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] * 1000
+
+
+def run(profile, args):
+    """
+    Run the mixed workload on one profile
+    
+    Returns:
+        dict: Throughput, latency percentiles and error counts
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        app, token = make_app(profile, os.path.join(directory, 'bench.db'), args.rows)
+        
+        read_latencies, write_latencies, read_errors, write_errors = [], [], [], []
+        deadline = time.perf_counter() + args.duration
+        threads = [
+            threading.Thread(target=reader, args=(app, deadline, read_latencies, read_errors))
+            for _ in range(args.readers)
+        ] + [
+            threading.Thread(target=writer, args=(app, token, deadline, write_latencies, write_errors))
+            for _ in range(args.writers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        with app.app_context():
+            db.engine.dispose()
+            database_profile = app.extensions['database_profile']
+            if database_profile.read_engine is not None:
+                database_profile.read_engine.dispose()
+    
+    return {
+        'reads_per_second': len(read_latencies) / args.duration,
+        'writes_per_second': len(write_latencies) / args.duration,
+        'read_p50': percentile(read_latencies, 0.5),
+        'read_p99': percentile(read_latencies, 0.99),
+        'write_p50': percentile(write_latencies, 0.5),
+        'write_p99': percentile(write_latencies, 0.99),
+        'read_errors': len(read_errors),
+        'write_errors': len(write_errors)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=2)
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--profile', choices=['default', 'production', 'both'], default='both')
+    args = parser.parse_args()
+    
+    profiles = list(PROFILES) if args.profile == 'both' else [args.profile]
+    print(f'{args.rows:,} rows, {args.readers} readers + {args.writers} writers, {args.duration:g}s each')
+    print(f"  {'profile':<11} {'reads/s':>9} {'writes/s':>9} {'read p50':>9} {'read p99':>9} "
+          f"{'write p50':>10} {'write p99':>10} {'errors r/w':>11}")
+    for profile in profiles:
+        result = run(profile, args)
+        print(f"  {profile:<11} {result['reads_per_second']:9.1f} {result['writes_per_second']:9.1f} "
+              f"{result['read_p50']:7.1f}ms {result['read_p99']:7.1f}ms "
+              f"{result['write_p50']:8.1f}ms {result['write_p99']:8.1f}ms "
+              f"{result['read_errors']:>5}/{result['write_errors']:<5}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: JSON encoding of a 100-item experience page
+
+Compares Flask's stock provider, FastJSONProvider on the standard library
+encoder, and FastJSONProvider on orjson (when installed).
+
+Usage (from backend/):
+    python benchmarks/json_encoding.py [--items 100] [--repeat 200]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import timeit
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from utils.json_provider import FastJSONProvider, orjson
+
+
+def build_page(items):
+    """
+    Build a list response shaped like GET /api/experiences
+    
+    Args:
+        items (int): Number of experiences on the page
+    
+    Returns:
+        tuple: (page with pre-formatted dates, page with date objects)
+    """
+    rng = random.Random(42)
+    words = ['interview', 'system', 'design', 'coding', 'behavioral', 'offer',
+             'recruiter', 'onsite', 'graph', 'dynamic', 'programming', 'team']
+    experiences = []
+    
+    for i in range(items):
+        applied = date(2025, 1, 1) + timedelta(days=rng.randint(0, 300))
+        decided = applied + timedelta(days=rng.randint(1, 60))
+        created = datetime(2025, 10, 1, 12, 0, 0) + timedelta(seconds=i * 37)
+        experiences.append({
+            'id': i + 1,
+            'job_title': 'Software Engineer',
+            'company_name': rng.choice(['Google', 'Meta', 'Amazon', 'Apple']),
+            'experience_description': ' '.join(rng.choice(words) for _ in range(rng.randint(150, 600))),
+            'difficulty': rng.choice(['Easy', 'Medium', 'Hard']),
+            'offer_received': rng.random() < 0.4,
+            'application_date': applied,
+            'final_decision_date': decided,
+            'application_timeline_days': (decided - applied).days,
+            'user_id': rng.randint(1, 50),
+            'author_username': f'user_{rng.randint(1, 50)}',
+            'created_at': created
+        })
+    
+    envelope = {'total': 10000, 'page': 1, 'per_page': items, 'pages': 100,
+                'has_next': True, 'has_prev': False, 'next_cursor': None}
+    native = dict(envelope, experiences=experiences)
+    preformatted = dict(envelope, experiences=[
+        dict(item,
+             application_date=item['application_date'].isoformat(),
+             final_decision_date=item['final_decision_date'].isoformat(),
+             created_at=item['created_at'].isoformat())
+        for item in experiences
+    ])
+    return preformatted, native
+
+
+def time_dumps(dumps, page, repeat):
+    """
+    Time one encoder
+    
+    Returns:
+        tuple: (median seconds, output size in bytes)
+    """
+    timings = timeit.repeat(lambda: dumps(page), number=1, repeat=repeat)
+    return statistics.median(timings), len(dumps(page).encode())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--items', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+    
+    preformatted, native = build_page(args.items)
+    app = Flask(__name__)
+    
+    candidates = [('flask default (stdlib, pre-formatted dates)',
+                   lambda page: DefaultJSONProvider(app).dumps(page), preformatted)]
+    
+    app.config['JSON_USE_ORJSON'] = False
+    stdlib = FastJSONProvider(app)
+    candidates.append(('FastJSONProvider stdlib (native dates)', stdlib.dumps, native))
+    
+    if orjson is not None:
+        app.config['JSON_USE_ORJSON'] = True
+        fast = FastJSONProvider(app)
+        candidates.append(('FastJSONProvider orjson (native dates)', fast.dumps, native))
+    else:
+        print('orjson is not installed; only the stdlib encoders are measured')
+    
+    baseline = None
+    print(f'{args.items}-item page, median of {args.repeat} runs')
+    for name, dumps, page in candidates:
+        seconds, size = time_dumps(dumps, page, args.repeat)
+        baseline = baseline or seconds
+        print(f'  {name:<45} {seconds * 1000:8.3f} ms  {size / 1024:8.1f} KiB  x{baseline / seconds:5.2f}')
+
+
+if __name__ == '__main__':
+    main()
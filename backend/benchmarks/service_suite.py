@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: service-layer latency with stored baselines
+
+Generates SQLite databases of each requested size with DatasetGenerator
+(cached in --data-dir and copied for every run, so write cases never change
+the seed), then times requests through the Flask test client with the
+response caches and rate limits off:
+    - list: every filter x sort x page depth (page 1, 10, 100 and a cursor
+      ten pages deep), plus relevance sort (offset pages) for search
+    - detail: GET /api/experiences/<id> on random IDs
+    - write: create, update and delete
+    - auth: login and token verification (GET /api/auth/me)
+
+Results (p50/p95/mean/min in milliseconds per case) are written to JSON
+with --output. With --compare, results are checked against a stored
+baseline and the script exits with status 1 when a p50 or p95 is slower
+than the baseline by more than --tolerance (and --min-delta-ms).
+
+Usage (from backend/):
+    python benchmarks/service_suite.py [--sizes 1k,100k,1m] [--repeat 15]
+                                       [--cases REGEX] [--output FILE]
+                                       [--compare BASELINE] [--tolerance 0.2]
+    python benchmarks/service_suite.py --results FILE --compare BASELINE
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from config import config, ProductionConfig
+from models import db, CompanyStats
+from services.dataset_generator import DatasetGenerator
+from utils.json_provider import orjson
+
+SIZES = {'1k': 1000, '100k': 100000, '1m': 1000000}
+
+BENCH_SETTINGS = {
+    'DEBUG': False,
+    'RATE_LIMIT_ENABLED': False,
+    'RESPONSE_CACHE_ENABLED': False,
+    'FRAGMENT_CACHE_ENABLED': False,
+    'SQL_SLOW_QUERY_MS': 0,
+    'SESSION_SWEEP_INTERVAL': 0
+}
+
+BENCH_USER = {'username': 'bench_author', 'password': 'bench-password'}
+
+FILTERS = {
+    'all': {},
+    'difficulty': {'difficulty': 'Hard'},
+    'offer': {'offer_received': 'true'},
+    'company': {'company': None},  # resolved with ranked_company(COMPANY_RANK)
+    'timeline': {'min_timeline_days': 14, 'max_timeline_days': 45},
+    'search': {'search': 'system design'},
+    'combined': {'difficulty': 'Medium', 'offer_received': 'false', 'min_timeline_days': 7}
+}
+
+SORTS = ['date_desc', 'date_asc', 'difficulty', 'timeline_asc', 'timeline_desc']
+
+# Page depth name -> page number (None: follow next_cursor for ten pages)
+DEPTHS = {'p1': 1, 'p10': 10, 'p100': 100, 'cursor10': None}
+
+PER_PAGE = 20
+
+# Popularity rank (1 = most experiences) of the company used by the company filter
+COMPANY_RANK = 10
+
+
+def seed_database(path, rows, seed=7):
+    """
+    Create a database file with the bench user and rows generated experiences
+    
+    Args:
+        path (str): Database file path
+        rows (int): Experiences to generate
+        seed (int): Random seed (the same seed gives the same data)
+    """
+    name = f'suite-seed-{rows}'
+    config[name] = type(name, (ProductionConfig,), dict(
+        BENCH_SETTINGS, SQLALCHEMY_DATABASE_URI=f'sqlite:///{path}'
+    ))
+    app = create_app(name)
+    app.test_client().post('/api/auth/register', json=BENCH_USER)
+    
+    with app.app_context():
+        DatasetGenerator(db.engine, seed=seed).run(rows)
+        db.engine.dispose()
+        app.extensions['database_profile'].read_engine.dispose()
+
+
+def ranked_company(app, rank):
+    """
+    Get the company with the rank-th most experiences
+    
+    Returns:
+        str: Company name
+    """
+    with app.app_context():
+        return db.session.execute(
+            db.select(CompanyStats.company_name)
+            .order_by(CompanyStats.experience_count.desc(), CompanyStats.company_name)
+            .offset(rank - 1).limit(1)
+        ).scalar_one()
+
+
+def seed_path(data_dir, size, rows):
+    """
+    Get the cached seed database of a size, creating it if needed
+    
+    Returns:
+        str: Path of the seed database file
+    """
+    path = os.path.join(data_dir, f'dataset-{size}.db')
+    if not os.path.exists(path):
+        os.makedirs(data_dir, exist_ok=True)
+        print(f'  seeding {rows:,} experiences into {path} ...', flush=True)
+        started = time.perf_counter()
+        partial = path + '.partial'
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(partial + suffix):
+                os.remove(partial + suffix)
+        seed_database(partial, rows)
+        with sqlite3.connect(partial) as conn:
+            conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        os.replace(partial, path)
+        for suffix in ('-wal', '-shm'):
+            if os.path.exists(partial + suffix):
+                os.remove(partial + suffix)
+        print(f'  seeded in {time.perf_counter() - started:.1f}s', flush=True)
+    return path
+
+
+def make_app(path):
+    """Create a benchmark application on a database file"""
+    name = f'suite-{os.path.basename(os.path.dirname(path))}'
+    config[name] = type(name, (ProductionConfig,), dict(
+        BENCH_SETTINGS, SQLALCHEMY_DATABASE_URI=f'sqlite:///{path}'
+    ))
+    return create_app(name)
+
+
+def list_cases():
+    """
+    Build every list case
+    
+    Returns:
+        list: (case name, query parameters, page depth) tuples
+    """
+    cases = []
+    for filter_name, params in FILTERS.items():
+        sorts = SORTS + (['relevance'] if 'search' in params else [])
+        for sort_by in sorts:
+            for depth_name, page in DEPTHS.items():
+                # Relevance order has no keyset cursor
+                if page is None and sort_by == 'relevance':
+                    continue
+                cases.append((
+                    f'list/{filter_name}/{sort_by}/{depth_name}',
+                    dict(params, sort_by=sort_by, per_page=PER_PAGE),
+                    page
+                ))
+    return cases
+
+
+def time_requests(send, repeat, warmup=2):
+    """
+    Time a request function
+    
+    Args:
+        send (callable): Takes the iteration number and sends one request
+        repeat (int): Timed iterations
+        warmup (int): Untimed iterations first
+    
+    Returns:
+        list: Milliseconds per timed iteration
+    """
+    for i in range(warmup):
+        send(-1 - i)
+    timings = []
+    for i in range(repeat):
+        started = time.perf_counter()
+        send(i)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def summarize(timings):
+    """
+    Reduce timings to the stored statistics
+    
+    Returns:
+        dict: n, p50, p95, mean and min in milliseconds
+    """
+    ordered = sorted(timings)
+    return {
+        'n': len(ordered),
+        'p50': round(percentile(ordered, 0.50), 3),
+        'p95': round(percentile(ordered, 0.95), 3),
+        'mean': round(sum(ordered) / len(ordered), 3),
+        'min': round(ordered[0], 3)
+    }
+
+
+def percentile(ordered, fraction):
+    """Nearest-rank percentile of sorted values"""
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def checked(response, expected=200):
+    """Fail loudly when a benchmarked request does not succeed"""
+    if response.status_code != expected:
+        raise RuntimeError(f'{response.request.method} {response.request.path} '
+                           f'returned {response.status_code}: {response.get_data(as_text=True)[:200]}')
+    return response
+
+
+def run_size(path, rows, args, selected):
+    """
+    Run every selected case on one seeded database
+    
+    Returns:
+        dict: Case name -> statistics
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        work_path = os.path.join(directory, 'bench.db')
+        shutil.copy(path, work_path)
+        app = make_app(work_path)
+        client = app.test_client()
+        company = ranked_company(app, COMPANY_RANK)
+        
+        def record(name, send):
+            if selected(name):
+                results[name] = summarize(time_requests(send, args.repeat))
+                print(f"    {name:<44} p50 {results[name]['p50']:9.2f}ms  "
+                      f"p95 {results[name]['p95']:9.2f}ms", flush=True)
+        
+        for name, params, page in list_cases():
+            if not selected(name):
+                continue
+            if 'company' in params:
+                params = dict(params, company=company)
+            if page is None:
+                cursor = ''
+                for _ in range(9):
+                    body = checked(client.get('/api/experiences', query_string=dict(params, cursor=cursor))).get_json()
+                    cursor = body.get('next_cursor') or ''
+                params = dict(params, cursor=cursor)
+            else:
+                params = dict(params, page=page)
+            record(name, lambda i, params=params: checked(client.get('/api/experiences', query_string=params)))
+        
+        rng = random.Random(rows)
+        ids = [rng.randint(1, rows) for _ in range(args.repeat + 2)]
+        record('detail', lambda i: checked(client.get(f'/api/experiences/{ids[i]}')))
+        
+        token = checked(client.post('/api/auth/login', json=BENCH_USER)).get_json()['token']
+        headers = {'Authorization': f'Bearer {token}'}
+        body = {
+            'job_title': 'Backend Engineer',
+            'company_name': 'Company 001',
+            'experience_description': 'Two coding rounds and a behavioral interview.',
+            'difficulty': 'Medium',
+            'offer_received': False,
+            'application_date': '2025-03-01',
+            'final_decision_date': '2025-03-20'
+        }
+        created = []
+        record('write/create', lambda i: created.append(checked(
+            client.post('/api/experiences', json=body, headers=headers), 201
+        ).get_json()['experience']['id']))
+        record('write/update', lambda i: checked(client.put(
+            f'/api/experiences/{created[i]}', json=dict(body, difficulty='Hard'), headers=headers
+        )))
+        record('write/delete', lambda i: checked(client.delete(
+            f'/api/experiences/{created.pop()}', headers=headers
+        )))
+        
+        record('auth/login', lambda i: checked(client.post('/api/auth/login', json=BENCH_USER)))
+        record('auth/verify', lambda i: checked(client.get('/api/auth/me', headers=headers)))
+        
+        with app.app_context():
+            db.engine.dispose()
+            read_engine = app.extensions['database_profile'].read_engine
+            if read_engine is not None:
+                read_engine.dispose()
+    return results
+
+
+def compare(results, baseline, tolerance, min_delta_ms):
+    """
+    Compare results with a baseline and print the differences
+    
+    Args:
+        results (dict): Results document
+        baseline (dict): Baseline document
+        tolerance (float): Allowed relative slowdown (0.2 = 20%)
+        min_delta_ms (float): Slowdowns below this many ms are never regressions
+    
+    Returns:
+        list: Regressions as (size, case, metric, baseline ms, current ms)
+    """
+    regressions = []
+    print(f'\nCompared with baseline (tolerance {tolerance:.0%}, minimum {min_delta_ms}ms):')
+    for size, cases in results['results'].items():
+        base_cases = baseline['results'].get(size, {})
+        for case, stats in cases.items():
+            base = base_cases.get(case)
+            if base is None:
+                print(f'  {size:>5} {case:<44} new')
+                continue
+            for metric in ('p50', 'p95'):
+                before, after = base[metric], stats[metric]
+                if after > before * (1 + tolerance) and after - before >= min_delta_ms:
+                    regressions.append((size, case, metric, before, after))
+                    print(f'  {size:>5} {case:<44} {metric} {before:9.2f}ms -> {after:9.2f}ms  REGRESSION')
+    if not regressions:
+        print('  no regressions')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', default='1k,100k,1m',
+                        help=f"comma-separated sizes from {', '.join(SIZES)}")
+    parser.add_argument('--repeat', type=int, default=15)
+    parser.add_argument('--cases', help='only run cases whose name matches this regex')
+    parser.add_argument('--data-dir', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data'))
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--results', help='load results from this JSON file instead of running')
+    parser.add_argument('--compare', help='baseline JSON file to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    parser.add_argument('--min-delta-ms', type=float, default=0.5)
+    args = parser.parse_args()
+    
+    if args.results:
+        with open(args.results) as f:
+            document = json.load(f)
+    else:
+        pattern = re.compile(args.cases) if args.cases else None
+        selected = (lambda name: pattern.search(name) is not None) if pattern else (lambda name: True)
+        document = {
+            'meta': {
+                'created_at': datetime.utcnow().isoformat(timespec='seconds') + 'Z',
+                'python': platform.python_version(),
+                'sqlite': sqlite3.sqlite_version,
+                'platform': platform.platform(),
+                'orjson': orjson is not None,
+                'repeat': args.repeat
+            },
+            'results': {}
+        }
+        for size in args.sizes.split(','):
+            rows = SIZES[size]
+            print(f'{size} ({rows:,} experiences)', flush=True)
+            path = seed_path(args.data_dir, size, rows)
+            document['results'][size] = run_size(path, rows, args, selected)
+        
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(document, f, indent=2, sort_keys=True)
+            print(f'\nResults written to {args.output}')
+    
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(document, baseline, args.tolerance, args.min_delta_ms):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
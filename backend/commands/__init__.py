@@ -0,0 +1,26 @@
+"""
+Commands package initialization
+Registers the application's `flask` CLI commands
+"""
+from commands.import_experiences import import_experiences_command
+from commands.export_experiences import export_experiences_command
+from commands.rebuild_company_stats import rebuild_company_stats_command
+from commands.check_query_plans import check_query_plans_command
+from commands.generate_dataset import generate_dataset_command
+
+
+def register_commands(app):
+    """
+    Register CLI commands on the application
+    
+    Args:
+        app (Flask): Flask application instance
+    """
+    app.cli.add_command(import_experiences_command)
+    app.cli.add_command(export_experiences_command)
+    app.cli.add_command(rebuild_company_stats_command)
+    app.cli.add_command(check_query_plans_command)
+    app.cli.add_command(generate_dataset_command)
+
+
+__all__ = ['register_commands']
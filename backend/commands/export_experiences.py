@@ -0,0 +1,51 @@
+"""
+Export Command
+Implements `flask export-experiences` with OOP principles:
+- Separation of Concerns: Argument parsing and output only; rows are
+  streamed by ExperienceService.export_experiences
+"""
+import time
+import click
+from flask.cli import with_appcontext
+from services.experience_service import ExperienceService
+
+
+@click.command('export-experiences')
+@click.argument('output', type=click.File('w', encoding='utf-8', lazy=True), default='-')
+@click.option('--difficulty', help='Only export this difficulty.')
+@click.option('--offer-received', type=click.Choice(['true', 'false']),
+              help='Only export experiences with or without an offer.')
+@click.option('--company', help='Only export experiences at this company (exact name).')
+@click.option('--min-timeline-days', type=int,
+              help='Only export experiences decided at least this many days after applying.')
+@click.option('--max-timeline-days', type=int,
+              help='Only export experiences decided at most this many days after applying.')
+@click.option('--search', help='Only export experiences matching this search term.')
+@click.option('--batch-size', default=None, type=int,
+              help='Rows fetched and encoded per batch (default: EXPORT_BATCH_SIZE).')
+@with_appcontext
+def export_experiences_command(output, difficulty, offer_received, company,
+                               min_timeline_days, max_timeline_days, search, batch_size):
+    """
+    Export experiences as NDJSON to OUTPUT (default: standard output)
+    
+    The output can be loaded again with `flask import-experiences`.
+    """
+    started = time.perf_counter()
+    count = 0
+    
+    for chunk in ExperienceService.export_experiences(
+        difficulty=difficulty,
+        offer_received=offer_received,
+        search=search,
+        company=company,
+        min_timeline_days=min_timeline_days,
+        max_timeline_days=max_timeline_days,
+        batch_size=batch_size
+    ):
+        output.write(chunk)
+        count += chunk.count('\n')
+    
+    elapsed = time.perf_counter() - started
+    click.echo(f'Exported {count:,} rows in {elapsed:.1f}s '
+               f'({count / elapsed if elapsed else 0:,.0f} rows/s)', err=True)
@@ -0,0 +1,77 @@
+"""
+Dataset Generation Command
+Implements `flask generate-dataset` with OOP principles:
+- Separation of Concerns: Argument parsing and output only; the data is
+  generated by DatasetGenerator
+"""
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from models import db
+from services.dataset_generator import DatasetGenerator
+
+
+def _parse_mix(ctx, param, value):
+    """Parse an Easy,Medium,Hard weight list such as 30,50,20"""
+    try:
+        weights = tuple(float(weight) for weight in value.split(','))
+    except ValueError:
+        raise click.BadParameter('expected three comma-separated numbers, e.g. 30,50,20')
+    if len(weights) != 3:
+        raise click.BadParameter('expected weights for Easy, Medium and Hard')
+    return weights
+
+
+@click.command('generate-dataset')
+@click.option('--rows', default=100000, show_default=True, help='Experiences to generate.')
+@click.option('--users', default=1000, show_default=True, help='Authors to create (user_000001, ...).')
+@click.option('--companies', default=2000, show_default=True, help='Distinct companies.')
+@click.option('--company-skew', default=1.1, show_default=True,
+              help='Zipf exponent of company popularity (0 = uniform).')
+@click.option('--difficulty-mix', default='30,50,20', show_default=True, callback=_parse_mix,
+              help='Relative weights of Easy, Medium and Hard.')
+@click.option('--offer-rate', default=0.35, show_default=True, help='Fraction of experiences with an offer.')
+@click.option('--start', type=click.DateTime(['%Y-%m-%d']), default='2023-01-01', show_default=True,
+              help='Earliest application date.')
+@click.option('--end', type=click.DateTime(['%Y-%m-%d']), default='2025-12-31', show_default=True,
+              help='Latest creation date.')
+@click.option('--seed', default=42, show_default=True, help='Random seed (same seed, same data).')
+@click.option('--password', default='password123', show_default=True, help='Password of every generated user.')
+@click.option('--skip-search-index', is_flag=True,
+              help='Do not build the full-text index now (it is built on the next startup).')
+@with_appcontext
+def generate_dataset_command(rows, users, companies, company_skew, difficulty_mix, offer_rate,
+                             start, end, seed, password, skip_search_index):
+    """
+    Fill an empty SQLite database with a deterministic synthetic dataset
+    
+    For benchmarks and load tests, e.g.:
+    DATABASE_URL=sqlite:////tmp/bench.db flask generate-dataset --rows 1000000
+    """
+    def report(stats):
+        click.echo(f"  {stats['rows']:>10,} rows  {stats['elapsed']:6.1f}s")
+    
+    try:
+        generator = DatasetGenerator(
+            db.engine,
+            seed=seed,
+            users=users,
+            companies=companies,
+            company_skew=company_skew,
+            difficulty_mix=difficulty_mix,
+            offer_rate=offer_rate,
+            start=start.date(),
+            end=end.date(),
+            password=password,
+            progress=report
+        )
+        stats = generator.run(
+            rows,
+            search_index=not skip_search_index and current_app.config['FULL_TEXT_SEARCH_ENABLED']
+        )
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    
+    phases = ', '.join(f'{name} {seconds:.1f}s' for name, seconds in stats['phases'].items())
+    click.echo(f"Generated {stats['rows']:,} experiences by {stats['users']:,} users at "
+               f"{stats['companies']:,} companies in {stats['elapsed']:.1f}s ({phases})")
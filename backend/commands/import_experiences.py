@@ -0,0 +1,69 @@
+"""
+Import Command
+Implements `flask import-experiences` with OOP principles:
+- Separation of Concerns: Argument parsing and output only; the import
+  itself is done by ExperienceImporter
+"""
+import click
+from flask.cli import with_appcontext
+from models import db
+from services.experience_importer import ExperienceImporter
+
+
+@click.command('import-experiences')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'file_format', type=click.Choice(ExperienceImporter.FORMATS),
+              help='Input format (default: from the file extension).')
+@click.option('--chunk-size', default=1000, show_default=True,
+              help='Records validated and inserted per executemany.')
+@click.option('--transaction-size', default=50000, show_default=True,
+              help='Records per committed transaction (and checkpoint).')
+@click.option('--create-users', is_flag=True,
+              help='Create authors that do not exist instead of rejecting their records.')
+@click.option('--default-password',
+              help='Password for created users (they cannot log in without one).')
+@click.option('--errors', 'errors_path', type=click.Path(dir_okay=False, writable=True),
+              help='Append rejected records to this NDJSON file.')
+@click.option('--restart', is_flag=True,
+              help='Discard the checkpoint and import the file from the beginning.')
+@with_appcontext
+def import_experiences_command(path, file_format, chunk_size, transaction_size,
+                               create_users, default_password, errors_path, restart):
+    """
+    Import experiences from an NDJSON or CSV file
+    
+    Each record holds the fields of POST /api/experiences plus the author's
+    "username". Re-running the command after an interruption resumes after
+    the last committed transaction.
+    """
+    def report(stats):
+        click.echo(f"  {stats['records']:>10,} records  {stats['imported']:>10,} imported  "
+                   f"{stats['rejected']:>8,} rejected  {stats['rows_per_second']:>10,.0f} rows/s")
+    
+    errors = open(errors_path, 'a', encoding='utf-8') if errors_path else None
+    try:
+        importer = ExperienceImporter(
+            db.engine,
+            chunk_size=chunk_size,
+            transaction_size=transaction_size,
+            create_users=create_users,
+            default_password=default_password,
+            errors=errors,
+            progress=report
+        )
+        stats = importer.run(path, file_format=file_format, restart=restart)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    finally:
+        if errors is not None:
+            errors.close()
+    
+    if stats['resumed_at'] and stats['imported_now'] == 0 and stats['completed']:
+        click.echo(f"{stats['source']} was already imported ({stats['imported']:,} rows); "
+                   'use --restart to import it again')
+        return
+    if stats['resumed_at']:
+        click.echo(f"Resumed after record {stats['resumed_at']:,}")
+    click.echo(f"Imported {stats['imported_now']:,} rows in {stats['elapsed']:.1f}s "
+               f"({stats['rows_per_second']:,.0f} rows/s); "
+               f"{stats['rejected']:,} records rejected in total")
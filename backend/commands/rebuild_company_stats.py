@@ -0,0 +1,26 @@
+"""
+Company Stats Command
+Implements `flask rebuild-company-stats` with OOP principles:
+- Separation of Concerns: Output only; CompanyStats does the work
+"""
+import time
+import click
+from flask.cli import with_appcontext
+from models import db, CompanyStats
+
+
+@click.command('rebuild-company-stats')
+@with_appcontext
+def rebuild_company_stats_command():
+    """
+    Recompute the company_stats summary from the experience table
+    
+    The summary is normally kept up to date by every write; use this after
+    editing experiences outside the application.
+    """
+    started = time.perf_counter()
+    
+    with db.engine.begin() as conn:
+        companies = CompanyStats.rebuild(conn)
+    
+    click.echo(f'Rebuilt stats for {companies:,} companies in {time.perf_counter() - started:.1f}s')
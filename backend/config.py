@@ -15,14 +15,131 @@ class Config:
     # Database Configuration
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL', 'sqlite:///share_your_experience.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # SQLite connection profile, applied to every new connection
+    # (see ProductionConfig); ignored for other databases
+    SQLITE_PRAGMAS = {}
+    # Separate pooled read-only engine for the read-only service methods
+    SQLITE_READ_ENGINE_ENABLED = False
+    SQLITE_READ_POOL_SIZE = 10
+    SQLITE_READ_POOL_OVERFLOW = 10
+    # Async driver URL for the read routes served by asgi.py; derived from
+    # SQLALCHEMY_DATABASE_URI (read-only aiosqlite) for SQLite files
+    ASYNC_DATABASE_URL = os.environ.get('ASYNC_DATABASE_URL')
     
     # CORS Configuration
     CORS_ORIGINS = os.environ.get('CORS_ORIGINS', '*')
     
+    # Session Configuration
+    # 'session' issues random tokens kept in the session backend below;
+    # 'signed' issues HMAC-signed tokens verified without any lookup (every
+    # worker must share SECRET_KEY; logouts go to a small revocation list)
+    AUTH_TOKEN_MODE = os.environ.get('AUTH_TOKEN_MODE', 'session')
+    # Previous secrets still accepted for signed tokens while rotating SECRET_KEY
+    SECRET_KEY_FALLBACKS = [key for key in os.environ.get('SECRET_KEY_FALLBACKS', '').split(',') if key]
+    # Seconds before a logout in another worker is seen in signed token mode
+    TOKEN_REVOCATION_REFRESH = 5
+    # 'sql' stores hashed tokens in the user_session table (shared by all
+    # workers, survives restarts); 'memory' keeps them in this process only
+    SESSION_BACKEND = os.environ.get('SESSION_BACKEND', 'sql')
+    SESSION_TTL = 7 * 24 * 3600  # seconds
+    # In-process LRU in front of the SQL backend; a logout in another worker
+    # is seen here after at most SESSION_CACHE_TTL seconds (0 entries disables)
+    SESSION_CACHE_MAX_ENTRIES = 10000
+    SESSION_CACHE_TTL = 60  # seconds
+    # Background purge of expired sessions (0 disables the sweeper thread)
+    SESSION_SWEEP_INTERVAL = 600  # seconds
+    
+    # Rate Limit Configuration
+    # Per-process token buckets: scope -> (requests regained per second, burst).
+    # Login and registration are throttled per client IP and per username
+    # before any password hashing; writes are throttled per client IP.
+    RATE_LIMIT_ENABLED = True
+    RATE_LIMITS = {
+        'login_ip': (0.5, 20),
+        'login_username': (0.1, 5),
+        'register_ip': (0.1, 5),
+        'register_username': (0.1, 3),
+        'write_ip': (1.0, 30),
+        'export_ip': (0.05, 5)
+    }
+    RATE_LIMIT_MAX_KEYS = 10000
+    
     # Pagination Configuration
     DEFAULT_PAGE_SIZE = 10
     MAX_PAGE_SIZE = 100
     
+    # Company Stats Configuration
+    DEFAULT_TOP_COMPANIES = 10
+    MAX_TOP_COMPANIES = 100
+    
+    # Company Suggest Configuration
+    # The name index is updated by this worker's writes and reloaded from
+    # the company_stats table after this many seconds (other workers' writes)
+    COMPANY_INDEX_REFRESH = 60  # seconds
+    DEFAULT_SUGGESTIONS = 10
+    MAX_SUGGESTIONS = 50
+    
+    # Batch Configuration
+    # Maximum number of experiences in one POST /api/experiences/batch
+    MAX_BATCH_SIZE = 100
+    
+    # Export Configuration
+    # Rows fetched from the database cursor and encoded per NDJSON chunk
+    EXPORT_BATCH_SIZE = 1000
+    
+    # Search Configuration
+    # Use a SQLite FTS5 index for the search filter (falls back to ILIKE
+    # on other databases or when FTS5 is unavailable)
+    FULL_TEXT_SEARCH_ENABLED = True
+    
+    # Response Cache Configuration
+    # In-process LRU cache for public experience list/detail reads. Writes
+    # invalidate it in the worker that handled them; other workers see the
+    # change once their entries expire, so keep the TTL short.
+    RESPONSE_CACHE_ENABLED = True
+    RESPONSE_CACHE_MAX_ENTRIES = 512
+    RESPONSE_CACHE_TTL = 30  # seconds
+    
+    # Fragment Cache Configuration
+    # Pre-serialized JSON per experience, used to assemble list pages and
+    # detail responses without re-encoding unchanged rows
+    FRAGMENT_CACHE_ENABLED = True
+    FRAGMENT_CACHE_MAX_ENTRIES = 10000
+    FRAGMENT_CACHE_TTL = 300  # seconds
+    
+    # JSON Configuration
+    # Encode responses with orjson when it is installed (stdlib otherwise)
+    JSON_USE_ORJSON = True
+    
+    # Metrics Configuration
+    # Prometheus metrics at GET /api/metrics (per worker process)
+    METRICS_ENABLED = True
+    METRICS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    
+    # Health Check Configuration
+    # GET /api/health/ready probes the database, SQLite's write lock, free
+    # disk space and the session store; results are reused for this long
+    HEALTH_CHECK_CACHE_SECONDS = 5
+    # Longest wait for the write lock before the worker reports not ready
+    HEALTH_WRITE_LOCK_TIMEOUT_MS = 1000
+    # Free space next to the SQLite file below which the worker is not ready
+    HEALTH_MIN_FREE_DISK_MB = 100
+    
+    # SQL Instrumentation Configuration
+    # Per-request statement count and time in the Server-Timing header;
+    # SQL_DEBUG_HEADERS adds X-DB-Query-Count/X-DB-Time-Ms/X-DB-Repeated-Statements
+    SQL_INSTRUMENTATION_ENABLED = True
+    SQL_DEBUG_HEADERS = False
+    # Identical statements run this many times in one request are logged
+    # as likely N+1 queries (0 disables the check)
+    SQL_REPEATED_STATEMENT_THRESHOLD = 5
+    # Statements slower than this are logged with their parameters and
+    # route (0 disables); SQL_SLOW_QUERY_LOG also writes them to a file
+    SQL_SLOW_QUERY_MS = 200
+    SQL_SLOW_QUERY_LOG = os.environ.get('SQL_SLOW_QUERY_LOG')
+    SQL_SLOW_QUERY_LOG_MAX_BYTES = 10 * 1024 * 1024
+    SQL_SLOW_QUERY_LOG_BACKUPS = 5
+    
     # Validation Configuration
     MIN_PASSWORD_LENGTH = 6
     MIN_USERNAME_LENGTH = 3
@@ -41,12 +158,25 @@ class DevelopmentConfig(Config):
     """Development configuration"""
     DEBUG = True
     TESTING = False
+    SQL_DEBUG_HEADERS = True
 
 
 class ProductionConfig(Config):
     """Production configuration"""
     DEBUG = False
     TESTING = False
+    
+    # WAL lets readers run alongside a writer; synchronous=NORMAL is durable
+    # across application crashes in WAL mode (a power loss can drop the
+    # last commits); writers wait up to busy_timeout ms for the lock
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'mmap_size': 256 * 1024 * 1024,
+        'cache_size': -64000,  # KiB (negative) -> 64 MB per connection
+        'busy_timeout': 5000
+    }
+    SQLITE_READ_ENGINE_ENABLED = True
 
 
 class TestingConfig(Config):
@@ -54,6 +184,8 @@ class TestingConfig(Config):
     DEBUG = True
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    SESSION_SWEEP_INTERVAL = 0
+    RATE_LIMIT_ENABLED = False
 
 
 # Configuration dictionary
@@ -3,13 +3,20 @@ Models package initialization
 Exports all database models
 """
 from flask_sqlalchemy import SQLAlchemy
+from models.routing_session import RoutingSession, read_only
 
-# Initialize SQLAlchemy
-db = SQLAlchemy()
+# Initialize SQLAlchemy (reads of @read_only methods may use a read engine)
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 
 # Import models after db initialization
 from models.user import User
 from models.experience import Experience
+from models.dataset_version import DatasetVersion
+from models.user_session import UserSession
+from models.revoked_token import RevokedToken
+from models.import_checkpoint import ImportCheckpoint
+from models.company_stats import CompanyStats
 
-__all__ = ['db', 'User', 'Experience']
+__all__ = ['db', 'User', 'Experience', 'DatasetVersion', 'UserSession', 'RevokedToken',
+           'ImportCheckpoint', 'CompanyStats', 'RoutingSession', 'read_only']
 
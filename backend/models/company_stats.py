@@ -0,0 +1,248 @@
+"""
+Company Stats Model
+Implements an incrementally maintained per-company summary with OOP principles:
+- Single Responsibility: Aggregates experiences per company
+- Encapsulation: Writers pass row changes; counters and histogram are internal
+"""
+import json
+import math
+from collections import Counter, defaultdict
+from models import db
+from models.experience import Experience
+
+
+class CompanyStats(db.Model):
+    """
+    CompanyStats model holding running aggregates of one company's experiences
+    
+    Every experience write applies its row changes here in the same
+    transaction (see record()), so the stats endpoints never aggregate the
+    experience table. rebuild() recomputes everything from scratch.
+    
+    Attributes:
+        company_name (str): Company name, exactly as written on experiences
+        experience_count (int): Number of experiences
+        easy_count / medium_count / hard_count (int): Experiences per difficulty
+            (rows with any other difficulty only count towards experience_count)
+        offer_count (int): Experiences that ended with an offer
+        timeline_days_sum (int): Sum of application-to-decision days
+        timeline_histogram (str): JSON object mapping days -> experiences,
+            with everything above MAX_TIMELINE_DAYS counted at that value
+    """
+    
+    __tablename__ = 'company_stats'
+    
+    # Histogram resolution: one bucket per day up to this many days
+    MAX_TIMELINE_DAYS = 365
+    
+    DIFFICULTY_COLUMNS = {'Easy': 'easy_count', 'Medium': 'medium_count', 'Hard': 'hard_count'}
+    
+    # Columns
+    company_name = db.Column(db.String(200), primary_key=True)
+    experience_count = db.Column(db.Integer, nullable=False, default=0, index=True)
+    easy_count = db.Column(db.Integer, nullable=False, default=0)
+    medium_count = db.Column(db.Integer, nullable=False, default=0)
+    hard_count = db.Column(db.Integer, nullable=False, default=0)
+    offer_count = db.Column(db.Integer, nullable=False, default=0)
+    timeline_days_sum = db.Column(db.Integer, nullable=False, default=0)
+    timeline_histogram = db.Column(db.Text, nullable=False, default='{}')
+    
+    @staticmethod
+    def change(experience, sign):
+        """
+        Describe an experience being added to or removed from the stats
+        
+        Args:
+            experience: Experience, projected row or namespace with the
+                company_name, difficulty, offer_received, application_date
+                and final_decision_date attributes
+            sign (int): 1 when the row is added, -1 when it is removed
+        
+        Returns:
+            tuple: Change to pass to record()
+        """
+        days = (experience.final_decision_date - experience.application_date).days
+        return (experience.company_name, experience.difficulty,
+                bool(experience.offer_received), days, sign)
+    
+    @classmethod
+    def record(cls, changes, connection=None):
+        """
+        Apply row changes in the current transaction
+        Call after the experience write has been flushed (so the transaction
+        already holds the write lock) and before committing it
+        
+        Args:
+            changes (list): Tuples built by change()
+            connection: Core connection to use instead of the ORM session
+        """
+        executor = connection if connection is not None else db.session
+        deltas = cls._aggregate(changes)
+        if not deltas:
+            return
+        
+        table = cls.__table__
+        rows = executor.execute(
+            db.select(table).where(table.c.company_name.in_(list(deltas))).with_for_update()
+        ).mappings().all()
+        current = {row['company_name']: dict(row) for row in rows}
+        
+        for company_name, delta in deltas.items():
+            row = current.get(company_name)
+            if row is None:
+                row = cls._empty_row(company_name)
+            cls._merge(row, delta)
+            
+            if row['experience_count'] <= 0:
+                if company_name in current:
+                    executor.execute(table.delete().where(table.c.company_name == company_name))
+            elif company_name in current:
+                executor.execute(
+                    table.update().where(table.c.company_name == company_name).values(**row)
+                )
+            else:
+                executor.execute(table.insert().values(**row))
+    
+    @classmethod
+    def rebuild(cls, connection):
+        """
+        Recompute every company's stats from the experience table
+        
+        Args:
+            connection: Core connection (the caller commits)
+        
+        Returns:
+            int: Number of companies
+        """
+        source = Experience.__table__
+        result = connection.execution_options(yield_per=10000).execute(
+            db.select(
+                source.c.company_name, source.c.difficulty, source.c.offer_received,
+                source.c.application_date, source.c.final_decision_date
+            )
+        )
+        
+        rows = {}
+        for partition in result.partitions():
+            for company_name, delta in cls._aggregate(
+                cls.change(experience, 1) for experience in partition
+            ).items():
+                row = rows.get(company_name)
+                if row is None:
+                    row = rows[company_name] = cls._empty_row(company_name)
+                cls._merge(row, delta)
+        
+        connection.execute(cls.__table__.delete())
+        if rows:
+            connection.execute(cls.__table__.insert(), list(rows.values()))
+        return len(rows)
+    
+    @classmethod
+    def to_dict(cls, row):
+        """
+        Convert a stats row to the API representation
+        
+        Args:
+            row: Mapping with the company_stats columns
+        
+        Returns:
+            dict: Counts, offer rate, difficulty mix and timeline percentiles
+        """
+        count = row['experience_count']
+        histogram = {int(days): n for days, n in json.loads(row['timeline_histogram']).items()}
+        
+        return {
+            'company_name': row['company_name'],
+            'experience_count': count,
+            'offer_count': row['offer_count'],
+            'offer_rate': round(row['offer_count'] / count, 4) if count else None,
+            'difficulty': {
+                difficulty: row[column] for difficulty, column in cls.DIFFICULTY_COLUMNS.items()
+            },
+            'timeline_days': {
+                'mean': round(row['timeline_days_sum'] / count, 1) if count else None,
+                'median': cls._percentile(histogram, count, 0.5),
+                'p90': cls._percentile(histogram, count, 0.9)
+            }
+        }
+    
+    @classmethod
+    def _aggregate(cls, changes):
+        """
+        Combine row changes per company
+        Encapsulation: Private method
+        
+        Returns:
+            dict: Company name -> counter deltas and histogram delta
+        """
+        deltas = defaultdict(lambda: {'counts': Counter(), 'histogram': Counter()})
+        for company_name, difficulty, offer_received, days, sign in changes:
+            delta = deltas[company_name]
+            counts = delta['counts']
+            counts['experience_count'] += sign
+            # Difficulties outside DIFFICULTY_COLUMNS (e.g. legacy or
+            # hand-edited rows) have no bucket
+            column = cls.DIFFICULTY_COLUMNS.get(difficulty)
+            if column is not None:
+                counts[column] += sign
+            counts['offer_count'] += sign if offer_received else 0
+            counts['timeline_days_sum'] += sign * days
+            delta['histogram'][min(days, cls.MAX_TIMELINE_DAYS)] += sign
+        return deltas
+    
+    @staticmethod
+    def _empty_row(company_name):
+        """
+        Column values of a company without experiences
+        Encapsulation: Private method
+        """
+        return {
+            'company_name': company_name,
+            'experience_count': 0,
+            'easy_count': 0,
+            'medium_count': 0,
+            'hard_count': 0,
+            'offer_count': 0,
+            'timeline_days_sum': 0,
+            'timeline_histogram': '{}'
+        }
+    
+    @staticmethod
+    def _merge(row, delta):
+        """
+        Add a delta from _aggregate() to a row's column values
+        Encapsulation: Private method
+        """
+        for column, value in delta['counts'].items():
+            row[column] += value
+        
+        histogram = Counter({int(days): n for days, n in json.loads(row['timeline_histogram']).items()})
+        histogram.update(delta['histogram'])
+        row['timeline_histogram'] = json.dumps(
+            {str(days): n for days, n in sorted(histogram.items()) if n > 0},
+            separators=(',', ':')
+        )
+    
+    @staticmethod
+    def _percentile(histogram, count, fraction):
+        """
+        Nearest-rank percentile of the timeline histogram
+        Encapsulation: Private method
+        
+        Returns:
+            int or None: Days, or None without experiences
+        """
+        if not count:
+            return None
+        
+        rank = max(1, math.ceil(count * fraction))
+        seen = 0
+        for days in sorted(histogram):
+            seen += histogram[days]
+            if seen >= rank:
+                return days
+        return max(histogram)
+    
+    def __repr__(self):
+        """String representation of CompanyStats"""
+        return f'<CompanyStats {self.company_name}: {self.experience_count}>'
@@ -0,0 +1,66 @@
+"""
+Dataset Version Model
+Implements a shared change counter with OOP principles:
+- Single Responsibility: Tracks when experience data last changed
+- Encapsulation: Readers and writers never touch the row directly
+"""
+from models import db
+
+
+class DatasetVersion(db.Model):
+    """
+    Single-row table holding a counter bumped by every experience write
+    
+    The counter lives in the database (not in process memory) so every
+    worker sees the same value. It is bumped inside the writing transaction,
+    which makes it a cheap validator for cached list responses (ETags).
+    
+    Attributes:
+        id (int): Primary key (always ROW_ID)
+        version (int): Number of committed experience writes
+    """
+    
+    __tablename__ = 'dataset_version'
+    
+    ROW_ID = 1
+    
+    # Columns
+    id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    
+    @staticmethod
+    def current():
+        """
+        Get the current dataset version
+        
+        Returns:
+            int: Version number (0 before the first write)
+        """
+        version = db.session.query(DatasetVersion.version).filter(
+            DatasetVersion.id == DatasetVersion.ROW_ID
+        ).scalar()
+        return version or 0
+    
+    @staticmethod
+    def bump(connection=None):
+        """
+        Increment the version in the current transaction
+        Call before committing a write to experience data
+        
+        Args:
+            connection: Core connection to use instead of the ORM session
+        """
+        executor = connection if connection is not None else db.session
+        result = executor.execute(
+            db.update(DatasetVersion)
+            .where(DatasetVersion.id == DatasetVersion.ROW_ID)
+            .values(version=DatasetVersion.version + 1)
+        )
+        if result.rowcount == 0:
+            executor.execute(
+                db.insert(DatasetVersion).values(id=DatasetVersion.ROW_ID, version=1)
+            )
+    
+    def __repr__(self):
+        """String representation of DatasetVersion"""
+        return f'<DatasetVersion {self.version}>'
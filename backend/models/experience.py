@@ -5,9 +5,27 @@ Implements interview experience entity with OOP principles:
 - Encapsulation: Data validation and calculated fields
 """
 from models import db
+from models.user import User
 from datetime import datetime
 
 
+def _difficulty_rank_default(context):
+    """
+    Column default of difficulty_rank, derived from the inserted difficulty
+    Applies to ORM inserts as well as Core (batch and import) inserts
+    """
+    return Experience.rank_of(context.get_current_parameters().get('difficulty'))
+
+
+def _timeline_days_default(context):
+    """
+    Column default of timeline_days, derived from the inserted dates
+    Applies to ORM inserts as well as Core (batch and import) inserts
+    """
+    parameters = context.get_current_parameters()
+    return Experience.days_between(parameters['application_date'], parameters['final_decision_date'])
+
+
 class Experience(db.Model):
     """
     Experience model representing an interview experience
@@ -18,26 +36,50 @@ class Experience(db.Model):
         company_name (str): Company name
         experience_description (str): Detailed description
         difficulty (str): Interview difficulty (Easy/Medium/Hard)
+        difficulty_rank (int): Stored sort rank of difficulty (see DIFFICULTY_RANKS)
         offer_received (bool): Whether an offer was received
         application_date (date): Application submission date
         final_decision_date (date): Final decision date
+        timeline_days (int): Stored days from application to final decision
         user_id (int): Foreign key to User
         created_at (datetime): Timestamp of creation
+        updated_at (datetime): Timestamp of the last change
     """
     
     __tablename__ = 'experience'
     
+    # Sort rank of each difficulty level (Easy, Medium, Hard); anything else sorts last
+    DIFFICULTY_RANKS = {'Easy': 1, 'Medium': 2, 'Hard': 3}
+    UNKNOWN_DIFFICULTY_RANK = 4
+    
     # Columns
     id = db.Column(db.Integer, primary_key=True)
     job_title = db.Column(db.String(200), nullable=False)
-    company_name = db.Column(db.String(200), nullable=False, index=True)
+    company_name = db.Column(db.String(200), nullable=False)
     experience_description = db.Column(db.Text, nullable=False)
-    difficulty = db.Column(db.String(50), nullable=False, index=True)
+    difficulty = db.Column(db.String(50), nullable=False)
+    difficulty_rank = db.Column(db.Integer, nullable=False, default=_difficulty_rank_default)
     offer_received = db.Column(db.Boolean, nullable=False, default=False)
     application_date = db.Column(db.Date, nullable=False)
     final_decision_date = db.Column(db.Date, nullable=False)
+    timeline_days = db.Column(db.Integer, nullable=False, default=_timeline_days_default, index=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # Composite indexes for the list filter x sort combinations: equality
+    # filters first, then the sort column (rows within a key are in rowid
+    # order, which is the id tie-breaker), so no combination sorts in a
+    # temporary B-tree. `flask check-query-plans` verifies the plans.
+    __table_args__ = (
+        db.Index('ix_experience_difficulty_rank', 'difficulty_rank'),
+        db.Index('ix_experience_rank_created', 'difficulty_rank', 'created_at'),
+        db.Index('ix_experience_offer_created', 'offer_received', 'created_at'),
+        db.Index('ix_experience_rank_offer_created', 'difficulty_rank', 'offer_received', 'created_at'),
+        db.Index('ix_experience_offer_rank', 'offer_received', 'difficulty_rank'),
+        db.Index('ix_experience_company_created', 'company_name', 'created_at'),
+        db.Index('ix_experience_company_rank', 'company_name', 'difficulty_rank'),
+    )
     
     def __init__(self, job_title, company_name, experience_description, 
                  difficulty, offer_received, application_date, 
@@ -59,11 +101,40 @@ class Experience(db.Model):
         self.company_name = company_name
         self.experience_description = experience_description
         self.difficulty = difficulty
+        self.difficulty_rank = Experience.rank_of(difficulty)
         self.offer_received = offer_received
         self.application_date = application_date
         self.final_decision_date = final_decision_date
+        self.timeline_days = Experience.days_between(application_date, final_decision_date)
         self.user_id = user_id
     
+    @staticmethod
+    def rank_of(difficulty):
+        """
+        Get the stored sort rank of a difficulty level
+        
+        Args:
+            difficulty (str): Difficulty level
+            
+        Returns:
+            int: Rank (Easy < Medium < Hard < anything else)
+        """
+        return Experience.DIFFICULTY_RANKS.get(difficulty, Experience.UNKNOWN_DIFFICULTY_RANK)
+    
+    @staticmethod
+    def days_between(application_date, final_decision_date):
+        """
+        Get the number of days from application to final decision
+        
+        Args:
+            application_date (date): Application date
+            final_decision_date (date): Decision date
+            
+        Returns:
+            int: Number of days in the application timeline
+        """
+        return (final_decision_date - application_date).days
+    
     def calculate_timeline_days(self):
         """
         Calculate the number of days between application and final decision
@@ -72,14 +143,16 @@ class Experience(db.Model):
         Returns:
             int: Number of days in the application timeline
         """
-        delta = self.final_decision_date - self.application_date
-        return delta.days
+        return Experience.days_between(self.application_date, self.final_decision_date)
     
     def to_dict(self):
         """
         Convert experience object to dictionary
         Abstraction: Provides a clean interface for data access
         
+        Dates are returned as date/datetime objects; the application's
+        JSON provider encodes them as ISO 8601
+        
         Returns:
             dict: Experience data including calculated fields
         """
@@ -90,12 +163,81 @@ class Experience(db.Model):
             'experience_description': self.experience_description,
             'difficulty': self.difficulty,
             'offer_received': self.offer_received,
-            'application_date': self.application_date.isoformat(),
-            'final_decision_date': self.final_decision_date.isoformat(),
-            'application_timeline_days': self.calculate_timeline_days(),
+            'application_date': self.application_date,
+            'final_decision_date': self.final_decision_date,
+            'application_timeline_days': self.timeline_days,
             'user_id': self.user_id,
             'author_username': self.author.username,
-            'created_at': self.created_at.isoformat()
+            'created_at': self.created_at
+        }
+    
+    @staticmethod
+    def projection_columns():
+        """
+        Columns needed to render an experience without loading ORM objects
+        Used by list queries joined against User so the author username
+        comes back in the same row instead of a lazy load per item
+        
+        Returns:
+            tuple: Column expressions for a joined, column-projected query
+        """
+        return (
+            Experience.id,
+            Experience.job_title,
+            Experience.company_name,
+            Experience.experience_description,
+            Experience.difficulty,
+            Experience.difficulty_rank,
+            Experience.offer_received,
+            Experience.application_date,
+            Experience.final_decision_date,
+            Experience.timeline_days,
+            Experience.user_id,
+            User.username.label('author_username'),
+            Experience.created_at,
+            Experience.updated_at
+        )
+    
+    @staticmethod
+    def make_etag(experience_id, created_at, updated_at):
+        """
+        Build a strong entity tag for an experience without loading it
+        
+        Args:
+            experience_id (int): Experience ID
+            created_at (datetime): Creation stamp
+            updated_at (datetime): Last change stamp (None for old rows)
+            
+        Returns:
+            str: Entity tag value (without quotes)
+        """
+        stamp = updated_at or created_at
+        return f'e{experience_id}-{int(created_at.timestamp() * 1e6)}-{int(stamp.timestamp() * 1e6)}'
+    
+    @staticmethod
+    def row_to_dict(row):
+        """
+        Convert a projected row to the same dictionary as to_dict()
+        
+        Args:
+            row: Result row selected with projection_columns()
+            
+        Returns:
+            dict: Experience data including calculated fields
+        """
+        return {
+            'id': row.id,
+            'job_title': row.job_title,
+            'company_name': row.company_name,
+            'experience_description': row.experience_description,
+            'difficulty': row.difficulty,
+            'offer_received': row.offer_received,
+            'application_date': row.application_date,
+            'final_decision_date': row.final_decision_date,
+            'application_timeline_days': row.timeline_days,
+            'user_id': row.user_id,
+            'author_username': row.author_username,
+            'created_at': row.created_at
         }
     
     def update_from_dict(self, data):
@@ -114,12 +256,15 @@ class Experience(db.Model):
             self.experience_description = data['experience_description']
         if 'difficulty' in data:
             self.difficulty = data['difficulty']
+            self.difficulty_rank = Experience.rank_of(self.difficulty)
         if 'offer_received' in data:
             self.offer_received = data['offer_received']
         if 'application_date' in data:
             self.application_date = data['application_date']
         if 'final_decision_date' in data:
             self.final_decision_date = data['final_decision_date']
+        if 'application_date' in data or 'final_decision_date' in data:
+            self.timeline_days = self.calculate_timeline_days()
     
     def __repr__(self):
         """String representation of Experience"""
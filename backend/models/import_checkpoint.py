@@ -0,0 +1,40 @@
+"""
+Import Checkpoint Model
+Implements resumable bulk imports with OOP principles:
+- Single Responsibility: Records how far an import file has been committed
+"""
+from models import db
+from datetime import datetime
+
+
+class ImportCheckpoint(db.Model):
+    """
+    ImportCheckpoint model representing the progress of one import file
+    
+    Updated in the same transaction as the rows it counts, so after a crash
+    the import resumes exactly after the last committed transaction.
+    
+    Attributes:
+        source (str): Absolute path of the imported file (primary key)
+        fingerprint (str): File size and modification time when started
+        records_done (int): Input records consumed by committed transactions
+        rows_imported (int): Experiences inserted so far
+        rows_rejected (int): Records rejected by validation so far
+        completed (bool): Whether the whole file has been imported
+        updated_at (datetime): Timestamp of the last committed transaction
+    """
+    
+    __tablename__ = 'import_checkpoint'
+    
+    # Columns
+    source = db.Column(db.String(1024), primary_key=True)
+    fingerprint = db.Column(db.String(64), nullable=False)
+    records_done = db.Column(db.Integer, nullable=False, default=0)
+    rows_imported = db.Column(db.Integer, nullable=False, default=0)
+    rows_rejected = db.Column(db.Integer, nullable=False, default=0)
+    completed = db.Column(db.Boolean, nullable=False, default=False)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    
+    def __repr__(self):
+        """String representation of ImportCheckpoint"""
+        return f'<ImportCheckpoint {self.source} at {self.records_done}>'
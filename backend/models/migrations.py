@@ -0,0 +1,178 @@
+"""
+Schema Migrations
+Brings databases created by older versions up to the current models.
+db.create_all() only creates missing tables, so columns added to existing
+tables are applied here. Every step is idempotent and safe to re-run.
+
+SQLite databases are stamped with SCHEMA_VERSION (in the user_version
+header field) once they are up to date, so startup can skip create_all()
+and the migration steps with a single PRAGMA read.
+"""
+from sqlalchemy import inspect, text
+from models.company_stats import CompanyStats
+from models.experience import Experience
+
+
+class SchemaMigrator:
+    """
+    Applies additive schema changes to existing databases
+    """
+    
+    # Bump whenever a model's table, index or a migration step changes, so
+    # stamped databases go through create_all() and upgrade() again
+    SCHEMA_VERSION = 1
+    
+    @classmethod
+    def upgrade(cls, engine):
+        """
+        Apply all pending migration steps and stamp the schema version
+        
+        Args:
+            engine: SQLAlchemy engine
+        """
+        with engine.begin() as conn:
+            for step in cls._steps():
+                step(conn)
+            if conn.dialect.name == 'sqlite':
+                conn.execute(text(f'PRAGMA user_version = {cls.SCHEMA_VERSION}'))
+    
+    @classmethod
+    def is_current(cls, engine):
+        """
+        Check whether the database is stamped with the current schema version
+        Only SQLite databases are stamped; others always report False
+        
+        Args:
+            engine: SQLAlchemy engine
+        
+        Returns:
+            bool: True if create_all() and upgrade() can be skipped
+        """
+        if engine.dialect.name != 'sqlite':
+            return False
+        with engine.connect() as conn:
+            return conn.execute(text('PRAGMA user_version')).scalar() == cls.SCHEMA_VERSION
+    
+    @classmethod
+    def _steps(cls):
+        """
+        Migration steps in the order they must run
+        Encapsulation: Private method
+        
+        Returns:
+            list: Callables taking a connection
+        """
+        return [
+            cls._add_experience_updated_at,
+            cls._populate_company_stats,
+            cls._add_experience_difficulty_rank,
+            cls._add_experience_timeline_days,
+            cls._sync_experience_indexes,
+            cls._analyze_experience,
+        ]
+    
+    @staticmethod
+    def _has_column(conn, table_name, column_name):
+        """
+        Check whether a table already has a column
+        Encapsulation: Private method
+        
+        Args:
+            conn: SQLAlchemy connection
+            table_name (str): Table name
+            column_name (str): Column name
+        
+        Returns:
+            bool: True if the column exists
+        """
+        columns = inspect(conn).get_columns(table_name)
+        return any(column['name'] == column_name for column in columns)
+    
+    @classmethod
+    def _add_experience_updated_at(cls, conn):
+        """
+        Add experience.updated_at (row change stamp used for ETags),
+        backfilled from created_at
+        """
+        if cls._has_column(conn, 'experience', 'updated_at'):
+            return
+        conn.execute(text('ALTER TABLE experience ADD COLUMN updated_at DATETIME'))
+        conn.execute(text('UPDATE experience SET updated_at = created_at'))
+    
+    @staticmethod
+    def _populate_company_stats(conn):
+        """
+        Fill company_stats for databases that had experiences before it
+        existed (it is never empty while experiences exist)
+        """
+        if conn.execute(text('SELECT 1 FROM company_stats LIMIT 1')).first() is not None:
+            return
+        if conn.execute(text('SELECT 1 FROM experience LIMIT 1')).first() is None:
+            return
+        CompanyStats.rebuild(conn)
+    
+    @classmethod
+    def _add_experience_difficulty_rank(cls, conn):
+        """
+        Add experience.difficulty_rank (stored, indexable difficulty sort
+        order), backfilled from difficulty
+        """
+        if cls._has_column(conn, 'experience', 'difficulty_rank'):
+            return
+        conn.execute(text(
+            'ALTER TABLE experience ADD COLUMN difficulty_rank INTEGER NOT NULL '
+            f'DEFAULT {Experience.UNKNOWN_DIFFICULTY_RANK}'
+        ))
+        for difficulty, rank in Experience.DIFFICULTY_RANKS.items():
+            conn.execute(
+                text('UPDATE experience SET difficulty_rank = :rank WHERE difficulty = :difficulty'),
+                {'rank': rank, 'difficulty': difficulty}
+            )
+    
+    @classmethod
+    def _add_experience_timeline_days(cls, conn):
+        """
+        Add experience.timeline_days (stored, indexable application to
+        decision days), backfilled from the two dates
+        """
+        if cls._has_column(conn, 'experience', 'timeline_days'):
+            return
+        conn.execute(text('ALTER TABLE experience ADD COLUMN timeline_days INTEGER NOT NULL DEFAULT 0'))
+        conn.execute(text(
+            'UPDATE experience SET timeline_days = '
+            'CAST(julianday(final_decision_date) - julianday(application_date) AS INTEGER)'
+        ))
+    
+    @staticmethod
+    def _sync_experience_indexes(conn):
+        """
+        Create the experience indexes declared on the model and drop the
+        single-column ones they replaced (db.create_all() only creates
+        indexes together with a new table)
+        """
+        for name in ('ix_experience_company_name', 'ix_experience_difficulty'):
+            conn.execute(text(f'DROP INDEX IF EXISTS {name}'))
+        for index in Experience.__table__.indexes:
+            index.create(conn, checkfirst=True)
+    
+    @staticmethod
+    def _analyze_experience(conn):
+        """
+        Collect SQLite planner statistics for the experience indexes once
+        rows exist. Without them SQLite cannot tell that a company filter is
+        far more selective than a difficulty or offer filter and may walk
+        the wrong composite index
+        """
+        if conn.dialect.name != 'sqlite':
+            return
+        if conn.execute(text('SELECT 1 FROM experience LIMIT 1')).first() is None:
+            return
+        
+        expected = {index.name for index in Experience.__table__.indexes}
+        analyzed = set()
+        if inspect(conn).has_table('sqlite_stat1'):
+            analyzed = set(conn.execute(
+                text("SELECT idx FROM sqlite_stat1 WHERE tbl = 'experience'")
+            ).scalars())
+        if not expected <= analyzed:
+            conn.execute(text('ANALYZE experience'))
@@ -0,0 +1,30 @@
+"""
+Revoked Token Model
+Implements the shared revocation list for signed tokens:
+- Single Responsibility: Records logged-out signed tokens until they expire
+"""
+from models import db
+
+
+class RevokedToken(db.Model):
+    """
+    RevokedToken model representing a signed token invalidated by logout
+    
+    Attributes:
+        id (int): Primary key, never reused, so workers can fetch new rows
+            incrementally with id > last_seen_id
+        token_id (str): Random ID embedded in the signed token
+        expires_at (datetime): Expiry of the token (row can be purged after)
+    """
+    
+    __tablename__ = 'revoked_token'
+    __table_args__ = {'sqlite_autoincrement': True}
+    
+    # Columns
+    id = db.Column(db.Integer, primary_key=True)
+    token_id = db.Column(db.String(32), nullable=False, unique=True)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+    
+    def __repr__(self):
+        """String representation of RevokedToken"""
+        return f'<RevokedToken {self.token_id}>'
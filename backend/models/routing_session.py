@@ -0,0 +1,83 @@
+"""
+Routing Session
+Sends read-only work to a separate read engine with OOP principles:
+- Single Responsibility: Only chooses the engine for a statement
+- Encapsulation: Services mark methods with @read_only; the session decides
+"""
+import contextvars
+import functools
+import inspect
+from flask import current_app, has_app_context
+from flask_sqlalchemy.session import Session
+
+# Set while a @read_only method runs
+_read_only = contextvars.ContextVar('read_only', default=False)
+
+
+class RoutingSession(Session):
+    """
+    db.session class that runs reads from @read_only methods on the read
+    engine of DatabaseProfile (when one is configured)
+    
+    Anything that may write (pending changes, flushes, or code outside a
+    @read_only method) keeps using the primary engine, and a session can
+    hold connections to both engines at once, so writes and reads can be
+    mixed freely within a request.
+    """
+    
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        """
+        Select the engine for a statement
+        
+        Returns:
+            Engine: The read engine for reads inside @read_only methods,
+                otherwise the engine chosen by Flask-SQLAlchemy
+        """
+        if bind is None and _read_only.get() and not self._flushing and has_app_context():
+            profile = current_app.extensions.get('database_profile')
+            if profile is not None and profile.read_engine is not None \
+                    and not (self.new or self.dirty or self.deleted):
+                return profile.read_engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def read_only(func):
+    """
+    Decorator to run a service method's queries on the read engine
+    Works on plain functions and on generator functions (the flag is set
+    each time the generator resumes)
+    
+    Args:
+        func: Function that only reads from the database
+    
+    Returns:
+        Decorated function
+    """
+    if inspect.isgeneratorfunction(func):
+        @functools.wraps(func)
+        def generator_wrapper(*args, **kwargs):
+            generator = func(*args, **kwargs)
+            try:
+                while True:
+                    token = _read_only.set(True)
+                    try:
+                        item = next(generator)
+                    except StopIteration:
+                        return
+                    finally:
+                        _read_only.reset(token)
+                    yield item
+            finally:
+                generator.close()
+        
+        return generator_wrapper
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        token = _read_only.set(True)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _read_only.reset(token)
+    
+    return wrapper
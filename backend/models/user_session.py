@@ -0,0 +1,32 @@
+"""
+User Session Model
+Implements persisted login sessions with OOP principles:
+- Encapsulation: Only token hashes are stored, never raw tokens
+- Single Responsibility: Session rows only
+"""
+from models import db
+from datetime import datetime
+
+
+class UserSession(db.Model):
+    """
+    UserSession model representing an issued login token
+    
+    Attributes:
+        token_hash (str): SHA-256 hex digest of the bearer token (primary key)
+        user_id (int): Foreign key to User
+        created_at (datetime): Timestamp of issue
+        expires_at (datetime): Timestamp after which the token is rejected
+    """
+    
+    __tablename__ = 'user_session'
+    
+    # Columns
+    token_hash = db.Column(db.String(64), primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), nullable=False, index=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+    
+    def __repr__(self):
+        """String representation of UserSession"""
+        return f'<UserSession user={self.user_id} expires={self.expires_at}>'
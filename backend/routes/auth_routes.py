@@ -6,6 +6,8 @@ Implements authentication endpoints with OOP principles:
 """
 from flask import Blueprint, request, jsonify
 from services.auth_service import AuthService
+from services.rate_limiter import RateLimiter
+from utils.decorators import rate_limit
 from utils.validators import Validator
 
 # Create blueprint
@@ -13,6 +15,8 @@ auth_bp = Blueprint('auth', __name__, url_prefix='/api/auth')
 
 
 @auth_bp.route('/register', methods=['POST'])
+@rate_limit('register_ip', RateLimiter.client_ip)
+@rate_limit('register_username', RateLimiter.request_username)
 def register():
     """
     Register a new user
@@ -48,6 +52,8 @@ def register():
 
 
 @auth_bp.route('/login', methods=['POST'])
+@rate_limit('login_ip', RateLimiter.client_ip)
+@rate_limit('login_username', RateLimiter.request_username)
 def login():
     """
     Login an existing user
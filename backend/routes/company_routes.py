@@ -0,0 +1,71 @@
+"""
+Company Routes
+Implements company endpoints with OOP principles:
+- Single Responsibility: Only handles company routes
+- Separation of Concerns: Business logic delegated to service layer
+"""
+from flask import Blueprint, request, jsonify
+from services.company_service import CompanyService
+
+# Create blueprint
+company_bp = Blueprint('company', __name__, url_prefix='/api/companies')
+
+
+@company_bp.route('/stats', methods=['GET'])
+def get_top_companies():
+    """
+    Get statistics of the companies with the most experiences
+    
+    Query Parameters:
+        top (int): Number of companies (default: 10, max: 100)
+    
+    Returns:
+        JSON response with a list of company statistics
+    """
+    top = request.args.get('top', type=int)
+    
+    # Delegate to service layer
+    result, status_code = CompanyService.get_top_companies(top)
+    
+    return jsonify(result), status_code
+
+
+@company_bp.route('/suggest', methods=['GET'])
+def suggest_companies():
+    """
+    Suggest company names starting with a prefix
+    
+    Query Parameters:
+        prefix (str): Case-insensitive name prefix (default: '', which
+            suggests the companies with the most experiences)
+        limit (int): Number of suggestions (default: 10, max: 50)
+    
+    Returns:
+        JSON response with company names and experience counts,
+        most experiences first
+    """
+    prefix = request.args.get('prefix', '')
+    limit = request.args.get('limit', type=int)
+    
+    # Delegate to service layer
+    result, status_code = CompanyService.suggest_companies(prefix, limit)
+    
+    return jsonify(result), status_code
+
+
+@company_bp.route('/<path:company_name>/stats', methods=['GET'])
+def get_company_stats(company_name):
+    """
+    Get statistics of one company
+    
+    Path Parameters:
+        company_name (str): Company name (exact, case-sensitive)
+    
+    Returns:
+        JSON response with offer rate, difficulty mix and
+        application-to-decision day percentiles
+    """
+    # Delegate to service layer
+    result, status_code = CompanyService.get_company_stats(company_name)
+    
+    return jsonify(result), status_code
@@ -4,9 +4,11 @@ Implements experience endpoints with OOP principles:
 - Single Responsibility: Only handles experience routes
 - Separation of Concerns: Business logic delegated to service layer
 """
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify, stream_with_context
 from services.experience_service import ExperienceService
-from utils.decorators import require_auth
+from services.rate_limiter import RateLimiter
+from utils.decorators import require_auth, rate_limit
+from utils.http_cache import ConditionalResponse
 
 # Create blueprint
 experience_bp = Blueprint('experience', __name__, url_prefix='/api/experiences')
@@ -22,31 +24,95 @@ def get_experiences():
         per_page (int): Items per page (default: 10)
         difficulty (str): Filter by difficulty (Easy/Medium/Hard)
         offer_received (str): Filter by offer status (true/false)
+        company (str): Filter by exact company name
+        min_timeline_days (int): Filter by at least this many days from
+            application to final decision
+        max_timeline_days (int): Filter by at most this many days
         search (str): Search term for job title, company, or description
-        sort_by (str): Sort order (date_desc/date_asc/difficulty)
+        sort_by (str): Sort order (date_desc/date_asc/difficulty/
+            timeline_asc/timeline_desc/relevance)
+        cursor (str): Opaque keyset cursor; pass an empty value for the first
+            page, then the previous response's next_cursor (page is ignored)
+    
+    Headers:
+        If-None-Match: ETag of a previous response (optional)
     
     Returns:
-        JSON response with experiences and pagination info
+        JSON response with experiences and pagination info,
+        or 304 Not Modified if no experience changed since the ETag
     """
     # Get query parameters
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 10, type=int)
     difficulty = request.args.get('difficulty')
     offer_received = request.args.get('offer_received')
+    company = request.args.get('company')
+    min_timeline_days = request.args.get('min_timeline_days', type=int)
+    max_timeline_days = request.args.get('max_timeline_days', type=int)
     search = request.args.get('search')
     sort_by = request.args.get('sort_by', 'date_desc')
+    cursor = request.args.get('cursor')
+    
+    params = {
+        'page': page,
+        'per_page': per_page,
+        'difficulty': difficulty,
+        'offer_received': offer_received,
+        'search': search,
+        'sort_by': sort_by,
+        'cursor': cursor,
+        'company': company,
+        'min_timeline_days': min_timeline_days,
+        'max_timeline_days': max_timeline_days
+    }
+    
+    # Answer conditional requests before running the list query
+    etag = ExperienceService.get_experiences_etag(**params)
+    if ConditionalResponse.is_not_modified(etag):
+        return ConditionalResponse.not_modified(etag)
     
     # Delegate to service layer
-    result, status_code = ExperienceService.get_experiences(
-        page=page,
-        per_page=per_page,
-        difficulty=difficulty,
-        offer_received=offer_received,
-        search=search,
-        sort_by=sort_by
+    result, status_code = ExperienceService.get_experiences(**params)
+    
+    return ConditionalResponse.json(result, status_code, etag)
+
+
+@experience_bp.route('/export', methods=['GET'])
+@require_auth
+@rate_limit('export_ip', RateLimiter.client_ip)
+def export_experiences(user_id):
+    """
+    Stream all matching experiences as NDJSON (one JSON object per line)
+    Requires authentication
+    
+    Headers:
+        Authorization: Bearer <token>
+    
+    Query Parameters:
+        difficulty (str): Filter by difficulty
+        offer_received (str): Filter by offer status (true/false)
+        company (str): Filter by exact company name
+        min_timeline_days (int): Minimum days from application to decision
+        max_timeline_days (int): Maximum days from application to decision
+        search (str): Search term
+    
+    Returns:
+        Streamed application/x-ndjson response, ordered by experience ID
+    """
+    lines = ExperienceService.export_experiences(
+        difficulty=request.args.get('difficulty'),
+        offer_received=request.args.get('offer_received'),
+        search=request.args.get('search'),
+        company=request.args.get('company'),
+        min_timeline_days=request.args.get('min_timeline_days', type=int),
+        max_timeline_days=request.args.get('max_timeline_days', type=int)
     )
     
-    return jsonify(result), status_code
+    return Response(
+        stream_with_context(lines),
+        mimetype='application/x-ndjson',
+        headers={'Content-Disposition': 'attachment; filename=experiences.ndjson'}
+    )
 
 
 @experience_bp.route('/<int:experience_id>', methods=['GET'])
@@ -57,17 +123,26 @@ def get_experience(experience_id):
     Path Parameters:
         experience_id (int): Experience ID
     
+    Headers:
+        If-None-Match: ETag of a previous response (optional)
+    
     Returns:
-        JSON response with experience data
+        JSON response with experience data,
+        or 304 Not Modified if the experience is unchanged since the ETag
     """
+    etag = ExperienceService.get_experience_etag(experience_id)
+    if ConditionalResponse.is_not_modified(etag):
+        return ConditionalResponse.not_modified(etag)
+    
     # Delegate to service layer
-    result, status_code = ExperienceService.get_experience_by_id(experience_id)
+    result, status_code = ExperienceService.get_experience_by_id(experience_id, etag)
     
-    return jsonify(result), status_code
+    return ConditionalResponse.json(result, status_code, etag)
 
 
 @experience_bp.route('', methods=['POST'])
 @require_auth
+@rate_limit('write_ip', RateLimiter.client_ip)
 def create_experience(user_id):
     """
     Create a new experience
@@ -101,8 +176,43 @@ def create_experience(user_id):
     return jsonify(result), status_code
 
 
+@experience_bp.route('/batch', methods=['POST'])
+@require_auth
+@rate_limit('write_ip', RateLimiter.client_ip)
+def create_experiences(user_id):
+    """
+    Create several experiences in one request and one transaction
+    Requires authentication
+    
+    Headers:
+        Authorization: Bearer <token>
+    
+    Request Body:
+        {
+            "experiences": [ <same object as POST /api/experiences>, ... ]
+        }
+    
+    Returns:
+        JSON response with a result per item, in request order
+        (201 all created, 207 some created, 400 none created)
+    """
+    data = request.get_json()
+    
+    if not data:
+        return jsonify({'error': 'No data provided'}), 400
+    
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be an object with an experiences list'}), 400
+    
+    # Delegate to service layer (user_id injected by decorator)
+    result, status_code = ExperienceService.create_experiences(user_id, data.get('experiences'))
+    
+    return jsonify(result), status_code
+
+
 @experience_bp.route('/<int:experience_id>', methods=['PUT'])
 @require_auth
+@rate_limit('write_ip', RateLimiter.client_ip)
 def update_experience(user_id, experience_id):
     """
     Update an existing experience
@@ -135,6 +245,7 @@ def update_experience(user_id, experience_id):
 
 @experience_bp.route('/<int:experience_id>', methods=['DELETE'])
 @require_auth
+@rate_limit('write_ip', RateLimiter.client_ip)
 def delete_experience(user_id, experience_id):
     """
     Delete an experience
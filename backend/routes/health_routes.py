@@ -1,20 +1,82 @@
 """
 Health Check Routes
-Implements health check endpoint for monitoring
+Implements liveness, readiness, cache and metrics endpoints for monitoring
 """
-from flask import Blueprint, jsonify
+from flask import Blueprint, Response, jsonify
+from services.auth_service import AuthService
+from services.response_cache import ResponseCache
+from services.fragment_cache import FragmentCache
+from services.request_metrics import RequestMetrics
+from services.health_checker import HealthChecker
+from utils.startup_timer import StartupTimer
 
 # Create blueprint
 health_bp = Blueprint('health', __name__, url_prefix='/api')
 
 
 @health_bp.route('/health', methods=['GET'])
+@health_bp.route('/health/live', methods=['GET'])
 def health_check():
     """
-    Health check endpoint
+    Liveness endpoint: the process is up and serving requests
+    Touches no dependency, so a failing database never restarts workers
     
     Returns:
         JSON response with status
     """
     return jsonify({'status': 'healthy'}), 200
 
+
+@health_bp.route('/health/ready', methods=['GET'])
+def readiness_check():
+    """
+    Readiness endpoint: the worker can serve traffic
+    
+    Returns:
+        JSON response with the probe results, connection pool occupancy and
+        active session count (200 when ready, 503 otherwise)
+    """
+    result = HealthChecker.current().readiness()
+    result['status'] = 'ready' if result['ready'] else 'unavailable'
+    return jsonify(result), 200 if result['ready'] else 503
+
+
+@health_bp.route('/cache', methods=['GET'])
+def cache_stats():
+    """
+    Response and fragment cache statistics endpoint
+    
+    Returns:
+        JSON response with hit/miss/eviction counters per cache
+    """
+    cache = ResponseCache.current()
+    fragments = FragmentCache.current()
+    
+    stats = {'enabled': cache is not None}
+    if cache is not None:
+        stats.update(cache.stats())
+    stats['fragments'] = fragments.stats() if fragments is not None else None
+    
+    return jsonify(stats), 200
+
+
+@health_bp.route('/metrics', methods=['GET'])
+def metrics():
+    """
+    Prometheus metrics endpoint
+    
+    Returns:
+        Request counts, latency histograms, in-flight requests, connection
+        pool statistics, the active session count and the startup phase
+        timings in the Prometheus text format (404 when METRICS_ENABLED is off)
+    """
+    request_metrics = RequestMetrics.current()
+    if request_metrics is None:
+        return jsonify({'error': 'Metrics are disabled'}), 404
+    
+    timer = StartupTimer.current()
+    body = request_metrics.render(
+        AuthService.get_active_sessions_count(),
+        timer.phases if timer is not None else None
+    )
+    return Response(body, content_type=RequestMetrics.CONTENT_TYPE)
@@ -4,6 +4,23 @@ Exports all service classes
 """
 from services.auth_service import AuthService
 from services.experience_service import ExperienceService
+from services.company_service import CompanyService
+from services.company_index import CompanyIndex
+from services.database_profile import DatabaseProfile
+from services.search_index import SearchIndex
+from services.response_cache import ResponseCache
+from services.fragment_cache import FragmentCache
+from services.session_store import SessionStore
+from services.signed_token_store import SignedTokenStore
+from services.rate_limiter import RateLimiter
+from services.request_metrics import RequestMetrics
+from services.query_instrumentation import QueryInstrumentation
+from services.dataset_generator import DatasetGenerator
 
-__all__ = ['AuthService', 'ExperienceService']
+__all__ = [
+    'AuthService', 'ExperienceService', 'CompanyService', 'SearchIndex',
+    'ResponseCache', 'FragmentCache', 'SessionStore', 'SignedTokenStore',
+    'RateLimiter', 'CompanyIndex', 'DatabaseProfile', 'RequestMetrics',
+    'QueryInstrumentation', 'DatasetGenerator'
+]
 
@@ -4,20 +4,19 @@ Implements authentication business logic with OOP principles:
 - Single Responsibility: Handles authentication only
 - Encapsulation: Session management is hidden
 """
-import secrets
 from models import db, User
 from utils.validators import Validator
+from services.session_store import SessionStore
 
 
 class AuthService:
     """
     Service class for handling authentication operations
-    Implements Singleton pattern for session storage
+    Tokens are issued and checked by the application's token store:
+    a SessionStore (see session_store.py) or, with AUTH_TOKEN_MODE='signed',
+    a SignedTokenStore (see signed_token_store.py)
     """
     
-    # Class-level session storage (Singleton pattern)
-    _active_sessions = {}
-    
     @classmethod
     def register_user(cls, username, password):
         """
@@ -93,7 +92,7 @@ class AuthService:
         Returns:
             tuple: (success, message, status_code)
         """
-        cls._active_sessions.pop(token, None)
+        SessionStore.current().revoke(token)
         return True, 'Logout successful', 200
     
     @classmethod
@@ -144,9 +143,7 @@ class AuthService:
         Returns:
             str: Session token
         """
-        token = secrets.token_hex(32)
-        cls._active_sessions[token] = user_id
-        return token
+        return SessionStore.current().issue(user_id)
     
     @classmethod
     def _get_user_id_from_token(cls, token):
@@ -158,9 +155,9 @@ class AuthService:
             token (str): Session token
             
         Returns:
-            int or None: User ID if found
+            int or None: User ID if found and not expired
         """
-        return cls._active_sessions.get(token)
+        return SessionStore.current().get_user_id(token)
     
     @classmethod
     def get_active_sessions_count(cls):
@@ -168,7 +165,7 @@ class AuthService:
         Get number of active sessions (for monitoring)
         
         Returns:
-            int: Number of active sessions
+            int or None: Number of active sessions (None in signed token mode)
         """
-        return len(cls._active_sessions)
+        return SessionStore.current().count()
 
@@ -0,0 +1,118 @@
+"""
+Company Index Service
+Implements company name autocomplete with OOP principles:
+- Single Responsibility: Keeps the in-process company name index current
+- Encapsulation: Loading and refreshing are hidden behind suggest()
+"""
+import threading
+import time
+from flask import current_app, has_app_context
+from models import db, CompanyStats
+from services.database_profile import DatabaseProfile
+from utils.prefix_index import PrefixIndex
+
+
+class CompanyIndex:
+    """
+    Service class holding a PrefixIndex of company names and experience counts
+    
+    Loaded from the company_stats summary at startup and updated by this
+    worker's writes after they commit. Writes made by other workers or by
+    the import command are picked up by reloading the summary once the
+    index is older than COMPANY_INDEX_REFRESH seconds. Loads and applied
+    changes hold the same lock, so a change committed while the summary
+    is being read is applied after the reload instead of being lost.
+    """
+    
+    EXTENSION_KEY = 'company_index'
+    
+    def __init__(self, refresh_interval):
+        """
+        Initialize an empty index
+        
+        Args:
+            refresh_interval (float): Seconds before the index is reloaded
+                (0 disables reloading)
+        """
+        self.index = PrefixIndex()
+        self.refresh_interval = refresh_interval
+        self.loaded_at = None
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def init_app(cls, app):
+        """
+        Attach an index to the application
+        
+        Args:
+            app (Flask): Flask application instance
+        """
+        app.extensions[cls.EXTENSION_KEY] = cls(app.config['COMPANY_INDEX_REFRESH'])
+    
+    @classmethod
+    def current(cls):
+        """
+        Get the index of the current application
+        
+        Returns:
+            CompanyIndex or None: None outside an app context
+        """
+        if not has_app_context():
+            return None
+        return current_app.extensions.get(cls.EXTENSION_KEY)
+    
+    def load(self):
+        """Reload every company and count from the company_stats summary"""
+        with self._lock:
+            self._load()
+    
+    def apply(self, changes):
+        """
+        Apply committed experience changes to the index
+        
+        Args:
+            changes (list): Tuples built by CompanyStats.change()
+        """
+        with self._lock:
+            for change in changes:
+                company_name, sign = change[0], change[-1]
+                self.index.add(company_name, sign)
+    
+    def suggest(self, prefix, limit):
+        """
+        Suggest company names starting with a prefix
+        
+        Args:
+            prefix (str): Case-insensitive prefix
+            limit (int): Maximum number of suggestions
+        
+        Returns:
+            list: (company_name, experience_count) tuples, most experiences first
+        """
+        if self._is_stale():
+            with self._lock:
+                if self._is_stale():
+                    self._load()
+        return self.index.search(prefix, limit)
+    
+    def _load(self):
+        """
+        Read the summary and replace the index (caller holds self._lock)
+        Encapsulation: Private method
+        """
+        table = CompanyStats.__table__
+        with DatabaseProfile.reader().connect() as conn:
+            counts = dict(conn.execute(
+                db.select(table.c.company_name, table.c.experience_count)
+            ).all())
+        self.index.replace(counts)
+        self.loaded_at = time.monotonic()
+    
+    def _is_stale(self):
+        """
+        Check whether the index must be (re)loaded
+        Encapsulation: Private method
+        """
+        if self.loaded_at is None:
+            return True
+        return bool(self.refresh_interval) and time.monotonic() - self.loaded_at > self.refresh_interval
@@ -0,0 +1,96 @@
+"""
+Company Service
+Implements per-company read endpoints with OOP principles:
+- Single Responsibility: Serves company aggregates
+- Encapsulation: Reads the CompanyStats summary or the in-process
+  CompanyIndex, never the experience table
+"""
+from models import db, CompanyStats, read_only
+from services.company_index import CompanyIndex
+from config import Config
+
+
+class CompanyService:
+    """
+    Service class for company statistics
+    """
+    
+    @staticmethod
+    @read_only
+    def get_company_stats(company_name):
+        """
+        Get the statistics of one company
+        
+        Args:
+            company_name (str): Company name (exact match)
+            
+        Returns:
+            tuple: (result_dict, status_code)
+        """
+        table = CompanyStats.__table__
+        row = db.session.execute(
+            db.select(table).where(table.c.company_name == company_name)
+        ).mappings().first()
+        
+        if row is None:
+            return {'error': 'Company not found'}, 404
+        
+        return {'company': CompanyStats.to_dict(row)}, 200
+    
+    @staticmethod
+    @read_only
+    def get_top_companies(top=None):
+        """
+        Get the statistics of the companies with the most experiences
+        
+        Args:
+            top (int): Number of companies
+            
+        Returns:
+            tuple: (result_dict, status_code)
+        """
+        if top is None:
+            top = Config.DEFAULT_TOP_COMPANIES
+        if top < 1:
+            return {'error': 'top must be >= 1'}, 400
+        if top > Config.MAX_TOP_COMPANIES:
+            return {'error': f'top must be <= {Config.MAX_TOP_COMPANIES}'}, 400
+        
+        table = CompanyStats.__table__
+        rows = db.session.execute(
+            db.select(table)
+            .order_by(table.c.experience_count.desc(), table.c.company_name)
+            .limit(top)
+        ).mappings().all()
+        
+        return {'companies': [CompanyStats.to_dict(row) for row in rows]}, 200
+    
+    @staticmethod
+    def suggest_companies(prefix='', limit=None):
+        """
+        Suggest company names for autocomplete
+        Answered from the in-process CompanyIndex without a database query
+        
+        Args:
+            prefix (str): Case-insensitive name prefix ('' suggests the
+                companies with the most experiences)
+            limit (int): Maximum number of suggestions
+            
+        Returns:
+            tuple: (result_dict, status_code)
+        """
+        if limit is None:
+            limit = Config.DEFAULT_SUGGESTIONS
+        if limit < 1:
+            return {'error': 'limit must be >= 1'}, 400
+        if limit > Config.MAX_SUGGESTIONS:
+            return {'error': f'limit must be <= {Config.MAX_SUGGESTIONS}'}, 400
+        
+        suggestions = CompanyIndex.current().suggest(prefix.strip(), limit)
+        
+        return {
+            'suggestions': [
+                {'company_name': company_name, 'experience_count': count}
+                for company_name, count in suggestions
+            ]
+        }, 200
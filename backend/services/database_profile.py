@@ -0,0 +1,198 @@
+"""
+Database Profile Service
+Applies the SQLite connection profile with OOP principles:
+- Single Responsibility: Configures connections and the read-only engine
+- Encapsulation: Pragmas are applied through engine connect events
+"""
+from flask import current_app, has_app_context
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import QueuePool
+from models import db
+
+
+class DatabaseProfile:
+    """
+    Service class configuring the SQLite engines of an application
+    
+    Every new connection of the primary engine runs SQLITE_PRAGMAS (WAL
+    journaling, synchronous level, memory map, page cache, busy timeout).
+    With SQLITE_READ_ENGINE_ENABLED, a second pooled engine opens the same
+    file read-only (mode=ro, query_only); RoutingSession sends the queries
+    of @read_only service methods to it so GETs never queue behind the
+    primary pool. Non-SQLite and in-memory databases are left untouched.
+    """
+    
+    EXTENSION_KEY = 'database_profile'
+    
+    # Pragmas that change the database file and cannot run on a read-only connection
+    WRITE_PRAGMAS = ('journal_mode',)
+    
+    def __init__(self, pragmas, read_engine=None):
+        """
+        Initialize the profile
+        
+        Args:
+            pragmas (dict): Pragma name -> value applied to every connection
+            read_engine (Engine): Read-only engine, or None to read from the primary
+        """
+        self.pragmas = pragmas
+        self.read_engine = read_engine
+    
+    @classmethod
+    def init_app(cls, app):
+        """
+        Configure the engines of the application
+        
+        Args:
+            app (Flask): Flask application instance
+        """
+        with app.app_context():
+            engine = db.engine
+        
+        if engine.dialect.name != 'sqlite' or cls._is_memory(engine.url):
+            app.extensions[cls.EXTENSION_KEY] = cls({})
+            return
+        
+        profile = cls(dict(app.config['SQLITE_PRAGMAS']))
+        profile.apply(engine)
+        
+        if app.config['SQLITE_READ_ENGINE_ENABLED']:
+            profile.read_engine = create_engine(
+                cls.read_only_url(engine.url),
+                poolclass=QueuePool,
+                pool_size=app.config['SQLITE_READ_POOL_SIZE'],
+                max_overflow=app.config['SQLITE_READ_POOL_OVERFLOW'],
+                connect_args={'check_same_thread': False}
+            )
+            profile.apply(profile.read_engine, read_only=True)
+        
+        app.extensions[cls.EXTENSION_KEY] = profile
+    
+    @classmethod
+    def current(cls):
+        """
+        Get the profile of the current application
+        
+        Returns:
+            DatabaseProfile or None: None outside an app context
+        """
+        if not has_app_context():
+            return None
+        return current_app.extensions.get(cls.EXTENSION_KEY)
+    
+    @classmethod
+    def reader(cls):
+        """
+        Get the engine to use for plain (non-ORM) reads
+        
+        Returns:
+            Engine: The read engine when configured, otherwise the primary
+        """
+        profile = cls.current()
+        if profile is not None and profile.read_engine is not None:
+            return profile.read_engine
+        return db.engine
+    
+    @classmethod
+    def engines(cls):
+        """
+        Get every engine of the current application by role
+        
+        Returns:
+            dict: 'primary' (and 'read' when configured) -> Engine
+        """
+        engines = {'primary': db.engine}
+        profile = cls.current()
+        if profile is not None and profile.read_engine is not None:
+            engines['read'] = profile.read_engine
+        return engines
+    
+    @staticmethod
+    def pool_status(engine):
+        """
+        Get the occupancy of an engine's connection pool
+        
+        Args:
+            engine (Engine): Engine to inspect
+        
+        Returns:
+            dict or None: checked_out/idle/overflow/size counts, or None for
+                pools that do not track occupancy (in-memory SQLite pools)
+        """
+        pool = engine.pool
+        if not hasattr(pool, 'checkedout'):
+            return None
+        return {
+            'checked_out': pool.checkedout(),
+            'idle': pool.checkedin(),
+            'overflow': max(pool.overflow(), 0),
+            'size': pool.size()
+        }
+    
+    def apply(self, engine, read_only=False):
+        """
+        Run the profile's pragmas on every new connection of an engine
+        
+        Args:
+            engine (Engine): Engine to configure (for an AsyncEngine, pass
+                its sync_engine)
+            read_only (bool): Skip pragmas that change the file and refuse
+                writes on the connection
+        """
+        pragmas = self.pragmas
+        if read_only:
+            pragmas = {name: value for name, value in pragmas.items()
+                       if name not in self.WRITE_PRAGMAS}
+        event.listen(engine, 'connect', self._pragma_listener(pragmas, query_only=read_only))
+    
+    @classmethod
+    def read_only_url(cls, url, driver='sqlite'):
+        """
+        Build the URL opening a SQLite database file read-only
+        
+        Args:
+            url (URL): URL of the primary SQLite engine
+            driver (str): Dialect and driver of the new URL
+                (e.g. 'sqlite+aiosqlite')
+        
+        Returns:
+            str: URL with mode=ro, or None for non-SQLite and in-memory databases
+        """
+        if url.get_backend_name() != 'sqlite' or cls._is_memory(url):
+            return None
+        return f'{driver}:///file:{url.database}?mode=ro&uri=true'
+    
+    @staticmethod
+    def _pragma_listener(pragmas, query_only=False):
+        """
+        Build a connect event listener running the pragmas
+        Encapsulation: Private method
+        
+        Args:
+            pragmas (dict): Pragma name -> value
+            query_only (bool): Also refuse writes on the connection
+        
+        Returns:
+            callable: Listener for the engine 'connect' event
+        """
+        statements = [f'PRAGMA {name} = {value}' for name, value in pragmas.items()]
+        if query_only:
+            statements.append('PRAGMA query_only = ON')
+        
+        def set_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for statement in statements:
+                    cursor.execute(statement)
+            finally:
+                cursor.close()
+        
+        return set_pragmas
+    
+    @staticmethod
+    def _is_memory(url):
+        """
+        Check whether a SQLite URL is an in-memory database
+        Encapsulation: Private method
+        """
+        return url.database in (None, '', ':memory:') or 'mode=memory' in str(url)
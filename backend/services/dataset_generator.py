@@ -0,0 +1,407 @@
+"""
+Dataset Generator Service
+Builds large synthetic datasets with OOP principles:
+- Single Responsibility: Generates users and experiences for load testing
+- Encapsulation: Text pools, distributions and bulk loading are internal
+"""
+import math
+import random
+import time
+from collections import Counter
+from datetime import date, timedelta
+from itertools import accumulate
+from werkzeug.security import generate_password_hash
+from models import db, Experience, User, CompanyStats, DatasetVersion
+from services.search_index import SearchIndex
+
+
+class DatasetGenerator:
+    """
+    Writes a deterministic synthetic dataset into an empty SQLite database
+    
+    The same seed and options always produce the same rows. Company
+    popularity follows a Zipf distribution (a few companies get most of the
+    experiences), authors are mildly skewed the same way, description
+    lengths are log-normal (a few sentences typically, with a long tail),
+    and created_at grows with the row ID like organically inserted data.
+    
+    Rows are inserted with plain executemany statements in one transaction
+    while the experience indexes and the full-text index are dropped; both
+    are rebuilt in one pass afterwards, followed by company_stats and the
+    planner statistics.
+    """
+    
+    DIFFICULTIES = ('Easy', 'Medium', 'Hard')
+    
+    # Username prefix of generated users (user_000001, ...)
+    USERNAME_FORMAT = 'user_{:06d}'
+    
+    COMPANY_PREFIXES = (
+        'Acme', 'Apex', 'Atlas', 'Aurora', 'Beacon', 'Blue', 'Bright', 'Cedar',
+        'Cloud', 'Coral', 'Crest', 'Delta', 'Echo', 'Ember', 'Falcon', 'Fusion',
+        'Granite', 'Harbor', 'Helix', 'Horizon', 'Iron', 'Juniper', 'Kite', 'Lumen',
+        'Maple', 'Meridian', 'Nimbus', 'Nova', 'Oak', 'Orbit', 'Pioneer', 'Pixel',
+        'Quantum', 'Quartz', 'Red', 'Ridge', 'Silver', 'Spark', 'Summit', 'Vertex'
+    )
+    COMPANY_MIDDLES = ('', 'Data', 'Cloud', 'Soft', 'Net', 'Health', 'Pay', 'Learn', 'Logic', 'Works')
+    COMPANY_SUFFIXES = (
+        'Labs', 'Systems', 'Technologies', 'Software', 'Inc', 'Group', 'AI',
+        'Analytics', 'Digital', 'Networks', 'Solutions', 'Robotics'
+    )
+    
+    LEVELS = ('', '', 'Junior ', 'Senior ', 'Staff ', 'Principal ', 'Lead ')
+    ROLES = (
+        'Software Engineer', 'Backend Engineer', 'Frontend Developer',
+        'Full Stack Developer', 'Data Scientist', 'Data Engineer',
+        'Machine Learning Engineer', 'DevOps Engineer', 'Site Reliability Engineer',
+        'Mobile Developer', 'QA Engineer', 'Security Engineer', 'Product Manager',
+        'Engineering Manager', 'Solutions Architect'
+    )
+    
+    SENTENCE_TEMPLATES = (
+        'Started with a {stage} that lasted about {minutes} minutes.',
+        'The {stage} focused on {topic} and {topic2}.',
+        'Then I had {count} {stage_plural} covering {topic}.',
+        'The interviewer asked me to {task} and then discuss {topic}.',
+        'There was a system design round where I had to {design}.',
+        'The behavioral round was about {behavior}.',
+        'Overall the process felt {feeling} and the interviewers were {manner}.',
+        'I heard back after {days} days, which felt {feeling}.',
+        'My advice is to practice {topic} and prepare stories about {behavior}.',
+        'The {stage} was {feeling}, mostly {topic} with some follow-up questions.',
+        'They used {tool} for the coding part, so practice without autocomplete.',
+        'Feedback from the recruiter was {manner} and arrived within {days} days.'
+    )
+    FILLS = {
+        'stage': ('recruiter call', 'phone screen', 'online assessment', 'take-home assignment',
+                  'coding round', 'onsite loop', 'virtual onsite', 'hiring manager chat',
+                  'pair programming session', 'team match call'),
+        'stage_plural': ('coding rounds', 'onsite interviews', 'technical screens',
+                         'pair programming sessions', 'design discussions'),
+        'topic': ('graphs', 'dynamic programming', 'arrays and strings', 'binary search',
+                  'SQL queries', 'concurrency', 'caching', 'REST API design', 'trees',
+                  'hash maps', 'sliding windows', 'distributed systems', 'React state',
+                  'database indexing', 'probability', 'object oriented design'),
+        'task': ('implement an LRU cache', 'merge overlapping intervals',
+                 'find the shortest path in a grid', 'design a rate limiter class',
+                 'parse a log file', 'serialize a binary tree', 'write a SQL join',
+                 'debug a failing test', 'build a small React component'),
+        'design': ('design a URL shortener', 'design a news feed', 'design a chat service',
+                   'design a ride sharing backend', 'design a metrics pipeline',
+                   'design a file storage service', 'design a notification system'),
+        'behavior': ('a conflict with a teammate', 'a project that failed',
+                     'leading without authority', 'handling a tight deadline',
+                     'disagreeing with a manager', 'mentoring a junior engineer'),
+        'feeling': ('smooth', 'long', 'fair', 'stressful', 'well organized',
+                    'disorganized', 'challenging', 'quick'),
+        'manner': ('friendly', 'professional', 'distracted', 'helpful', 'very detailed',
+                   'encouraging', 'strict'),
+        'tool': ('CoderPad', 'HackerRank', 'a shared Google Doc', 'a whiteboard', 'their own IDE'),
+        'minutes': ('30', '45', '60', '90'),
+        'count': ('two', 'three', 'four', 'five'),
+        'days': ('3', '5', '7', '10', '14', '21')
+    }
+    
+    # Distinct sentences rendered from the templates
+    SENTENCE_POOL_SIZE = 5000
+    
+    # Longest generated timeline, and the longest wait between the final
+    # decision and the post (both in days)
+    MAX_TIMELINE_DAYS = 120
+    MAX_POST_DELAY_DAYS = 30
+    
+    # Most sentences in one description
+    MAX_SENTENCES = 40
+    
+    # Page cache of the loading connection in KiB (speeds up index builds)
+    LOAD_CACHE_KIB = 256 * 1024
+    
+    _INSERT_EXPERIENCE = (
+        'INSERT INTO experience (job_title, company_name, experience_description, difficulty, '
+        'difficulty_rank, offer_received, application_date, final_decision_date, timeline_days, '
+        'user_id, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'
+    )
+    
+    def __init__(self, engine, seed=42, users=1000, companies=2000, company_skew=1.1,
+                 difficulty_mix=(0.3, 0.5, 0.2), offer_rate=0.35,
+                 start=date(2023, 1, 1), end=date(2025, 12, 31),
+                 password='password123', batch_size=50000, progress=None):
+        """
+        Initialize the generator
+        
+        Args:
+            engine: SQLAlchemy engine of a SQLite database
+            seed (int): Random seed
+            users (int): Number of authors to create
+            companies (int): Number of distinct companies
+            company_skew (float): Zipf exponent of company popularity
+            difficulty_mix (tuple): Weights of Easy, Medium and Hard
+            offer_rate (float): Fraction of experiences with an offer
+            start (date): Earliest application date
+            end (date): Latest creation date
+            password (str): Password of every generated user
+            batch_size (int): Rows per executemany
+            progress (callable): Called with a stats dict after each batch
+        """
+        if engine.dialect.name != 'sqlite':
+            raise ValueError('The dataset generator only writes SQLite databases')
+        if users < 1 or companies < 1:
+            raise ValueError('users and companies must be at least 1')
+        if len(difficulty_mix) != len(self.DIFFICULTIES) or sum(difficulty_mix) <= 0:
+            raise ValueError('difficulty_mix needs a positive weight for Easy, Medium and Hard')
+        if (end - start).days <= self.MAX_TIMELINE_DAYS + self.MAX_POST_DELAY_DAYS:
+            raise ValueError(f'end must be more than '
+                             f'{self.MAX_TIMELINE_DAYS + self.MAX_POST_DELAY_DAYS} days after start')
+        
+        self.engine = engine
+        self.seed = seed
+        self.users = users
+        self.companies = companies
+        self.company_skew = company_skew
+        self.difficulty_mix = tuple(difficulty_mix)
+        self.offer_rate = offer_rate
+        self.start = start
+        self.end = end
+        self.password = password
+        self.batch_size = batch_size
+        self.progress = progress
+    
+    def run(self, rows, search_index=True):
+        """
+        Generate the dataset
+        
+        Args:
+            rows (int): Number of experiences
+            search_index (bool): Rebuild the full-text index afterwards
+                (otherwise it is built the next time the application starts)
+        
+        Returns:
+            dict: Row counts and seconds spent per phase
+        
+        Raises:
+            ValueError: If the database already has experiences
+        """
+        with self.engine.connect() as conn:
+            if conn.execute(db.select(Experience.id).limit(1)).first() is not None:
+                raise ValueError('The database already has experiences; generate into an empty database')
+        
+        rng = random.Random(self.seed)
+        stats = {'rows': 0, 'users': self.users, 'companies': self.companies, 'phases': {}}
+        started = time.perf_counter()
+        
+        def phase(name, since):
+            now = time.perf_counter()
+            stats['phases'][name] = round(now - since, 2)
+            return now
+        
+        SearchIndex.uninstall(self.engine)
+        mark = time.perf_counter()
+        with self.engine.begin() as conn:
+            cache_size = conn.exec_driver_sql('PRAGMA cache_size').scalar()
+            conn.exec_driver_sql(f'PRAGMA cache_size = -{self.LOAD_CACHE_KIB}')
+            try:
+                for index in Experience.__table__.indexes:
+                    index.drop(conn, checkfirst=True)
+                
+                user_ids = self._insert_users(conn, rng)
+                changes = Counter()
+                for batch in self._experience_batches(rng, rows, user_ids, changes):
+                    conn.exec_driver_sql(self._INSERT_EXPERIENCE, batch)
+                    stats['rows'] += len(batch)
+                    if self.progress is not None:
+                        self.progress(dict(stats, elapsed=time.perf_counter() - started))
+                mark = phase('insert', mark)
+                
+                # One change per distinct (company, difficulty, offer, days),
+                # weighted by its row count through the sign
+                CompanyStats.record([key + (count,) for key, count in changes.items()], conn)
+                mark = phase('company_stats', mark)
+                
+                for index in Experience.__table__.indexes:
+                    index.create(conn)
+                DatasetVersion.bump(conn)
+                mark = phase('indexes', mark)
+                
+                conn.exec_driver_sql('ANALYZE')
+                mark = phase('analyze', mark)
+            finally:
+                # The connection goes back to the application's pool
+                conn.exec_driver_sql(f'PRAGMA cache_size = {cache_size}')
+        
+        if search_index:
+            SearchIndex.install(self.engine, enabled=True)
+            phase('search_index', mark)
+        
+        stats['elapsed'] = round(time.perf_counter() - started, 2)
+        stats['rows_per_second'] = stats['rows'] / stats['elapsed'] if stats['elapsed'] else 0
+        return stats
+    
+    def _insert_users(self, conn, rng):
+        """
+        Insert the generated users, all sharing one password hash
+        Encapsulation: Private method
+        
+        Returns:
+            list: User IDs in username order
+        """
+        password_hash = generate_password_hash(self.password)
+        usernames = [self.USERNAME_FORMAT.format(number) for number in range(1, self.users + 1)]
+        conn.exec_driver_sql(
+            'INSERT OR IGNORE INTO user (username, password_hash) VALUES (?, ?)',
+            [(username, password_hash) for username in usernames]
+        )
+        ids = dict(conn.execute(
+            db.select(User.username, User.id).where(User.username.in_(usernames))
+        ).all())
+        return [ids[username] for username in usernames]
+    
+    def _experience_batches(self, rng, rows, user_ids, changes):
+        """
+        Yield experience rows as DB-API parameter tuples
+        Encapsulation: Private method
+        
+        Every per-row draw except the description comes from one
+        rng.choices() call per batch, and dates are looked up as
+        preformatted strings, so a row costs a few microseconds.
+        
+        Args:
+            rng (random.Random): Seeded random generator
+            rows (int): Number of experiences
+            user_ids (list): Author IDs
+            changes (Counter): Receives the row count per CompanyStats
+                change (company, difficulty, offer, timeline days)
+        
+        Yields:
+            list: Parameter tuples of up to batch_size rows
+        """
+        companies = self._company_names(rng)
+        company_weights = self._zipf_cumulative(len(companies), self.company_skew)
+        author_weights = self._zipf_cumulative(len(user_ids), 0.8)
+        difficulty_weights = list(accumulate(self.difficulty_mix))
+        ranks = {difficulty: Experience.rank_of(difficulty) for difficulty in self.DIFFICULTIES}
+        titles = [level + role for level in self.LEVELS for role in self.ROLES]
+        sentences = self._sentence_pool(rng)
+        
+        # Timelines (median ~20 days) and sentence counts (median ~5) are
+        # log-normal, discretized into cumulative weights
+        timeline_values = range(self.MAX_TIMELINE_DAYS + 1)
+        timeline_weights = self._lognormal_cumulative(timeline_values, 3.0, 0.7)
+        sentence_values = range(1, self.MAX_SENTENCES + 1)
+        sentence_weights = self._lognormal_cumulative(sentence_values, 1.6, 0.6)
+        delay_values = range(self.MAX_POST_DELAY_DAYS + 1)
+        update_hours = [0] * 9 + list(range(1, 73, 8))  # 10% of rows edited later
+        
+        # Days are numbered from start; created_at advances evenly (in whole
+        # seconds) up to end, so IDs and creation times sort the same way,
+        # starting late enough that every application date is on or after start
+        total_days = (self.end - self.start).days + 4
+        days = [(self.start + timedelta(days=day)).isoformat() for day in range(total_days)]
+        first = (self.MAX_TIMELINE_DAYS + self.MAX_POST_DELAY_DAYS) * 86400
+        span = (self.end - self.start).days * 86400 - first
+        
+        def timestamp(seconds):
+            day, second = divmod(seconds, 86400)
+            return f'{days[day]} {second // 3600:02d}:{second // 60 % 60:02d}:{second % 60:02d}.000000'
+        
+        choices = rng.choices
+        for batch_start in range(0, rows, self.batch_size):
+            count = min(self.batch_size, rows - batch_start)
+            batch_companies = choices(companies, cum_weights=company_weights, k=count)
+            batch_authors = choices(user_ids, cum_weights=author_weights, k=count)
+            batch_difficulties = choices(self.DIFFICULTIES, cum_weights=difficulty_weights, k=count)
+            batch_titles = choices(titles, k=count)
+            batch_offers = choices((True, False), cum_weights=(self.offer_rate, 1.0), k=count)
+            batch_timelines = choices(timeline_values, cum_weights=timeline_weights, k=count)
+            batch_delays = choices(delay_values, k=count)
+            batch_sentences = choices(sentence_values, cum_weights=sentence_weights, k=count)
+            batch_updates = choices(update_hours, k=count)
+            
+            changes.update(zip(batch_companies, batch_difficulties, batch_offers, batch_timelines))
+            batch = []
+            for offset in range(count):
+                seconds = first + span * (batch_start + offset) // max(rows, 1)
+                decided = seconds // 86400 - batch_delays[offset]
+                timeline_days = batch_timelines[offset]
+                created_at = timestamp(seconds)
+                difficulty = batch_difficulties[offset]
+                batch.append((
+                    batch_titles[offset],
+                    batch_companies[offset],
+                    ' '.join(choices(sentences, k=batch_sentences[offset])),
+                    difficulty,
+                    ranks[difficulty],
+                    batch_offers[offset],
+                    days[decided - timeline_days],
+                    days[decided],
+                    timeline_days,
+                    batch_authors[offset],
+                    created_at,
+                    timestamp(seconds + batch_updates[offset] * 3600) if batch_updates[offset] else created_at
+                ))
+            yield batch
+    
+    def _company_names(self, rng):
+        """
+        Build the company names, most popular first
+        Encapsulation: Private method
+        
+        Returns:
+            list: Distinct company names
+        """
+        names = [
+            f'{prefix}{middle} {suffix}' if middle else f'{prefix} {suffix}'
+            for prefix in self.COMPANY_PREFIXES
+            for middle in self.COMPANY_MIDDLES
+            for suffix in self.COMPANY_SUFFIXES
+        ]
+        rng.shuffle(names)
+        if self.companies > len(names):
+            names += [f'{names[i % len(names)]} {i // len(names) + 1}'
+                      for i in range(len(names), self.companies)]
+        return names[:self.companies]
+    
+    @staticmethod
+    def _lognormal_cumulative(values, mu, sigma):
+        """
+        Cumulative weights of a log-normal distribution floored to integers
+        (values below the range fold into the first value, above into the last)
+        Encapsulation: Private method
+        
+        Args:
+            values (range): Consecutive integer values
+            mu (float): Mean of the underlying normal distribution
+            sigma (float): Standard deviation of the underlying normal distribution
+        
+        Returns:
+            list: Cumulative weights for rng.choices()
+        """
+        def cdf(x):
+            return 0.0 if x <= 0 else 0.5 * (1 + math.erf((math.log(x) - mu) / (sigma * math.sqrt(2))))
+        
+        weights = [cdf(value + 1) for value in values]
+        weights[-1] = 1.0
+        return weights
+    
+    @staticmethod
+    def _zipf_cumulative(count, exponent):
+        """
+        Cumulative Zipf weights (rank k has weight 1 / k ** exponent)
+        Encapsulation: Private method
+        """
+        return list(accumulate(1 / rank ** exponent for rank in range(1, count + 1)))
+    
+    def _sentence_pool(self, rng):
+        """
+        Render the pool of description sentences
+        Encapsulation: Private method
+        
+        Returns:
+            list: Sentences
+        """
+        pool = []
+        for _ in range(self.SENTENCE_POOL_SIZE):
+            template = rng.choice(self.SENTENCE_TEMPLATES)
+            values = {name: rng.choice(options) for name, options in self.FILLS.items()}
+            values['topic2'] = rng.choice(self.FILLS['topic'])
+            pool.append(template.format(**values))
+        return pool
@@ -0,0 +1,327 @@
+"""
+Experience Importer Service
+Implements streaming bulk imports with OOP principles:
+- Single Responsibility: Reads, validates and inserts experience records
+- Encapsulation: Chunking, username resolution and checkpoints are internal
+"""
+import csv
+import json
+import os
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from models import db, Experience, User, DatasetVersion, ImportCheckpoint, CompanyStats
+from services.experience_service import ExperienceService
+from utils.validators import Validator
+
+
+class ExperienceImporter:
+    """
+    Imports experiences from NDJSON or CSV files in large transactions
+    
+    The file is streamed record by record, so memory use does not depend on
+    its size. Records are validated like POST /api/experiences in chunks of
+    chunk_size and written with one executemany INSERT per chunk; a
+    transaction is committed every transaction_size records together with
+    the file's ImportCheckpoint, so an interrupted import resumes after the
+    last committed transaction.
+    
+    Each record needs the experience fields plus "username" (or
+    "author_username", as written by the export) naming its author;
+    "created_at" is kept when present. Any other field, including "id", is
+    ignored.
+    """
+    
+    FORMATS = ('ndjson', 'csv')
+    
+    # CSV spellings accepted for offer_received
+    CSV_BOOLEANS = {'true': True, '1': True, 'yes': True,
+                    'false': False, '0': False, 'no': False}
+    
+    def __init__(self, engine, chunk_size=1000, transaction_size=50000,
+                 create_users=False, default_password=None, errors=None, progress=None):
+        """
+        Initialize the importer
+        
+        Args:
+            engine: SQLAlchemy engine to import into
+            chunk_size (int): Records validated and inserted per executemany
+            transaction_size (int): Records per committed transaction
+            create_users (bool): Create unknown authors instead of rejecting
+            default_password (str): Password of created users (None makes
+                them unable to log in)
+            errors: Writable text file receiving rejected records as NDJSON
+            progress: Callable receiving the statistics after each commit
+        """
+        self.engine = engine
+        self.chunk_size = chunk_size
+        self.transaction_size = max(transaction_size, chunk_size)
+        self.create_users = create_users
+        self.password_hash = '!'
+        if default_password:
+            new_user = User('import')
+            new_user.set_password(default_password)
+            self.password_hash = new_user.password_hash
+        self.errors = errors
+        self.progress = progress
+        self.user_ids = {}
+    
+    @classmethod
+    def detect_format(cls, path):
+        """
+        Guess the input format from a file name
+        
+        Args:
+            path (str): Input file path
+        
+        Returns:
+            str: 'csv' for .csv files, 'ndjson' otherwise
+        """
+        return 'csv' if path.lower().endswith('.csv') else 'ndjson'
+    
+    def run(self, path, file_format=None, restart=False):
+        """
+        Import a file, resuming from its checkpoint
+        
+        Args:
+            path (str): Input file path
+            file_format (str): 'ndjson' or 'csv' (detected from the name if None)
+            restart (bool): Ignore an existing checkpoint and start over
+        
+        Returns:
+            dict: Import statistics
+        
+        Raises:
+            ValueError: If the file changed since its checkpoint was written
+        """
+        source = os.path.abspath(path)
+        file_format = file_format or self.detect_format(path)
+        if file_format not in self.FORMATS:
+            raise ValueError(f'Format must be one of {self.FORMATS}')
+        
+        stat = os.stat(source)
+        fingerprint = f'{stat.st_size}-{int(stat.st_mtime)}'
+        
+        with self.engine.connect() as conn:
+            checkpoint = self._load_checkpoint(conn, source, fingerprint, restart)
+            conn.commit()
+            
+            stats = {
+                'source': source,
+                'resumed_at': checkpoint['records_done'],
+                'records': checkpoint['records_done'],
+                'imported': checkpoint['rows_imported'],
+                'rejected': checkpoint['rows_rejected'],
+                'imported_now': 0,
+                'elapsed': 0.0,
+                'rows_per_second': 0.0,
+                'completed': checkpoint['completed']
+            }
+            if checkpoint['completed']:
+                return stats
+            
+            self._load_users(conn)
+            started = time.perf_counter()
+            pending = 0
+            chunk = []
+            
+            records = self._read_records(source, file_format, checkpoint['records_done'])
+            for record in records:
+                chunk.append(record)
+                if len(chunk) < self.chunk_size:
+                    continue
+                self._write_chunk(conn, chunk, stats)
+                pending += len(chunk)
+                chunk = []
+                if pending >= self.transaction_size:
+                    self._commit(conn, source, stats, started, completed=False)
+                    pending = 0
+            
+            if chunk:
+                self._write_chunk(conn, chunk, stats)
+            self._commit(conn, source, stats, started, completed=True)
+        
+        return stats
+    
+    def _load_checkpoint(self, conn, source, fingerprint, restart):
+        """
+        Get or create the checkpoint of a file
+        Encapsulation: Private method
+        
+        Returns:
+            dict: Checkpoint columns
+        """
+        table = ImportCheckpoint.__table__
+        if restart:
+            conn.execute(table.delete().where(table.c.source == source))
+        
+        row = conn.execute(db.select(table).where(table.c.source == source)).mappings().first()
+        if row is None:
+            row = {'source': source, 'fingerprint': fingerprint, 'records_done': 0,
+                   'rows_imported': 0, 'rows_rejected': 0, 'completed': False,
+                   'updated_at': datetime.utcnow()}
+            conn.execute(table.insert().values(**row))
+            return row
+        
+        if row['fingerprint'] != fingerprint:
+            raise ValueError(f'{source} changed since its last import; '
+                             'rerun with --restart to import it from the beginning')
+        return dict(row)
+    
+    def _load_users(self, conn):
+        """
+        Build the username -> user ID map
+        Encapsulation: Private method
+        """
+        self.user_ids = dict(conn.execute(db.select(User.username, User.id)).all())
+    
+    def _read_records(self, path, file_format, skip):
+        """
+        Stream records from the input file
+        Encapsulation: Private method
+        
+        Args:
+            path (str): Input file path
+            file_format (str): 'ndjson' or 'csv'
+            skip (int): Records already imported (not parsed again)
+        
+        Yields:
+            tuple: (record number, record dict or None, parse error or None)
+        """
+        with open(path, newline='', encoding='utf-8') as f:
+            if file_format == 'csv':
+                for number, record in enumerate(csv.DictReader(f), 1):
+                    if number > skip:
+                        yield number, self._from_csv(record), None
+                return
+            
+            number = 0
+            for line in f:
+                if not line.strip():
+                    continue
+                number += 1
+                if number <= skip:
+                    continue
+                try:
+                    yield number, json.loads(line), None
+                except ValueError as e:
+                    yield number, None, f'Invalid JSON: {e}'
+    
+    def _from_csv(self, record):
+        """
+        Convert CSV strings to the JSON types the validator expects
+        Encapsulation: Private method
+        """
+        offer = record.get('offer_received')
+        if isinstance(offer, str):
+            record['offer_received'] = self.CSV_BOOLEANS.get(offer.strip().lower(), offer)
+        return record
+    
+    def _write_chunk(self, conn, chunk, stats):
+        """
+        Validate a chunk of records and insert the valid ones
+        Encapsulation: Private method
+        """
+        now = datetime.utcnow()
+        rows = []
+        authors = []
+        
+        for number, record, error in chunk:
+            if error is None:
+                values, error = ExperienceService.parse_experience_data(record)
+            if error is None:
+                username = record.get('username') or record.get('author_username')
+                if not isinstance(username, str):
+                    error = 'Missing required field: username'
+                elif username not in self.user_ids:
+                    if self.create_users:
+                        is_valid, error = Validator.validate_username(username)
+                    else:
+                        error = f'Unknown user: {username}'
+            if error is None:
+                created_at, error = self._parse_timestamp(record.get('created_at'), now)
+            if error is not None:
+                self._reject(number, record, error, stats)
+                continue
+            
+            values['created_at'] = values['updated_at'] = created_at
+            rows.append(values)
+            authors.append(username)
+        
+        self._create_missing_users(conn, authors)
+        for values, username in zip(rows, authors):
+            values['user_id'] = self.user_ids[username]
+        
+        if rows:
+            conn.execute(Experience.__table__.insert(), rows)
+            CompanyStats.record(
+                [CompanyStats.change(SimpleNamespace(**values), 1) for values in rows], conn
+            )
+        
+        stats['records'] += len(chunk)
+        stats['imported'] += len(rows)
+        stats['imported_now'] += len(rows)
+    
+    def _create_missing_users(self, conn, usernames):
+        """
+        Insert authors that do not exist yet and add them to the map
+        Encapsulation: Private method
+        """
+        missing = sorted({name for name in usernames if name not in self.user_ids})
+        if not missing:
+            return
+        
+        table = User.__table__
+        conn.execute(table.insert(), [
+            {'username': name, 'password_hash': self.password_hash} for name in missing
+        ])
+        self.user_ids.update(conn.execute(
+            db.select(table.c.username, table.c.id).where(table.c.username.in_(missing))
+        ).all())
+    
+    @staticmethod
+    def _parse_timestamp(value, default):
+        """
+        Parse an optional ISO timestamp
+        Encapsulation: Private method
+        
+        Returns:
+            tuple: (datetime, error message or None)
+        """
+        if value is None or value == '':
+            return default, None
+        try:
+            return datetime.fromisoformat(value), None
+        except (TypeError, ValueError):
+            return None, 'Invalid created_at. Use an ISO 8601 timestamp'
+    
+    def _reject(self, number, record, error, stats):
+        """
+        Count a rejected record and write it to the errors file
+        Encapsulation: Private method
+        """
+        stats['rejected'] += 1
+        if self.errors is not None:
+            self.errors.write(json.dumps({'record': number, 'error': error, 'data': record}) + '\n')
+    
+    def _commit(self, conn, source, stats, started, completed):
+        """
+        Record progress in the checkpoint and commit the transaction
+        Encapsulation: Private method
+        """
+        table = ImportCheckpoint.__table__
+        conn.execute(table.update().where(table.c.source == source).values(
+            records_done=stats['records'],
+            rows_imported=stats['imported'],
+            rows_rejected=stats['rejected'],
+            completed=completed,
+            updated_at=datetime.utcnow()
+        ))
+        DatasetVersion.bump(conn)
+        conn.commit()
+        
+        stats['completed'] = completed
+        stats['elapsed'] = time.perf_counter() - started
+        stats['rows_per_second'] = stats['imported_now'] / stats['elapsed'] if stats['elapsed'] else 0.0
+        if self.progress is not None:
+            self.progress(stats)
@@ -4,9 +4,18 @@ Implements experience business logic with OOP principles:
 - Single Responsibility: Handles experience CRUD operations
 - Encapsulation: Query building logic is internal
 """
+import hashlib
+import math
 from datetime import datetime
-from models import db, Experience
+from types import SimpleNamespace
+from flask import current_app
+from models import db, Experience, User, DatasetVersion, CompanyStats, read_only
 from utils.validators import Validator
+from utils.cursor import Cursor
+from services.search_index import SearchIndex
+from services.response_cache import ResponseCache
+from services.fragment_cache import FragmentCache
+from services.company_index import CompanyIndex
 from config import Config
 
 
@@ -15,19 +24,38 @@ class ExperienceService:
     Service class for handling experience operations
     """
     
+    # Supported sort orders for get_experiences
+    # ('relevance' only applies to full-text searches)
+    SORT_ORDERS = ('date_desc', 'date_asc', 'difficulty', 'timeline_asc', 'timeline_desc', 'relevance')
+    
     @staticmethod
+    @read_only
     def get_experiences(page=1, per_page=None, difficulty=None, 
-                       offer_received=None, search=None, sort_by='date_desc'):
+                       offer_received=None, search=None, sort_by='date_desc',
+                       cursor=None, company=None, min_timeline_days=None,
+                       max_timeline_days=None):
         """
         Get paginated list of experiences with filters
         
+        Two pagination modes are supported:
+            - Page mode (default): page/per_page with LIMIT/OFFSET and a total count
+            - Cursor mode: when cursor is given (an empty string requests the
+              first page), rows are fetched by seeking past the last row seen,
+              without OFFSET or COUNT, and next_cursor points at the next page
+        
         Args:
-            page (int): Page number
+            page (int): Page number (page mode only)
             per_page (int): Items per page
             difficulty (str): Filter by difficulty
             offer_received (str): Filter by offer status
             search (str): Search term
-            sort_by (str): Sort order
+            sort_by (str): Sort order (date_desc/date_asc/difficulty/
+                timeline_asc/timeline_desc/relevance)
+            cursor (str): Opaque cursor from a previous response's next_cursor
+            company (str): Filter by exact company name
+            min_timeline_days (int): Filter by at least this many days from
+                application to final decision
+            max_timeline_days (int): Filter by at most this many days
             
         Returns:
             tuple: (result_dict, status_code)
@@ -38,53 +66,307 @@ class ExperienceService:
         # Validate pagination
         if page < 1:
             return {'error': 'Page must be >= 1'}, 400
+        if per_page < 1:
+            return {'error': 'Per page must be >= 1'}, 400
         if per_page > Config.MAX_PAGE_SIZE:
             return {'error': f'Per page must be <= {Config.MAX_PAGE_SIZE}'}, 400
         
-        # Build query
-        query = Experience.query
+        sort_by = ExperienceService._normalize_sort(sort_by, search)
+        
+        # Serve repeated queries from the response cache. The key includes
+        # the shared dataset version (the ETag's validator), so a write made
+        # by another worker is never answered with this worker's old page
+        cache = ResponseCache.current()
+        if cache is not None:
+            cache_key = (DatasetVersion.current(), ExperienceService._list_params(
+                page, per_page, difficulty, offer_received, search, sort_by, cursor, company,
+                min_timeline_days, max_timeline_days
+            ))
+            cached = cache.lists.get(cache_key)
+            if cached is not None:
+                return cached, 200
+            generation = cache.generation
+        
+        result, status_code = ExperienceService._query_experiences(
+            page, per_page, difficulty, offer_received, search, sort_by, cursor, company,
+            min_timeline_days, max_timeline_days
+        )
+        
+        if cache is not None and status_code == 200:
+            cache.store(cache.lists, cache_key, result, generation)
+        
+        return result, status_code
+    
+    @staticmethod
+    @read_only
+    def get_experiences_etag(page=1, per_page=None, difficulty=None,
+                             offer_received=None, search=None, sort_by='date_desc',
+                             cursor=None, company=None, min_timeline_days=None,
+                             max_timeline_days=None):
+        """
+        Get the entity tag of a get_experiences response without running it
+        Derived from the shared dataset version, so it changes whenever any
+        experience is written and costs a single primary key lookup
+        
+        Args:
+            Same as get_experiences
+            
+        Returns:
+            str: Entity tag value (without quotes)
+        """
+        if per_page is None:
+            per_page = Config.DEFAULT_PAGE_SIZE
+        
+        params = ExperienceService._list_params(
+            page, per_page, difficulty, offer_received, search,
+            ExperienceService._normalize_sort(sort_by, search), cursor, company,
+            min_timeline_days, max_timeline_days
+        )
+        digest = hashlib.sha1(repr(params).encode()).hexdigest()[:16]
+        
+        return f'l{DatasetVersion.current()}-{digest}'
+    
+    @staticmethod
+    def _list_params(page, per_page, difficulty, offer_received, search,
+                     sort_by, cursor, company, min_timeline_days, max_timeline_days):
+        """
+        Normalize list parameters so equivalent requests compare equal
+        Encapsulation: Private method
+        
+        Args:
+            Same as get_experiences (sort_by already normalized)
+            
+        Returns:
+            tuple: Hashable, order-independent parameter key
+        """
+        return ResponseCache.list_key(
+            page=None if cursor is not None else page,
+            per_page=per_page,
+            difficulty=difficulty or None,
+            offer_received=None if offer_received is None else offer_received.lower() == 'true',
+            search=search or None,
+            sort_by=sort_by,
+            cursor=cursor,
+            company=company or None,
+            min_timeline_days=min_timeline_days,
+            max_timeline_days=max_timeline_days
+        )
+    
+    @staticmethod
+    def _query_experiences(page, per_page, difficulty, offer_received,
+                           search, sort_by, cursor, company, min_timeline_days,
+                           max_timeline_days):
+        """
+        Run the list query for get_experiences
+        Encapsulation: Private method
+        
+        Args:
+            page (int): Page number (page mode only)
+            per_page (int): Items per page
+            difficulty (str): Filter by difficulty
+            offer_received (str): Filter by offer status
+            search (str): Search term
+            sort_by (str): Normalized sort order
+            cursor (str): Opaque cursor, or None for page mode
+            company (str): Filter by exact company name
+            min_timeline_days (int): Minimum days from application to decision
+            max_timeline_days (int): Maximum days from application to decision
+            
+        Returns:
+            tuple: (result_dict, status_code)
+        """
+        # Build a single joined, column-projected query so the author
+        # username is fetched with each row instead of lazy-loaded per item
+        query = ExperienceService._projection_query()
         
         # Apply filters
         query = ExperienceService._apply_filters(
-            query, difficulty, offer_received, search
+            query, difficulty, offer_received, search, company,
+            min_timeline_days, max_timeline_days
         )
         
-        # Apply sorting
-        query = ExperienceService._apply_sorting(query, sort_by)
+        if cursor is not None:
+            return ExperienceService._get_experiences_by_cursor(
+                query, per_page, sort_by, cursor, difficulty
+            )
         
-        # Paginate
+        # Paginate: one COUNT plus one page query, independent of per_page
         try:
-            pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+            total = query.with_entities(db.func.count(Experience.id)).scalar()
+            
+            query = ExperienceService._apply_sorting(query, sort_by)
+            rows = ExperienceService._fetch_rows(
+                query, per_page, (page - 1) * per_page
+            )
+            
+            pages = math.ceil(total / per_page) if total else 0
+            has_next = page < pages
             
             return {
-                'experiences': [exp.to_dict() for exp in pagination.items],
-                'total': pagination.total,
+                'experiences': ExperienceService._render_rows(rows),
+                'total': total,
                 'page': page,
                 'per_page': per_page,
-                'pages': pagination.pages,
-                'has_next': pagination.has_next,
-                'has_prev': pagination.has_prev
+                'pages': pages,
+                'has_next': has_next,
+                'has_prev': page > 1,
+                'next_cursor': ExperienceService._next_cursor(rows, sort_by) if has_next else None
             }, 200
         except Exception as e:
             return {'error': f'Database error: {str(e)}'}, 500
     
     @staticmethod
-    def get_experience_by_id(experience_id):
+    @read_only
+    def export_experiences(difficulty=None, offer_received=None, search=None,
+                           batch_size=None, company=None, min_timeline_days=None,
+                           max_timeline_days=None):
+        """
+        Stream every matching experience as NDJSON
+        
+        Rows are read through a server-side cursor in batches of batch_size
+        as plain column tuples (no ORM objects, so the identity map stays
+        empty) and encoded batch by batch, keeping memory constant however
+        many rows match. Lines are ordered by ID and hold the same object as
+        the list endpoint, which the importer accepts as input.
+        
+        Args:
+            difficulty (str): Filter by difficulty
+            offer_received (str): Filter by offer status
+            search (str): Search term
+            batch_size (int): Rows fetched and encoded per batch
+            company (str): Filter by exact company name
+            min_timeline_days (int): Minimum days from application to decision
+            max_timeline_days (int): Maximum days from application to decision
+            
+        Yields:
+            str: Batch of newline-terminated JSON documents
+        """
+        batch_size = batch_size or Config.EXPORT_BATCH_SIZE
+        dumps = current_app.json.dumps
+        
+        query = ExperienceService._apply_filters(
+            ExperienceService._projection_query(), difficulty, offer_received, search, company,
+            min_timeline_days, max_timeline_days
+        ).order_by(Experience.id).yield_per(batch_size)
+        
+        lines = []
+        for row in query:
+            lines.append(dumps(Experience.row_to_dict(row)))
+            if len(lines) == batch_size:
+                yield '\n'.join(lines) + '\n'
+                lines = []
+        
+        if lines:
+            yield '\n'.join(lines) + '\n'
+    
+    @staticmethod
+    def explain_experiences(difficulty=None, offer_received=None, company=None,
+                            min_timeline_days=None, max_timeline_days=None,
+                            sort_by='date_desc', seek=False):
+        """
+        Get the SQLite query plan of one get_experiences page query
+        Used by `flask check-query-plans` to confirm every filter and sort
+        combination is answered from an index without a sort step
+        
+        Args:
+            difficulty (str): Filter by difficulty
+            offer_received (str): Filter by offer status
+            company (str): Filter by exact company name
+            min_timeline_days (int): Minimum days from application to decision
+            max_timeline_days (int): Maximum days from application to decision
+            sort_by (str): Sort order (date_desc/date_asc/difficulty/
+                timeline_asc/timeline_desc)
+            seek (bool): Explain a cursor page after the first instead of page mode
+            
+        Returns:
+            list: Plan step descriptions from EXPLAIN QUERY PLAN
+        """
+        sort_by = ExperienceService._normalize_sort(sort_by)
+        query = ExperienceService._apply_filters(
+            ExperienceService._projection_query(), difficulty, offer_received, None, company,
+            min_timeline_days, max_timeline_days
+        )
+        
+        if seek:
+            sort_key = datetime.utcnow() if sort_by in Cursor.DATETIME_SORTS else 2
+            query = ExperienceService._apply_seek(query, sort_by, sort_key, 1000, difficulty)
+        
+        query = ExperienceService._apply_sorting(query, sort_by).limit(Config.DEFAULT_PAGE_SIZE)
+        sql = str(query.statement.compile(db.engine, compile_kwargs={'literal_binds': True}))
+        
+        return [row[3] for row in db.session.execute(db.text(f'EXPLAIN QUERY PLAN {sql}'))]
+    
+    @staticmethod
+    @read_only
+    def get_experience_by_id(experience_id, etag=None):
         """
         Get a single experience by ID
         
+        Cached responses and fragments are stored with the experience's
+        entity tag and only reused while it still matches, so a change made
+        by another worker is never served from this worker's caches
+        
         Args:
             experience_id (int): Experience ID
+            etag (str): Current entity tag, if the caller already looked it
+                up with get_experience_etag()
             
         Returns:
             tuple: (experience_dict or error, status_code)
         """
-        experience = Experience.query.get(experience_id)
+        cache = ResponseCache.current()
+        fragments = FragmentCache.current()
+        
+        if etag is None and (cache is not None or fragments is not None):
+            etag = ExperienceService.get_experience_etag(experience_id)
+            if etag is None:
+                return {'error': 'Experience not found'}, 404
+        
+        if cache is not None:
+            cached = cache.details.get(experience_id)
+            if cached is not None and cached[0] == etag:
+                return cached[1], 200
+            generation = cache.generation
+        
+        if fragments is None:
+            experiences = [
+                Experience.row_to_dict(row)
+                for row in ExperienceService._load_rows([experience_id])
+            ]
+        else:
+            experiences = fragments.get_many(
+                [(experience_id, etag)], ExperienceService._load_rows, Experience.row_to_dict
+            )
         
-        if not experience:
+        if not experiences:
             return {'error': 'Experience not found'}, 404
         
-        return {'experience': experience.to_dict()}, 200
+        result = {'experience': experiences[0]}
+        if cache is not None:
+            cache.store(cache.details, experience_id, (etag, result), generation)
+        
+        return result, 200
+    
+    @staticmethod
+    @read_only
+    def get_experience_etag(experience_id):
+        """
+        Get the entity tag of an experience from its creation/change stamps
+        
+        Args:
+            experience_id (int): Experience ID
+            
+        Returns:
+            str or None: Entity tag value, or None if the experience does not exist
+        """
+        stamps = db.session.query(
+            Experience.created_at, Experience.updated_at
+        ).filter(Experience.id == experience_id).first()
+        
+        if not stamps:
+            return None
+        
+        return Experience.make_etag(experience_id, stamps.created_at, stamps.updated_at)
     
     @staticmethod
     def create_experience(user_id, data):
@@ -98,37 +380,20 @@ class ExperienceService:
         Returns:
             tuple: (result_dict, status_code)
         """
-        # Validate data
-        is_valid, errors = Validator.validate_experience_data(data)
-        if not is_valid:
-            return {'error': errors}, 400
-        
-        # Parse dates
-        try:
-            application_date = datetime.fromisoformat(data['application_date']).date()
-            final_decision_date = datetime.fromisoformat(data['final_decision_date']).date()
-        except ValueError:
-            return {'error': 'Invalid date format. Use YYYY-MM-DD'}, 400
-        
-        # Validate date logic
-        if final_decision_date < application_date:
-            return {'error': 'Final decision date cannot be before application date'}, 400
+        values, error = ExperienceService.parse_experience_data(data)
+        if error:
+            return {'error': error}, 400
         
         # Create experience
-        experience = Experience(
-            job_title=data['job_title'],
-            company_name=data['company_name'],
-            experience_description=data['experience_description'],
-            difficulty=data['difficulty'],
-            offer_received=data['offer_received'],
-            application_date=application_date,
-            final_decision_date=final_decision_date,
-            user_id=user_id
-        )
+        experience = Experience(user_id=user_id, **values)
         
         try:
             db.session.add(experience)
+            DatasetVersion.bump()
+            stats_changes = [CompanyStats.change(experience, 1)]
+            CompanyStats.record(stats_changes)
             db.session.commit()
+            ExperienceService._invalidate_cache(stats_changes=stats_changes)
             
             return {
                 'message': 'Experience created successfully',
@@ -138,6 +403,91 @@ class ExperienceService:
             db.session.rollback()
             return {'error': f'Database error: {str(e)}'}, 500
     
+    @staticmethod
+    def create_experiences(user_id, items):
+        """
+        Create several experiences in one transaction
+        
+        Every item is validated like create_experience. Valid items are
+        inserted with a single multi-row INSERT and one commit; invalid items
+        are skipped and reported at their position in the batch.
+        
+        Args:
+            user_id (int): ID of the user creating the experiences
+            items (list): Experience data dictionaries (at most MAX_BATCH_SIZE)
+            
+        Returns:
+            tuple: (result_dict, status_code) - 201 if every item was created,
+                207 if only some were, 400 if none were
+        """
+        if not isinstance(items, list) or not items:
+            return {'error': 'experiences must be a non-empty list'}, 400
+        if len(items) > Config.MAX_BATCH_SIZE:
+            return {'error': f'A batch can contain at most {Config.MAX_BATCH_SIZE} experiences'}, 400
+        
+        results = [None] * len(items)
+        rows = []
+        positions = []
+        
+        for index, data in enumerate(items):
+            values, error = ExperienceService.parse_experience_data(data)
+            if error:
+                results[index] = {'index': index, 'status': 400, 'error': error}
+            else:
+                rows.append(dict(values, user_id=user_id))
+                positions.append(index)
+        
+        if rows:
+            try:
+                # One multi-row INSERT ... RETURNING. New row IDs increase in
+                # VALUES order within a statement, so sorting the returned rows
+                # by ID lines them up with the items (asking SQLAlchemy to keep
+                # parameter order would fall back to one INSERT per row here)
+                inserted = sorted(db.session.execute(
+                    db.insert(Experience).returning(Experience.id, Experience.created_at),
+                    rows
+                ).all())
+                DatasetVersion.bump()
+                stats_changes = [CompanyStats.change(SimpleNamespace(**values), 1) for values in rows]
+                CompanyStats.record(stats_changes)
+                db.session.commit()
+                ExperienceService._invalidate_cache(stats_changes=stats_changes)
+            except Exception as e:
+                db.session.rollback()
+                return {'error': f'Database error: {str(e)}'}, 500
+            
+            author_username = db.session.query(User.username).filter(User.id == user_id).scalar()
+            for index, values, (experience_id, created_at) in zip(positions, rows, inserted):
+                row = SimpleNamespace(
+                    id=experience_id,
+                    created_at=created_at,
+                    author_username=author_username,
+                    timeline_days=Experience.days_between(
+                        values['application_date'], values['final_decision_date']
+                    ),
+                    **values
+                )
+                results[index] = {
+                    'index': index,
+                    'status': 201,
+                    'experience': Experience.row_to_dict(row)
+                }
+        
+        created = len(rows)
+        if created == len(items):
+            status_code = 201
+        elif created:
+            status_code = 207
+        else:
+            status_code = 400
+        
+        return {
+            'message': f'Created {created} of {len(items)} experiences',
+            'created': created,
+            'failed': len(items) - created,
+            'results': results
+        }, status_code
+    
     @staticmethod
     def update_experience(experience_id, user_id, data):
         """
@@ -175,6 +525,7 @@ class ExperienceService:
             return {'error': 'Invalid date format. Use YYYY-MM-DD'}, 400
         
         # Update experience
+        stats_before = CompanyStats.change(experience, -1)
         experience.update_from_dict(data)
         
         # Validate date logic
@@ -182,7 +533,14 @@ class ExperienceService:
             return {'error': 'Final decision date cannot be before application date'}, 400
         
         try:
+            DatasetVersion.bump()
+            stats_after = CompanyStats.change(experience, 1)
+            stats_changes = []
+            if stats_after[:-1] != stats_before[:-1]:
+                stats_changes = [stats_before, stats_after]
+                CompanyStats.record(stats_changes)
             db.session.commit()
+            ExperienceService._invalidate_cache(experience_id, stats_changes)
             
             return {
                 'message': 'Experience updated successfully',
@@ -215,7 +573,11 @@ class ExperienceService:
         
         try:
             db.session.delete(experience)
+            DatasetVersion.bump()
+            stats_changes = [CompanyStats.change(experience, -1)]
+            CompanyStats.record(stats_changes)
             db.session.commit()
+            ExperienceService._invalidate_cache(experience_id, stats_changes)
             
             return {'message': 'Experience deleted successfully'}, 200
         except Exception as e:
@@ -223,7 +585,148 @@ class ExperienceService:
             return {'error': f'Database error: {str(e)}'}, 500
     
     @staticmethod
-    def _apply_filters(query, difficulty, offer_received, search):
+    def parse_experience_data(data):
+        """
+        Validate new experience data and convert it to column values
+        Shared by create_experience, create_experiences and the importer
+        
+        Args:
+            data (dict): Experience data from the request
+            
+        Returns:
+            tuple: (values, error) - column values without user_id, or an error message
+        """
+        if not isinstance(data, dict):
+            return None, 'Experience data must be an object'
+        
+        # Validate data
+        is_valid, errors = Validator.validate_experience_data(data)
+        if not is_valid:
+            return None, errors
+        
+        # Parse dates
+        try:
+            application_date = datetime.fromisoformat(data['application_date']).date()
+            final_decision_date = datetime.fromisoformat(data['final_decision_date']).date()
+        except (TypeError, ValueError):
+            return None, 'Invalid date format. Use YYYY-MM-DD'
+        
+        # Validate date logic
+        if final_decision_date < application_date:
+            return None, 'Final decision date cannot be before application date'
+        
+        return {
+            'job_title': data['job_title'],
+            'company_name': data['company_name'],
+            'experience_description': data['experience_description'],
+            'difficulty': data['difficulty'],
+            'offer_received': data['offer_received'],
+            'application_date': application_date,
+            'final_decision_date': final_decision_date
+        }, None
+    
+    @staticmethod
+    def _invalidate_cache(experience_id=None, stats_changes=()):
+        """
+        Drop cached reads affected by a committed write and
+        update the in-process company name index
+        Encapsulation: Private method
+        
+        Args:
+            experience_id (int): Changed experience ID (None for new rows)
+            stats_changes (list): Changes passed to CompanyStats.record()
+        """
+        cache = ResponseCache.current()
+        if cache is not None:
+            cache.invalidate_experience(experience_id)
+        
+        fragments = FragmentCache.current()
+        if fragments is not None and experience_id is not None:
+            fragments.invalidate(experience_id)
+        
+        companies = CompanyIndex.current()
+        if companies is not None:
+            companies.apply(stats_changes)
+    
+    @staticmethod
+    def _fetch_rows(query, limit, offset=0):
+        """
+        Fetch the rows of one page
+        With the fragment cache enabled only the page keys are selected;
+        the full columns are loaded later, and only for uncached rows
+        Encapsulation: Private method
+        
+        Args:
+            query: Filtered and sorted projection query
+            limit (int): Maximum number of rows
+            offset (int): Number of rows to skip
+            
+        Returns:
+            list: Result rows (with at least id, user_id and the sort keys)
+        """
+        if FragmentCache.current() is not None:
+            query = query.with_entities(
+                Experience.id, Experience.user_id, Experience.created_at,
+                Experience.updated_at, Experience.difficulty_rank, Experience.timeline_days
+            )
+        
+        return query.limit(limit).offset(offset).all()
+    
+    @staticmethod
+    def _render_rows(rows):
+        """
+        Serialize page rows, reusing cached JSON fragments when enabled
+        Encapsulation: Private method
+        
+        Args:
+            rows (list): Rows returned by _fetch_rows
+            
+        Returns:
+            list: Experience dictionaries or JSONFragment values, in row order
+        """
+        fragments = FragmentCache.current()
+        
+        if fragments is None:
+            return [Experience.row_to_dict(row) for row in rows]
+        
+        return fragments.get_many(
+            [(row.id, Experience.make_etag(row.id, row.created_at, row.updated_at)) for row in rows],
+            ExperienceService._load_rows,
+            Experience.row_to_dict
+        )
+    
+    @staticmethod
+    def _load_rows(experience_ids):
+        """
+        Load full projected rows for a set of experiences in one query
+        Encapsulation: Private method
+        
+        Args:
+            experience_ids (list): Experience IDs
+            
+        Returns:
+            list: Projected rows (in no particular order)
+        """
+        return ExperienceService._projection_query().filter(
+            Experience.id.in_(experience_ids)
+        ).all()
+    
+    @staticmethod
+    def _projection_query():
+        """
+        Build the joined, column-projected base query for read paths
+        Encapsulation: Private method
+        
+        Returns:
+            SQLAlchemy query object selecting Experience.projection_columns()
+        """
+        return db.session.query(*Experience.projection_columns()).join(
+            User, Experience.user_id == User.id
+        )
+    
+    @staticmethod
+    def _apply_filters(query, difficulty, offer_received, search, company,
+                       min_timeline_days, max_timeline_days):
         """
         Apply filters to query
         Encapsulation: Private method
@@ -233,18 +736,35 @@ class ExperienceService:
             difficulty (str): Difficulty filter
             offer_received (str): Offer filter
             search (str): Search term
+            company (str): Exact company name filter
+            min_timeline_days (int): Minimum days from application to decision
+            max_timeline_days (int): Maximum days from application to decision
             
         Returns:
             SQLAlchemy query object
         """
+        if company:
+            query = query.filter(Experience.company_name == company)
+        
+        if min_timeline_days is not None:
+            query = query.filter(Experience.timeline_days >= min_timeline_days)
+        if max_timeline_days is not None:
+            query = query.filter(Experience.timeline_days <= max_timeline_days)
+        
         if difficulty:
-            query = query.filter_by(difficulty=difficulty)
+            # Filter on the stored rank so the composite indexes apply
+            query = query.filter(Experience.difficulty_rank == Experience.rank_of(difficulty))
+            if difficulty not in Experience.DIFFICULTY_RANKS:
+                query = query.filter(Experience.difficulty == difficulty)
         
         if offer_received is not None:
             offer_bool = offer_received.lower() == 'true'
-            query = query.filter_by(offer_received=offer_bool)
+            query = query.filter(Experience.offer_received == offer_bool)
         
-        if search:
+        if search and ExperienceService._uses_full_text(search):
+            matches = SearchIndex.matches(search)
+            query = query.join(matches, matches.c.rowid == Experience.id)
+        elif search:
             search_term = f'%{search}%'
             query = query.filter(
                 db.or_(
@@ -256,6 +776,180 @@ class ExperienceService:
         
         return query
     
+    @staticmethod
+    def _get_experiences_by_cursor(query, per_page, sort_by, cursor, difficulty=None):
+        """
+        Fetch one page by seeking past the cursor position (keyset pagination)
+        Encapsulation: Private method
+        
+        Args:
+            query: Filtered SQLAlchemy query object
+            per_page (int): Items per page
+            sort_by (str): Normalized sort order
+            cursor (str): Opaque cursor, or an empty string for the first page
+            difficulty (str): Difficulty filter applied to query
+            
+        Returns:
+            tuple: (result_dict, status_code)
+        """
+        if sort_by == 'relevance':
+            return {'error': 'Cursor pagination is not supported for sort_by=relevance'}, 400
+        
+        if cursor:
+            try:
+                sort_key, last_id = Cursor.decode(cursor, sort_by)
+            except ValueError:
+                return {'error': 'Invalid cursor'}, 400
+            query = ExperienceService._apply_seek(query, sort_by, sort_key, last_id, difficulty)
+        
+        try:
+            query = ExperienceService._apply_sorting(query, sort_by)
+            
+            # Fetch one extra row to learn whether another page exists
+            rows = ExperienceService._fetch_rows(query, per_page + 1)
+            has_next = len(rows) > per_page
+            rows = rows[:per_page]
+            
+            return {
+                'experiences': ExperienceService._render_rows(rows),
+                'per_page': per_page,
+                'has_next': has_next,
+                'next_cursor': ExperienceService._next_cursor(rows, sort_by) if has_next else None
+            }, 200
+        except Exception as e:
+            return {'error': f'Database error: {str(e)}'}, 500
+    
+    @staticmethod
+    def _normalize_sort(sort_by, search=None):
+        """
+        Map a requested sort order to a supported one
+        Encapsulation: Private method
+        
+        Args:
+            sort_by (str): Requested sort order
+            search (str): Search term of the request
+            
+        Returns:
+            str: Supported sort order (unknown values sort newest first;
+                 relevance needs a search that uses the full-text index)
+        """
+        if sort_by == 'relevance' and not ExperienceService._uses_full_text(search):
+            return 'date_desc'
+        if sort_by in ExperienceService.SORT_ORDERS:
+            return sort_by
+        return 'date_desc'
+    
+    @staticmethod
+    def _sort_key(sort_by):
+        """
+        Get the primary sort expression for a sort order
+        Rows are always tie-broken by id in the same direction so that
+        ordering is total and cursors are unambiguous
+        Encapsulation: Private method
+        
+        Args:
+            sort_by (str): Normalized sort order
+            
+        Returns:
+            tuple: (sort_expression, descending)
+        """
+        if sort_by == 'date_asc':
+            return Experience.created_at, False
+        if sort_by == 'relevance':
+            # BM25 rank from the full-text index (lower is more relevant)
+            return SearchIndex.matched.c.rank, False
+        if sort_by == 'difficulty':
+            # Custom order: Easy, Medium, Hard (stored rank, so it is indexed)
+            return Experience.difficulty_rank, False
+        if sort_by == 'timeline_asc':
+            # Fastest processes first
+            return Experience.timeline_days, False
+        if sort_by == 'timeline_desc':
+            return Experience.timeline_days, True
+        # Default: newest first
+        return Experience.created_at, True
+    
+    @staticmethod
+    def _apply_seek(query, sort_by, sort_key, last_id, difficulty=None):
+        """
+        Restrict query to rows after (sort_key, last_id) in sort order
+        The leading range on the sort key lets the index seek directly
+        Encapsulation: Private method
+        
+        Args:
+            query: SQLAlchemy query object
+            sort_by (str): Normalized sort order
+            sort_key: Sort key value of the last row seen
+            last_id (int): ID of the last row seen
+            difficulty (str): Difficulty filter applied to query
+            
+        Returns:
+            SQLAlchemy query object
+        """
+        key, descending = ExperienceService._sort_key(sort_by)
+        
+        if sort_by == 'difficulty' and difficulty:
+            # The filter pins the rank, so only the ID moves. A range on the
+            # rank next to the equality would stop SQLite seeking on the ID
+            rank = Experience.rank_of(difficulty)
+            if sort_key < rank:
+                return query
+            if sort_key > rank:
+                return query.filter(db.false())
+            return query.filter(Experience.id > last_id)
+        
+        if descending:
+            return query.filter(
+                key <= sort_key,
+                db.or_(key < sort_key, Experience.id < last_id)
+            )
+        return query.filter(
+            key >= sort_key,
+            db.or_(key > sort_key, Experience.id > last_id)
+        )
+    
+    @staticmethod
+    def _next_cursor(rows, sort_by):
+        """
+        Build the cursor pointing after the last row of a page
+        Encapsulation: Private method
+        
+        Args:
+            rows (list): Projected rows of the current page
+            sort_by (str): Normalized sort order
+            
+        Returns:
+            str or None: Cursor string, or None for an empty page
+        """
+        if not rows or sort_by == 'relevance':
+            return None
+        
+        last = rows[-1]
+        if sort_by == 'difficulty':
+            sort_key = last.difficulty_rank
+        elif sort_by in ('timeline_asc', 'timeline_desc'):
+            sort_key = last.timeline_days
+        else:
+            sort_key = last.created_at
+        
+        return Cursor.encode(sort_by, sort_key, last.id)
+    
+    @staticmethod
+    def _uses_full_text(search):
+        """
+        Check whether a search term is served by the full-text index
+        Encapsulation: Private method
+        
+        Args:
+            search (str): Search term
+            
+        Returns:
+            bool: True if the FTS5 index is available and the term has words
+        """
+        return bool(search) and \
+            SearchIndex.is_enabled(db.engine, current_app.config['FULL_TEXT_SEARCH_ENABLED']) and \
+            SearchIndex.match_expression(search) is not None
+    
     @staticmethod
     def _apply_sorting(query, sort_by):
         """
@@ -269,23 +963,8 @@ class ExperienceService:
         Returns:
             SQLAlchemy query object
         """
-        if sort_by == 'date_desc':
-            query = query.order_by(Experience.created_at.desc())
-        elif sort_by == 'date_asc':
-            query = query.order_by(Experience.created_at.asc())
-        elif sort_by == 'difficulty':
-            # Custom order: Easy, Medium, Hard
-            query = query.order_by(
-                db.case(
-                    (Experience.difficulty == 'Easy', 1),
-                    (Experience.difficulty == 'Medium', 2),
-                    (Experience.difficulty == 'Hard', 3),
-                    else_=4
-                )
-            )
-        else:
-            # Default: newest first
-            query = query.order_by(Experience.created_at.desc())
+        key, descending = ExperienceService._sort_key(sort_by)
         
-        return query
-
+        if descending:
+            return query.order_by(key.desc(), Experience.id.desc())
+        return query.order_by(key.asc(), Experience.id.asc())
@@ -0,0 +1,176 @@
+"""
+Fragment Cache Service
+Implements caching of pre-serialized experiences with OOP principles:
+- Single Responsibility: Keeps ready-to-emit JSON per experience
+- Encapsulation: Serialization and invalidation rules are internal
+"""
+from datetime import datetime
+from flask import current_app, has_app_context
+from sqlalchemy import event
+from models import db, Experience, User, DatasetVersion, RoutingSession
+from utils.cache import LRUCache
+from utils.json_fragments import JSONFragment
+from services.response_cache import ResponseCache
+
+# Session.info key of the user IDs renamed in the current transaction
+RENAMED_USERS_KEY = 'fragment_cache.renamed_users'
+
+
+class FragmentCache:
+    """
+    Service class caching each experience as an encoded JSON fragment
+    
+    Pages are assembled by concatenating cached fragments, so a warm page
+    skips building dictionaries, formatting dates and encoding strings.
+    Each fragment is stored with its experience's entity tag and is only
+    reused while the caller's current tag matches, so rows changed by other
+    workers are re-rendered. Entries are also dropped when their experience
+    is updated or deleted and when the author's username changes.
+    """
+    
+    EXTENSION_KEY = 'fragment_cache'
+    
+    def __init__(self, max_entries, ttl):
+        """
+        Initialize an empty fragment cache
+        
+        Args:
+            max_entries (int): Maximum number of cached experiences
+            ttl (float): Seconds a fragment stays valid
+        """
+        self.fragments = LRUCache(max_entries, ttl)
+    
+    @classmethod
+    def init_app(cls, app):
+        """
+        Attach a fragment cache to the application if enabled in configuration
+        
+        Args:
+            app (Flask): Flask application instance
+        """
+        if app.config.get('FRAGMENT_CACHE_ENABLED'):
+            app.extensions[cls.EXTENSION_KEY] = cls(
+                app.config['FRAGMENT_CACHE_MAX_ENTRIES'],
+                app.config['FRAGMENT_CACHE_TTL']
+            )
+    
+    @classmethod
+    def current(cls):
+        """
+        Get the fragment cache of the current application
+        
+        Returns:
+            FragmentCache or None: None when disabled or outside an app context
+        """
+        if not has_app_context():
+            return None
+        return current_app.extensions.get(cls.EXTENSION_KEY)
+    
+    def get_many(self, keys, load_rows, serialize):
+        """
+        Get fragments for experiences, loading all misses in one call
+        
+        Args:
+            keys (list): (experience ID, current entity tag) pairs in output order
+            load_rows (callable): Takes a list of IDs, returns projected rows
+            serialize (callable): Converts a projected row to a dictionary
+        
+        Returns:
+            list: JSONFragment per ID found, in the order of keys
+        """
+        found = {}
+        missing = []
+        
+        for experience_id, etag in keys:
+            cached = self.fragments.get(experience_id)
+            if cached is None or cached[2] != etag:
+                missing.append(experience_id)
+            else:
+                found[experience_id] = cached[0]
+        
+        if missing:
+            for row in load_rows(missing):
+                fragment = JSONFragment(current_app.json.dumps(serialize(row)))
+                # Tag of the row as loaded (it may be newer than the caller's)
+                etag = Experience.make_etag(row.id, row.created_at, row.updated_at)
+                self.fragments.set(row.id, (fragment, row.user_id, etag))
+                found[row.id] = fragment
+        
+        return [found[experience_id] for experience_id, _ in keys if experience_id in found]
+    
+    def invalidate(self, experience_id):
+        """
+        Drop the fragment of one experience
+        
+        Args:
+            experience_id (int): Experience ID
+        """
+        self.fragments.invalidate(experience_id)
+    
+    def invalidate_user(self, user_id):
+        """
+        Drop the fragments of every experience written by a user
+        
+        Args:
+            user_id (int): Author's user ID
+        """
+        self.fragments.discard_where(lambda entry: entry[1] == user_id)
+    
+    def stats(self):
+        """
+        Get fragment cache counters (for monitoring)
+        
+        Returns:
+            dict: Cache statistics
+        """
+        return self.fragments.stats()
+
+
+@event.listens_for(User, 'after_update')
+def _on_user_updated(mapper, connection, user):
+    """
+    Handle a username change inside the flush that writes it
+    Bumps the shared dataset version and the updated_at stamp of the user's
+    experiences in the same transaction, so list and detail validators
+    change for every worker once it commits, and queues the user for
+    _on_commit() to drop this process's cached fragments and responses
+    """
+    if not db.inspect(user).attrs.username.history.has_changes():
+        return
+    
+    DatasetVersion.bump(connection)
+    connection.execute(
+        db.update(Experience)
+        .where(Experience.user_id == user.id)
+        .values(updated_at=datetime.utcnow())
+    )
+    
+    session = db.inspect(user).session
+    if session is not None:
+        session.info.setdefault(RENAMED_USERS_KEY, set()).add(user.id)
+
+
+@event.listens_for(RoutingSession, 'after_commit')
+def _on_commit(session):
+    """
+    Invalidate the cached experiences of users renamed in the committed
+    transaction (like the experience writes, only once the change is durable)
+    """
+    user_ids = session.info.pop(RENAMED_USERS_KEY, None)
+    if not user_ids or not has_app_context():
+        return
+    
+    fragments = FragmentCache.current()
+    if fragments is not None:
+        for user_id in user_ids:
+            fragments.invalidate_user(user_id)
+    
+    responses = ResponseCache.current()
+    if responses is not None:
+        responses.invalidate_experience()
+
+
+@event.listens_for(RoutingSession, 'after_rollback')
+def _on_rollback(session):
+    """Forget renames of a rolled back transaction (nothing was cached stale)"""
+    session.info.pop(RENAMED_USERS_KEY, None)
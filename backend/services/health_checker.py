@@ -0,0 +1,201 @@
+"""
+Health Checker Service
+Probes the dependencies a worker needs to serve traffic with OOP principles:
+- Single Responsibility: Runs readiness probes and caches their result
+- Encapsulation: Probes, timeouts and the result cache are internal
+"""
+import os
+import shutil
+import threading
+import time
+from flask import current_app, has_app_context
+from sqlalchemy import text
+from services.database_profile import DatabaseProfile
+from services.session_store import SessionStore
+
+
+class HealthChecker:
+    """
+    Service class behind GET /api/health/ready
+    
+    A readiness check runs these probes:
+        - database: SELECT 1 on the primary engine (and on the read engine)
+        - write_lock: BEGIN IMMEDIATE on the primary SQLite database, waiting
+          at most HEALTH_WRITE_LOCK_TIMEOUT_MS, then rolled back
+        - disk: free space next to the SQLite file of at least HEALTH_MIN_FREE_DISK_MB
+        - session_store: counts the active sessions through the token store
+    It also reports the connection pool occupancy. The result is cached for
+    HEALTH_CHECK_CACHE_SECONDS, so frequent load balancer polls do not add
+    load, and only one request at a time runs the probes.
+    """
+    
+    EXTENSION_KEY = 'health_checker'
+    
+    def __init__(self, cache_seconds, write_lock_timeout_ms, min_free_disk_mb):
+        """
+        Initialize the checker
+        
+        Args:
+            cache_seconds (float): Seconds a readiness result is reused
+            write_lock_timeout_ms (int): Longest wait for the write lock
+            min_free_disk_mb (float): Free disk space below which the worker is not ready
+        """
+        self.cache_seconds = cache_seconds
+        self.write_lock_timeout_ms = write_lock_timeout_ms
+        self.min_free_disk_mb = min_free_disk_mb
+        self._result = None
+        self._checked_at = None
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def init_app(cls, app):
+        """
+        Attach a checker to the application
+        
+        Args:
+            app (Flask): Flask application instance
+        """
+        app.extensions[cls.EXTENSION_KEY] = cls(
+            app.config['HEALTH_CHECK_CACHE_SECONDS'],
+            app.config['HEALTH_WRITE_LOCK_TIMEOUT_MS'],
+            app.config['HEALTH_MIN_FREE_DISK_MB']
+        )
+    
+    @classmethod
+    def current(cls):
+        """
+        Get the checker of the current application
+        
+        Returns:
+            HealthChecker or None: None outside an app context
+        """
+        if not has_app_context():
+            return None
+        return current_app.extensions.get(cls.EXTENSION_KEY)
+    
+    def readiness(self):
+        """
+        Get the readiness of this worker, probing again once the cached
+        result is older than cache_seconds
+        
+        Returns:
+            dict: ready flag, per-probe results, pool occupancy, active
+                session count and the age of the result in seconds
+        """
+        with self._lock:
+            if self._is_stale():
+                self._result = self._probe()
+                self._checked_at = time.monotonic()
+            result, checked_at = self._result, self._checked_at
+        return dict(result, age_seconds=round(time.monotonic() - checked_at, 3))
+    
+    def _is_stale(self):
+        """
+        Check whether the probes must run again
+        Encapsulation: Private method
+        """
+        if self._checked_at is None:
+            return True
+        return time.monotonic() - self._checked_at >= self.cache_seconds
+    
+    def _probe(self):
+        """
+        Run every probe
+        Encapsulation: Private method
+        
+        Returns:
+            dict: Readiness result (without its age)
+        """
+        engines = DatabaseProfile.engines()
+        checks = {}
+        for name, engine in engines.items():
+            checks['database' if name == 'primary' else f'{name}_database'] = \
+                self._run(self._check_round_trip, engine)
+        checks['write_lock'] = self._run(self._check_write_lock, engines['primary'])
+        checks['disk'] = self._run(self._check_disk, engines['primary'])
+        checks['session_store'] = self._run(self._check_session_store)
+        
+        return {
+            'ready': all(check['ok'] for check in checks.values()),
+            'checks': checks,
+            'pools': {name: DatabaseProfile.pool_status(engine) for name, engine in engines.items()},
+            'active_sessions': checks['session_store'].pop('active_sessions', None)
+        }
+    
+    @staticmethod
+    def _run(probe, *args):
+        """
+        Run one probe, timing it and turning exceptions into a failure
+        Encapsulation: Private method
+        
+        Returns:
+            dict: ok flag, milliseconds, error (on failure) and probe details
+        """
+        started = time.perf_counter()
+        try:
+            details = probe(*args) or {}
+            result = {'ok': True}
+        except Exception as error:
+            # Report the driver's error rather than SQLAlchemy's wrapper text
+            error = getattr(error, 'orig', None) or error
+            details = {}
+            result = {'ok': False, 'error': f'{type(error).__name__}: {error}'}
+        result['ms'] = round((time.perf_counter() - started) * 1000, 2)
+        result.update(details)
+        return result
+    
+    @staticmethod
+    def _check_round_trip(engine):
+        """
+        Run a trivial query
+        Encapsulation: Private method
+        """
+        with engine.connect() as conn:
+            conn.execute(text('SELECT 1')).scalar()
+    
+    def _check_write_lock(self, engine):
+        """
+        Take and release SQLite's write lock (skipped for other databases)
+        Encapsulation: Private method
+        
+        Raises:
+            OperationalError: If another connection holds the lock past the timeout
+        """
+        if engine.dialect.name != 'sqlite':
+            return {'skipped': True}
+        
+        with engine.connect() as conn:
+            busy_timeout = conn.exec_driver_sql('PRAGMA busy_timeout').scalar()
+            conn.exec_driver_sql(f'PRAGMA busy_timeout = {int(self.write_lock_timeout_ms)}')
+            try:
+                conn.exec_driver_sql('BEGIN IMMEDIATE')
+                conn.rollback()
+            finally:
+                # The connection goes back to the application's pool
+                conn.exec_driver_sql(f'PRAGMA busy_timeout = {busy_timeout}')
+    
+    def _check_disk(self, engine):
+        """
+        Check the free space of the SQLite file's filesystem (skipped for
+        other and in-memory databases)
+        Encapsulation: Private method
+        
+        Raises:
+            OSError: If the free space is below min_free_disk_mb
+        """
+        path = engine.url.database if engine.dialect.name == 'sqlite' else None
+        if not path or path == ':memory:' or path.startswith('file:'):
+            return {'skipped': True}
+        
+        free_mb = shutil.disk_usage(os.path.dirname(os.path.abspath(path))).free / (1024 * 1024)
+        if free_mb < self.min_free_disk_mb:
+            raise OSError(f'{free_mb:.0f} MB free, below {self.min_free_disk_mb} MB')
+        return {'free_mb': round(free_mb)}
+    
+    @staticmethod
+    def _check_session_store():
+        """
+        Count the active sessions through the configured token store
+        Encapsulation: Private method
+        """
+        return {'active_sessions': SessionStore.current().count()}
@@ -0,0 +1,275 @@
+"""
+Query Instrumentation Service
+Measures the SQL issued by each request with OOP principles:
+- Single Responsibility: Counts, times and reports statements per request
+- Encapsulation: Engine events and request hooks are registered by init_app()
+"""
+import contextvars
+import logging
+import os
+import time
+from collections import Counter
+from logging.handlers import RotatingFileHandler
+from flask import current_app, has_app_context, request
+from sqlalchemy import event
+from models import db
+from services.database_profile import DatabaseProfile
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger(f'{__name__}.slow')
+
+# Statistics of the request being handled (None outside requests)
+_current_stats = contextvars.ContextVar('query_stats', default=None)
+
+
+class QueryStats:
+    """
+    Statements issued while handling one request
+    """
+    
+    def __init__(self, route):
+        """
+        Initialize empty statistics
+        
+        Args:
+            route (str): Method and endpoint (path when no route matched)
+        """
+        self.route = route
+        self.count = 0
+        self.seconds = 0.0
+        self.statements = Counter()
+    
+    def record(self, statement, seconds):
+        """
+        Record one executed statement
+        
+        Args:
+            statement (str): SQL text (without bound parameters)
+            seconds (float): Execution time
+        """
+        self.count += 1
+        self.seconds += seconds
+        self.statements[statement] += 1
+    
+    def repeated(self, threshold):
+        """
+        Find statements run at least threshold times (likely N+1 queries)
+        
+        Args:
+            threshold (int): Minimum number of executions
+        
+        Returns:
+            list: (statement, executions) tuples, most executed first
+        """
+        return [
+            (statement, executions)
+            for statement, executions in self.statements.most_common()
+            if executions >= threshold
+        ]
+
+
+class QueryInstrumentation:
+    """
+    Service class instrumenting the SQL of every request
+    
+    Cursor execute events of the primary and read engines time each
+    statement. Per request, the statement count and database time are
+    added as a Server-Timing entry (and as X-DB-* headers with
+    SQL_DEBUG_HEADERS). Identical statements run SQL_REPEATED_STATEMENT_THRESHOLD
+    times or more in one request are logged as likely N+1 queries.
+    Statements slower than SQL_SLOW_QUERY_MS are written, with their bound
+    parameters and the route that ran them, to the slow query log
+    (SQL_SLOW_QUERY_LOG, rotated by size).
+    """
+    
+    EXTENSION_KEY = 'query_instrumentation'
+    
+    # Longest parameter representation written to the slow query log
+    MAX_PARAMETERS_LENGTH = 1000
+    
+    def __init__(self, slow_query_seconds, repeated_threshold, debug_headers):
+        """
+        Initialize the instrumentation
+        
+        Args:
+            slow_query_seconds (float): Slow statement threshold (None disables the log)
+            repeated_threshold (int): Executions flagged as N+1 (0 disables detection)
+            debug_headers (bool): Add X-DB-* headers to responses
+        """
+        self.slow_query_seconds = slow_query_seconds
+        self.repeated_threshold = repeated_threshold
+        self.debug_headers = debug_headers
+    
+    @classmethod
+    def init_app(cls, app):
+        """
+        Attach the instrumentation to the application if enabled
+        Must run after DatabaseProfile.init_app() so the read engine exists
+        
+        Args:
+            app (Flask): Flask application instance
+        """
+        if not app.config.get('SQL_INSTRUMENTATION_ENABLED'):
+            return
+        
+        slow_query_ms = app.config['SQL_SLOW_QUERY_MS']
+        instrumentation = cls(
+            slow_query_ms / 1000 if slow_query_ms else None,
+            app.config['SQL_REPEATED_STATEMENT_THRESHOLD'],
+            app.config['SQL_DEBUG_HEADERS']
+        )
+        app.extensions[cls.EXTENSION_KEY] = instrumentation
+        
+        if app.config['SQL_SLOW_QUERY_LOG']:
+            cls._add_log_file(
+                app.config['SQL_SLOW_QUERY_LOG'],
+                app.config['SQL_SLOW_QUERY_LOG_MAX_BYTES'],
+                app.config['SQL_SLOW_QUERY_LOG_BACKUPS']
+            )
+        
+        app.before_request(instrumentation._before_request)
+        app.after_request(instrumentation._after_request)
+        app.teardown_request(instrumentation._teardown_request)
+        
+        with app.app_context():
+            instrumentation._watch_engine(db.engine)
+            profile = DatabaseProfile.current()
+            if profile is not None and profile.read_engine is not None:
+                instrumentation._watch_engine(profile.read_engine)
+    
+    @classmethod
+    def current(cls):
+        """
+        Get the instrumentation of the current application
+        
+        Returns:
+            QueryInstrumentation or None: None when disabled or outside an app context
+        """
+        if not has_app_context():
+            return None
+        return current_app.extensions.get(cls.EXTENSION_KEY)
+    
+    @staticmethod
+    def request_stats():
+        """
+        Get the statement statistics of the current request
+        
+        Returns:
+            QueryStats or None: None outside an instrumented request
+        """
+        return _current_stats.get()
+    
+    def _watch_engine(self, engine):
+        """
+        Time every statement run by an engine
+        Encapsulation: Private method
+        
+        Args:
+            engine (Engine): Engine to instrument
+        """
+        event.listen(engine, 'before_cursor_execute', self._before_execute)
+        event.listen(engine, 'after_cursor_execute', self._after_execute)
+    
+    @staticmethod
+    def _before_execute(conn, cursor, statement, parameters, context, executemany):
+        """
+        Remember when a statement started (on its execution context, so a
+        failed statement leaves nothing behind)
+        Encapsulation: Private method
+        """
+        if context is not None:
+            context.query_started = time.perf_counter()
+    
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        """
+        Record a finished statement and log it if it was slow
+        Encapsulation: Private method
+        """
+        started = getattr(context, 'query_started', None)
+        if started is None:
+            return
+        seconds = time.perf_counter() - started
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(statement, seconds)
+        if self.slow_query_seconds is not None and seconds >= self.slow_query_seconds:
+            self._log_slow_query(statement, parameters, seconds, stats)
+    
+    def _log_slow_query(self, statement, parameters, seconds, stats):
+        """
+        Write a slow statement to the slow query log
+        Encapsulation: Private method
+        """
+        parameters = repr(parameters)
+        if len(parameters) > self.MAX_PARAMETERS_LENGTH:
+            parameters = parameters[:self.MAX_PARAMETERS_LENGTH] + '...'
+        slow_query_logger.warning(
+            '%.1fms route=%s statement=%s parameters=%s',
+            seconds * 1000,
+            stats.route if stats is not None else '-',
+            ' '.join(statement.split()),
+            parameters
+        )
+    
+    def _before_request(self):
+        """
+        Start collecting statements for a request
+        Encapsulation: Private method
+        """
+        route = f'{request.method} {request.endpoint or request.path}'
+        _current_stats.set(QueryStats(route))
+    
+    def _after_request(self, response):
+        """
+        Report the request's statements in headers and flag repeated ones
+        Encapsulation: Private method
+        """
+        stats = _current_stats.get()
+        if stats is None:
+            return response
+        
+        milliseconds = stats.seconds * 1000
+        timing = f'db;dur={milliseconds:.1f};desc="{stats.count} queries"'
+        existing = response.headers.get('Server-Timing')
+        response.headers['Server-Timing'] = f'{existing}, {timing}' if existing else timing
+        
+        repeated = stats.repeated(self.repeated_threshold) if self.repeated_threshold else []
+        for statement, executions in repeated:
+            logger.warning(
+                'Statement ran %d times in one request (possible N+1) route=%s statement=%s',
+                executions, stats.route, ' '.join(statement.split())
+            )
+        
+        if self.debug_headers:
+            response.headers['X-DB-Query-Count'] = str(stats.count)
+            response.headers['X-DB-Time-Ms'] = f'{milliseconds:.1f}'
+            response.headers['X-DB-Repeated-Statements'] = str(len(repeated))
+        return response
+    
+    def _teardown_request(self, error=None):
+        """
+        Stop collecting statements for the request
+        Encapsulation: Private method
+        """
+        _current_stats.set(None)
+    
+    @staticmethod
+    def _add_log_file(path, max_bytes, backups):
+        """
+        Send the slow query log to a rotating file (once per path)
+        Encapsulation: Private method
+        
+        Args:
+            path (str): Log file path
+            max_bytes (int): Size at which the file is rotated
+            backups (int): Rotated files kept
+        """
+        path = os.path.abspath(path)
+        for handler in slow_query_logger.handlers:
+            if isinstance(handler, RotatingFileHandler) and handler.baseFilename == path:
+                return
+        
+        handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups)
+        handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+        slow_query_logger.addHandler(handler)
+        slow_query_logger.setLevel(logging.WARNING)
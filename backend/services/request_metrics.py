@@ -0,0 +1,191 @@
+"""
+Request Metrics Service
+Collects Prometheus metrics for the application with OOP principles:
+- Single Responsibility: Records request, session and connection pool metrics
+- Encapsulation: Hooks and pool listeners are registered by init_app()
+"""
+import time
+from flask import current_app, g, has_app_context, request
+from sqlalchemy import event
+from models import db
+from services.database_profile import DatabaseProfile
+from utils.metrics import Counter, Gauge, Histogram
+
+
+class RequestMetrics:
+    """
+    Service class holding the metrics served by GET /api/metrics
+    
+    before_request/after_request/teardown_request hooks count requests per
+    blueprint, endpoint, method and status, observe their latency and track
+    the requests in flight. Pool event listeners count connection checkouts
+    and new connections of the primary and read engines. Gauges that are
+    cheap to read (pool occupancy, active sessions) are sampled at scrape
+    time instead of being kept current.
+    
+    Metrics live in each worker process; Prometheus should scrape every
+    worker (or aggregate by instance).
+    """
+    
+    EXTENSION_KEY = 'request_metrics'
+    
+    # Prometheus text exposition format
+    CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+    
+    # Label used for requests that matched no route
+    UNMATCHED = '<unmatched>'
+    
+    def __init__(self, buckets):
+        """
+        Initialize empty metrics
+        
+        Args:
+            buckets (tuple): Latency histogram bucket bounds in seconds
+        """
+        self.requests = Counter(
+            'http_requests_total', 'HTTP requests handled.',
+            ('blueprint', 'endpoint', 'method', 'status')
+        )
+        self.latency = Histogram(
+            'http_request_duration_seconds', 'Time spent handling HTTP requests.',
+            ('blueprint', 'endpoint', 'method'), buckets
+        )
+        self.in_flight = Gauge(
+            'http_requests_in_flight', 'HTTP requests being handled.',
+            ('blueprint', 'endpoint')
+        )
+        self.pool_checkouts = Counter(
+            'db_pool_checkouts_total', 'Connections checked out of the pool.', ('engine',)
+        )
+        self.pool_connects = Counter(
+            'db_pool_connects_total', 'New database connections opened.', ('engine',)
+        )
+        self.engines = {}
+    
+    @classmethod
+    def init_app(cls, app):
+        """
+        Attach metrics to the application and register the request hooks
+        Must run after DatabaseProfile.init_app() so the read engine exists
+        
+        Args:
+            app (Flask): Flask application instance
+        """
+        if not app.config.get('METRICS_ENABLED'):
+            return
+        
+        metrics = cls(app.config['METRICS_LATENCY_BUCKETS'])
+        app.extensions[cls.EXTENSION_KEY] = metrics
+        
+        app.before_request(metrics._before_request)
+        app.after_request(metrics._after_request)
+        app.teardown_request(metrics._teardown_request)
+        
+        with app.app_context():
+            metrics._watch_engine('primary', db.engine)
+            profile = DatabaseProfile.current()
+            if profile is not None and profile.read_engine is not None:
+                metrics._watch_engine('read', profile.read_engine)
+    
+    @classmethod
+    def current(cls):
+        """
+        Get the metrics of the current application
+        
+        Returns:
+            RequestMetrics or None: None when disabled or outside an app context
+        """
+        if not has_app_context():
+            return None
+        return current_app.extensions.get(cls.EXTENSION_KEY)
+    
+    def render(self, active_sessions=None, startup_phases=None):
+        """
+        Render every metric in the Prometheus text format
+        
+        Args:
+            active_sessions (int): Active session count, or None to omit it
+            startup_phases (dict): Seconds per application startup phase
+                (StartupTimer.phases), or None to omit them
+        
+        Returns:
+            str: Exposition text
+        """
+        pool_state = Gauge(
+            'db_pool_connections', 'Pooled connections by state.', ('engine', 'state')
+        )
+        for name, engine in self.engines.items():
+            for state, count in (DatabaseProfile.pool_status(engine) or {}).items():
+                pool_state.set((name, state), count)
+        
+        families = [
+            self.requests, self.latency, self.in_flight,
+            self.pool_checkouts, self.pool_connects, pool_state
+        ]
+        if active_sessions is not None:
+            sessions = Gauge('auth_active_sessions', 'Unexpired login sessions.')
+            sessions.set((), active_sessions)
+            families.append(sessions)
+        if startup_phases:
+            startup = Gauge(
+                'app_startup_seconds', 'Time spent creating the application, by phase.', ('phase',)
+            )
+            for phase, seconds in startup_phases.items():
+                startup.set((phase,), seconds)
+            families.append(startup)
+        
+        lines = []
+        for family in families:
+            lines.extend(family.render())
+        return '\n'.join(lines) + '\n'
+    
+    def _labels(self):
+        """
+        Get the blueprint and endpoint labels of the current request
+        Encapsulation: Private method
+        """
+        return request.blueprint or '', request.endpoint or self.UNMATCHED
+    
+    def _before_request(self):
+        """
+        Start timing a request
+        Encapsulation: Private method
+        """
+        labels = self._labels()
+        g.metrics_started = (time.perf_counter(), labels)
+        self.in_flight.inc(labels)
+    
+    def _after_request(self, response):
+        """
+        Count a finished request and observe its latency
+        Encapsulation: Private method
+        """
+        started = g.get('metrics_started')
+        if started is not None:
+            started_at, (blueprint, endpoint) = started
+            method = request.method
+            self.requests.inc((blueprint, endpoint, method, str(response.status_code)))
+            self.latency.observe((blueprint, endpoint, method), time.perf_counter() - started_at)
+        return response
+    
+    def _teardown_request(self, error=None):
+        """
+        Stop tracking a request as in flight (runs even when it failed)
+        Encapsulation: Private method
+        """
+        started = g.pop('metrics_started', None)
+        if started is not None:
+            self.in_flight.dec(started[1])
+    
+    def _watch_engine(self, name, engine):
+        """
+        Count checkouts and new connections of an engine's pool
+        Encapsulation: Private method
+        
+        Args:
+            name (str): Engine label
+            engine (Engine): Engine to watch
+        """
+        self.engines[name] = engine
+        event.listen(engine, 'checkout', lambda *args: self.pool_checkouts.inc((name,)))
+        event.listen(engine, 'connect', lambda *args: self.pool_connects.inc((name,)))
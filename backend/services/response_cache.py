@@ -0,0 +1,117 @@
+"""
+Response Cache Service
+Implements caching of public experience reads with OOP principles:
+- Single Responsibility: Decides what is cached and when it is invalidated
+- Encapsulation: Cache keys and storage are hidden from the service layer
+"""
+import threading
+from flask import current_app
+from utils.cache import LRUCache
+
+
+class ResponseCache:
+    """
+    Service class caching experience list and detail results
+    
+    List results are keyed by the shared dataset version and their
+    normalized query parameters. Detail results are keyed by experience ID
+    and stored with the experience's entity tag, which must still match for
+    the entry to be reused. Both validators live in the database, so a write
+    made by another worker misses this worker's cache right away. Local
+    writes also clear the list cache and drop the changed detail entry.
+    """
+    
+    EXTENSION_KEY = 'response_cache'
+    
+    def __init__(self, max_entries, ttl):
+        """
+        Initialize list and detail caches
+        
+        Args:
+            max_entries (int): Maximum entries per cache
+            ttl (float): Seconds an entry stays valid
+        """
+        self.lists = LRUCache(max_entries, ttl)
+        self.details = LRUCache(max_entries, ttl)
+        
+        # Bumped on every invalidation so a read that raced with a write
+        # does not store a result computed before the write. The check in
+        # store() and the bump in invalidate_experience() hold the same lock
+        self.generation = 0
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def init_app(cls, app):
+        """
+        Attach a cache to the application if enabled in configuration
+        
+        Args:
+            app (Flask): Flask application instance
+        """
+        if app.config.get('RESPONSE_CACHE_ENABLED'):
+            app.extensions[cls.EXTENSION_KEY] = cls(
+                app.config['RESPONSE_CACHE_MAX_ENTRIES'],
+                app.config['RESPONSE_CACHE_TTL']
+            )
+    
+    @classmethod
+    def current(cls):
+        """
+        Get the cache of the current application
+        
+        Returns:
+            ResponseCache or None: None when caching is disabled
+        """
+        return current_app.extensions.get(cls.EXTENSION_KEY)
+    
+    @staticmethod
+    def list_key(**params):
+        """
+        Build a list cache key from normalized query parameters
+        
+        Args:
+            **params: Normalized get_experiences parameters
+        
+        Returns:
+            tuple: Hashable key independent of argument order
+        """
+        return tuple(sorted(params.items()))
+    
+    def store(self, cache, key, value, generation):
+        """
+        Store a result unless a write happened since it was read
+        
+        Args:
+            cache (LRUCache): self.lists or self.details
+            key: Cache key
+            value: Result to store
+            generation (int): self.generation observed before the read
+        """
+        with self._lock:
+            if generation == self.generation:
+                cache.set(key, value)
+    
+    def invalidate_experience(self, experience_id=None):
+        """
+        Invalidate everything a write to one experience can affect
+        
+        Args:
+            experience_id (int): Changed experience ID (None for new rows)
+        """
+        with self._lock:
+            self.generation += 1
+            self.lists.clear()
+            if experience_id is not None:
+                self.details.invalidate(experience_id)
+    
+    def stats(self):
+        """
+        Get counters of both caches (for monitoring)
+        
+        Returns:
+            dict: Stats for the list and detail caches
+        """
+        return {
+            'lists': self.lists.stats(),
+            'details': self.details.stats()
+        }
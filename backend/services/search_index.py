@@ -0,0 +1,190 @@
+"""
+Search Index Service
+Implements full-text search over experiences with OOP principles:
+- Single Responsibility: Owns the SQLite FTS5 index and its query syntax
+- Encapsulation: Callers never deal with FTS5 DDL or MATCH expressions
+"""
+import re
+import weakref
+from sqlalchemy import table, column, select, text
+from sqlalchemy.exc import OperationalError
+
+
+class SearchIndex:
+    """
+    Service class for the experience full-text index
+    
+    The index is an external-content FTS5 table over job_title,
+    company_name and experience_description. Triggers on the experience
+    table keep it in sync inside the same transaction as every insert,
+    update and delete, so no service code has to maintain it by hand.
+    On databases without FTS5 (non-SQLite URIs, or SQLite builds without
+    the extension) is_enabled() is False and callers fall back to ILIKE.
+    """
+    
+    TABLE_NAME = 'experience_fts'
+    
+    # Lightweight table construct for use in queries (not part of metadata,
+    # so db.create_all() never tries to create it as a regular table)
+    fts = table(TABLE_NAME, column('rowid'), column(TABLE_NAME), column('rank'))
+    
+    # Name of the CTE built by matches(), for ordering by its rank
+    MATCHES_NAME = 'fts_match'
+    matched = table(MATCHES_NAME, column('rowid'), column('rank'))
+    
+    # Column weights for BM25 ranking: job_title, company_name, description
+    RANK_FUNCTION = 'bm25(10.0, 5.0, 1.0)'
+    
+    _DDL = [
+        f"""CREATE VIRTUAL TABLE {TABLE_NAME} USING fts5(
+            job_title, company_name, experience_description,
+            content='experience', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )""",
+        f"""CREATE TRIGGER {TABLE_NAME}_ai AFTER INSERT ON experience BEGIN
+            INSERT INTO {TABLE_NAME}(rowid, job_title, company_name, experience_description)
+            VALUES (new.id, new.job_title, new.company_name, new.experience_description);
+        END""",
+        f"""CREATE TRIGGER {TABLE_NAME}_ad AFTER DELETE ON experience BEGIN
+            INSERT INTO {TABLE_NAME}({TABLE_NAME}, rowid, job_title, company_name, experience_description)
+            VALUES ('delete', old.id, old.job_title, old.company_name, old.experience_description);
+        END""",
+        f"""CREATE TRIGGER {TABLE_NAME}_au
+        AFTER UPDATE OF job_title, company_name, experience_description ON experience BEGIN
+            INSERT INTO {TABLE_NAME}({TABLE_NAME}, rowid, job_title, company_name, experience_description)
+            VALUES ('delete', old.id, old.job_title, old.company_name, old.experience_description);
+            INSERT INTO {TABLE_NAME}(rowid, job_title, company_name, experience_description)
+            VALUES (new.id, new.job_title, new.company_name, new.experience_description);
+        END""",
+        f"INSERT INTO {TABLE_NAME}({TABLE_NAME}, rank) VALUES ('rank', '{RANK_FUNCTION}')",
+        f"INSERT INTO {TABLE_NAME}({TABLE_NAME}) VALUES ('rebuild')",
+    ]
+    
+    # Whether each engine has a usable index (checked once per engine)
+    _enabled = weakref.WeakKeyDictionary()
+    
+    @classmethod
+    def install(cls, engine, enabled):
+        """
+        Create the FTS5 table and sync triggers if they do not exist yet
+        Existing rows are indexed once when the table is first created
+        
+        Args:
+            engine: SQLAlchemy engine
+            enabled (bool): The application's FULL_TEXT_SEARCH_ENABLED setting
+        
+        Returns:
+            bool: True if full-text search is available on this engine
+        """
+        if not enabled or engine.dialect.name != 'sqlite':
+            cls._enabled[engine] = False
+            return False
+        
+        try:
+            with engine.begin() as conn:
+                if not cls._table_exists(conn):
+                    for statement in cls._DDL:
+                        conn.execute(text(statement))
+        except OperationalError:
+            # SQLite compiled without FTS5
+            cls._enabled[engine] = False
+            return False
+        
+        cls._enabled[engine] = True
+        return True
+    
+    @classmethod
+    def uninstall(cls, engine):
+        """
+        Drop the FTS5 table and its sync triggers
+        Bulk loaders use this to insert rows without per-row index updates,
+        then call install() to index everything in one pass
+        
+        Args:
+            engine: SQLAlchemy engine
+        """
+        if engine.dialect.name != 'sqlite':
+            return
+        with engine.begin() as conn:
+            for suffix in ('ai', 'ad', 'au'):
+                conn.execute(text(f'DROP TRIGGER IF EXISTS {cls.TABLE_NAME}_{suffix}'))
+            conn.execute(text(f'DROP TABLE IF EXISTS {cls.TABLE_NAME}'))
+        cls._enabled[engine] = False
+    
+    @classmethod
+    def is_enabled(cls, engine, enabled):
+        """
+        Check whether full-text search can be used on an engine
+        
+        Args:
+            engine: SQLAlchemy engine
+            enabled (bool): The application's FULL_TEXT_SEARCH_ENABLED setting
+        
+        Returns:
+            bool: True if search is enabled and the FTS5 index exists
+        """
+        if not enabled:
+            return False
+        if engine not in cls._enabled:
+            available = engine.dialect.name == 'sqlite'
+            if available:
+                with engine.connect() as conn:
+                    available = cls._table_exists(conn)
+            cls._enabled[engine] = available
+        return cls._enabled[engine]
+    
+    @staticmethod
+    def match_expression(search):
+        """
+        Convert a user search term into an FTS5 MATCH expression
+        Every word must match as a prefix, so partially typed words in the
+        feed search box still find results
+        
+        Args:
+            search (str): Raw search term
+        
+        Returns:
+            str or None: MATCH expression, or None if the term has no words
+        """
+        words = re.findall(r'\w+', search or '')
+        if not words:
+            return None
+        return ' '.join(f'"{word}"*' for word in words)
+    
+    @classmethod
+    def matches(cls, search):
+        """
+        Build a subquery of the rows matching a search term
+        
+        Joining experience against this materialized CTE (rather than
+        against the FTS table itself) runs the MATCH exactly once: with
+        another filter on experience, SQLite would otherwise put the virtual
+        table inside the loop and re-run the MATCH once per candidate row
+        (a plain subquery is flattened back into that plan).
+        
+        Args:
+            search (str): Raw search term
+        
+        Returns:
+            CTE: rowid and rank of each match, named MATCHES_NAME
+        """
+        return select(cls.fts.c.rowid, cls.fts.c.rank).where(
+            cls.fts.c[cls.TABLE_NAME].op('MATCH')(cls.match_expression(search))
+        ).cte(cls.MATCHES_NAME).prefix_with('MATERIALIZED')
+    
+    @classmethod
+    def _table_exists(cls, conn):
+        """
+        Check whether the FTS5 table exists
+        Encapsulation: Private method
+        
+        Args:
+            conn: SQLAlchemy connection
+        
+        Returns:
+            bool: True if the table exists
+        """
+        return conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {'name': cls.TABLE_NAME}
+        ).first() is not None
@@ -0,0 +1,389 @@
+"""
+Session Store Service
+Implements pluggable login session storage with OOP principles:
+- Abstraction: AuthService talks to one SessionBackend interface
+- Polymorphism: In-memory, SQL and cached backends are interchangeable
+- Encapsulation: Tokens are hashed before they are stored or cached
+"""
+import hashlib
+import logging
+from abc import ABC, abstractmethod
+import secrets
+import threading
+from datetime import datetime, timedelta
+from flask import current_app
+from models import db, UserSession
+from utils.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+class SessionBackend(ABC):
+    """
+    Abstract base class for session storage backends
+    
+    Backends receive token hashes (see hash_token), never raw tokens, and
+    must be safe to call from several request threads at once.
+    """
+    
+    @staticmethod
+    def hash_token(token):
+        """
+        Hash a bearer token for storage and lookup
+        
+        Args:
+            token (str): Raw session token
+        
+        Returns:
+            str: SHA-256 hex digest
+        """
+        return hashlib.sha256(token.encode()).hexdigest()
+    
+    @abstractmethod
+    def create(self, token_hash, user_id, expires_at):
+        """Store a session"""
+    
+    @abstractmethod
+    def get(self, token_hash):
+        """
+        Look up an unexpired session
+        
+        Returns:
+            tuple or None: (user_id, expires_at) if the session is valid
+        """
+    
+    @abstractmethod
+    def delete(self, token_hash):
+        """Remove a session"""
+    
+    @abstractmethod
+    def purge_expired(self):
+        """
+        Remove expired sessions
+        
+        Returns:
+            int: Number of sessions removed
+        """
+    
+    @abstractmethod
+    def count(self):
+        """
+        Count unexpired sessions
+        
+        Returns:
+            int: Number of active sessions
+        """
+
+
+class MemorySessionBackend(SessionBackend):
+    """
+    Process-local session backend (single worker, development and testing)
+    """
+    
+    def __init__(self):
+        """Initialize an empty session table"""
+        self._sessions = {}
+        self._lock = threading.Lock()
+    
+    def create(self, token_hash, user_id, expires_at):
+        with self._lock:
+            self._sessions[token_hash] = (user_id, expires_at)
+    
+    def get(self, token_hash):
+        with self._lock:
+            session = self._sessions.get(token_hash)
+        if session is None or session[1] <= datetime.utcnow():
+            return None
+        return session
+    
+    def delete(self, token_hash):
+        with self._lock:
+            self._sessions.pop(token_hash, None)
+    
+    def purge_expired(self):
+        now = datetime.utcnow()
+        with self._lock:
+            expired = [key for key, (_, expires_at) in self._sessions.items() if expires_at <= now]
+            for key in expired:
+                del self._sessions[key]
+        return len(expired)
+    
+    def count(self):
+        now = datetime.utcnow()
+        with self._lock:
+            return sum(1 for _, expires_at in self._sessions.values() if expires_at > now)
+
+
+class SQLSessionBackend(SessionBackend):
+    """
+    Session backend on the user_session table
+    
+    Shared by every worker using the same database, and survives restarts.
+    Each call runs in its own short transaction on the engine, so session
+    writes never commit or roll back the caller's ORM session.
+    """
+    
+    def __init__(self, engine):
+        """
+        Initialize the backend
+        
+        Args:
+            engine: SQLAlchemy engine holding the user_session table
+        """
+        self.engine = engine
+        self.table = UserSession.__table__
+    
+    def create(self, token_hash, user_id, expires_at):
+        with self.engine.begin() as conn:
+            conn.execute(self.table.insert().values(
+                token_hash=token_hash,
+                user_id=user_id,
+                created_at=datetime.utcnow(),
+                expires_at=expires_at
+            ))
+    
+    def get(self, token_hash):
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                db.select(self.table.c.user_id, self.table.c.expires_at).where(
+                    self.table.c.token_hash == token_hash,
+                    self.table.c.expires_at > datetime.utcnow()
+                )
+            ).first()
+        return tuple(row) if row is not None else None
+    
+    def delete(self, token_hash):
+        with self.engine.begin() as conn:
+            conn.execute(self.table.delete().where(self.table.c.token_hash == token_hash))
+    
+    def purge_expired(self):
+        with self.engine.begin() as conn:
+            result = conn.execute(
+                self.table.delete().where(self.table.c.expires_at <= datetime.utcnow())
+            )
+        return result.rowcount
+    
+    def count(self):
+        with self.engine.connect() as conn:
+            return conn.execute(
+                db.select(db.func.count()).select_from(self.table).where(
+                    self.table.c.expires_at > datetime.utcnow()
+                )
+            ).scalar()
+
+
+class CachedSessionBackend(SessionBackend):
+    """
+    Bounded in-process LRU in front of another backend
+    
+    Saves a database round-trip on every authenticated request. A logout
+    handled by another worker is noticed once the cached entry's TTL runs
+    out, so keep SESSION_CACHE_TTL short. Within this process a lookup
+    that raced with a logout is not cached (see generation).
+    """
+    
+    def __init__(self, backend, max_entries, ttl):
+        """
+        Initialize the cache
+        
+        Args:
+            backend (SessionBackend): Backend holding the sessions
+            max_entries (int): Maximum number of cached sessions
+            ttl (float): Seconds a cached lookup is trusted
+        """
+        self.backend = backend
+        self.cache = LRUCache(max_entries, ttl)
+        # Incremented by every delete; a lookup only fills the cache if no
+        # delete finished while it was reading the backend
+        self.generation = 0
+        self._lock = threading.Lock()
+    
+    def create(self, token_hash, user_id, expires_at):
+        self.backend.create(token_hash, user_id, expires_at)
+        self.cache.set(token_hash, (user_id, expires_at))
+    
+    def get(self, token_hash):
+        session = self.cache.get(token_hash)
+        
+        if session is None:
+            generation = self.generation
+            session = self.backend.get(token_hash)
+            if session is None:
+                return None
+            with self._lock:
+                if generation == self.generation:
+                    self.cache.set(token_hash, session)
+        
+        if session[1] <= datetime.utcnow():
+            self.cache.invalidate(token_hash)
+            return None
+        return session
+    
+    def delete(self, token_hash):
+        self.backend.delete(token_hash)
+        with self._lock:
+            self.generation += 1
+            self.cache.invalidate(token_hash)
+    
+    def purge_expired(self):
+        return self.backend.purge_expired()
+    
+    def count(self):
+        return self.backend.count()
+
+
+class SessionSweeper(threading.Thread):
+    """
+    Background thread that periodically removes expired sessions
+    """
+    
+    def __init__(self, backend, interval):
+        """
+        Initialize the sweeper
+        
+        Args:
+            backend: Object with a purge_expired() method (a SessionBackend
+                or a RevocationList)
+            interval (float): Seconds between sweeps
+        """
+        super().__init__(name='session-sweeper', daemon=True)
+        self.backend = backend
+        self.interval = interval
+        self._stopped = threading.Event()
+    
+    def run(self):
+        """Purge expired sessions until stopped"""
+        while not self._stopped.wait(self.interval):
+            try:
+                removed = self.backend.purge_expired()
+                if removed:
+                    logger.info('Purged %d expired entries', removed)
+            except Exception:
+                logger.exception('Session sweep failed')
+    
+    def stop(self):
+        """Stop the sweeper after the current sweep"""
+        self._stopped.set()
+    
+    def restarted(self):
+        """
+        Start a new sweeper with the same backend and interval (a thread
+        cannot be started twice, and forked processes do not inherit threads)
+        
+        Returns:
+            SessionSweeper: Running sweeper
+        """
+        sweeper = SessionSweeper(self.backend, self.interval)
+        sweeper.start()
+        return sweeper
+
+
+class SessionStore:
+    """
+    Service class giving AuthService access to the configured backend
+    
+    Configuration:
+        SESSION_BACKEND: 'sql' (shared, persistent) or 'memory' (single process)
+        SESSION_TTL: Seconds a new session stays valid
+        SESSION_CACHE_MAX_ENTRIES / SESSION_CACHE_TTL: In-process LRU in front
+            of the SQL backend (set SESSION_CACHE_MAX_ENTRIES to 0 to disable)
+        SESSION_SWEEP_INTERVAL: Seconds between expired-session sweeps (0 disables)
+    """
+    
+    EXTENSION_KEY = 'session_store'
+    
+    def __init__(self, backend, ttl, sweeper=None):
+        """
+        Initialize the store
+        
+        Args:
+            backend (SessionBackend): Backend holding the sessions
+            ttl (float): Seconds a new session stays valid
+            sweeper (SessionSweeper): Background sweeper, if running
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self.sweeper = sweeper
+    
+    @classmethod
+    def init_app(cls, app):
+        """
+        Build the configured backend and attach it to the application
+        
+        Args:
+            app (Flask): Flask application instance
+        """
+        if app.config['SESSION_BACKEND'] == 'memory':
+            backend = MemorySessionBackend()
+        else:
+            with app.app_context():
+                backend = SQLSessionBackend(db.engine)
+            if app.config['SESSION_CACHE_MAX_ENTRIES']:
+                backend = CachedSessionBackend(
+                    backend,
+                    app.config['SESSION_CACHE_MAX_ENTRIES'],
+                    app.config['SESSION_CACHE_TTL']
+                )
+        
+        sweeper = None
+        if app.config['SESSION_SWEEP_INTERVAL']:
+            sweeper = SessionSweeper(backend, app.config['SESSION_SWEEP_INTERVAL'])
+            sweeper.start()
+        
+        app.extensions[cls.EXTENSION_KEY] = cls(backend, app.config['SESSION_TTL'], sweeper)
+    
+    @classmethod
+    def current(cls):
+        """
+        Get the session store of the current application
+        
+        Returns:
+            SessionStore: Configured store
+        """
+        return current_app.extensions[cls.EXTENSION_KEY]
+    
+    def issue(self, user_id):
+        """
+        Create a new session and return its token
+        
+        Args:
+            user_id (int): User ID
+        
+        Returns:
+            str: Random bearer token (only its hash is stored)
+        """
+        token = secrets.token_hex(32)
+        expires_at = datetime.utcnow() + timedelta(seconds=self.ttl)
+        self.backend.create(SessionBackend.hash_token(token), user_id, expires_at)
+        return token
+    
+    def get_user_id(self, token):
+        """
+        Resolve a token to its user
+        
+        Args:
+            token (str): Raw session token
+        
+        Returns:
+            int or None: User ID if the session exists and has not expired
+        """
+        session = self.backend.get(SessionBackend.hash_token(token))
+        return session[0] if session is not None else None
+    
+    def revoke(self, token):
+        """
+        Remove the session of a token
+        
+        Args:
+            token (str): Raw session token
+        """
+        self.backend.delete(SessionBackend.hash_token(token))
+    
+    def count(self):
+        """
+        Count active sessions
+        
+        Returns:
+            int: Number of unexpired sessions
+        """
+        return self.backend.count()
@@ -0,0 +1,236 @@
+"""
+Signed Token Store Service
+Implements stateless login tokens with OOP principles:
+- Polymorphism: Same interface as SessionStore, so AuthService is unchanged
+- Encapsulation: Revocations are cached in-process and refreshed incrementally
+"""
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from flask import current_app
+from sqlalchemy.exc import IntegrityError
+from models import db, RevokedToken
+from services.session_store import SessionSweeper
+from utils.token_signer import TokenSigner
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationList:
+    """
+    Process-local view of the revoked_token table
+    
+    Revocations are rare and tokens are checked on every request, so each
+    worker keeps the unexpired revoked token IDs in a dict and only asks the
+    database for rows added since its last refresh (at most once every
+    refresh_interval seconds). A logout in another worker is therefore
+    honoured here within refresh_interval seconds.
+    """
+    
+    def __init__(self, engine, refresh_interval):
+        """
+        Initialize the list
+        
+        Args:
+            engine: SQLAlchemy engine holding the revoked_token table
+            refresh_interval (float): Seconds between database refreshes
+        """
+        self.engine = engine
+        self.table = RevokedToken.__table__
+        self.refresh_interval = refresh_interval
+        self._revoked = {}
+        self._last_id = 0
+        self._next_refresh = 0.0
+        self._lock = threading.Lock()
+    
+    def revoke(self, token_id, expires):
+        """
+        Revoke a token until it expires
+        
+        Args:
+            token_id (str): Token ID embedded in the token
+            expires (int): Token expiry as a UNIX timestamp
+        """
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(self.table.insert().values(
+                    token_id=token_id,
+                    expires_at=datetime.utcfromtimestamp(expires)
+                ))
+        except IntegrityError:
+            # Already revoked (token_id is unique), e.g. by a concurrent
+            # logout of the same token in another worker
+            pass
+        with self._lock:
+            self._revoked[token_id] = expires
+    
+    def is_revoked(self, token_id):
+        """
+        Check whether a token has been revoked
+        
+        Args:
+            token_id (str): Token ID embedded in the token
+        
+        Returns:
+            bool: True if the token was revoked
+        """
+        if time.monotonic() >= self._next_refresh:
+            self._refresh()
+        return token_id in self._revoked
+    
+    def purge_expired(self):
+        """
+        Remove revocations of tokens that have expired anyway
+        
+        Returns:
+            int: Number of rows removed from the table
+        """
+        with self.engine.begin() as conn:
+            result = conn.execute(
+                self.table.delete().where(self.table.c.expires_at <= datetime.utcnow())
+            )
+        now = time.time()
+        with self._lock:
+            for token_id in [key for key, expires in self._revoked.items() if expires <= now]:
+                del self._revoked[token_id]
+        return result.rowcount
+    
+    def _refresh(self):
+        """
+        Load revocations added since the last refresh
+        Encapsulation: Private method
+        """
+        with self._lock:
+            if time.monotonic() < self._next_refresh:
+                return
+            with self.engine.connect() as conn:
+                rows = conn.execute(
+                    db.select(self.table.c.id, self.table.c.token_id, self.table.c.expires_at)
+                    .where(self.table.c.id > self._last_id)
+                    .order_by(self.table.c.id)
+                ).all()
+            for row_id, token_id, expires_at in rows:
+                self._revoked[token_id] = (expires_at - datetime(1970, 1, 1)).total_seconds()
+                self._last_id = row_id
+            self._next_refresh = time.monotonic() + self.refresh_interval
+
+
+class SignedTokenStore:
+    """
+    Token store issuing HMAC-signed tokens that verify without a lookup
+    
+    Selected with AUTH_TOKEN_MODE = 'signed'. Tokens carry the user ID and
+    expiry and are checked by computation alone, so workers share no session
+    state; logout records the token in the small revocation list.
+    
+    Configuration:
+        SECRET_KEY: Signing secret (must be identical on every worker)
+        SECRET_KEY_FALLBACKS: Previous secrets still accepted during rotation
+        SESSION_TTL: Seconds a new token stays valid
+        TOKEN_REVOCATION_REFRESH: Seconds between revocation list refreshes
+        SESSION_SWEEP_INTERVAL: Seconds between expired-revocation sweeps
+    """
+    
+    EXTENSION_KEY = 'session_store'
+    
+    def __init__(self, signer, revocations, ttl, sweeper=None):
+        """
+        Initialize the store
+        
+        Args:
+            signer (TokenSigner): Token signer
+            revocations (RevocationList): Revoked tokens
+            ttl (int): Seconds a new token stays valid
+            sweeper (SessionSweeper): Background sweeper, if running
+        """
+        self.signer = signer
+        self.revocations = revocations
+        self.ttl = ttl
+        self.sweeper = sweeper
+    
+    @classmethod
+    def init_app(cls, app):
+        """
+        Build the signer and revocation list and attach them to the application
+        
+        Args:
+            app (Flask): Flask application instance
+        """
+        if 'SECRET_KEY' not in os.environ and not app.testing:
+            logger.warning('SECRET_KEY is not set; signed tokens will not be '
+                           'accepted by other workers or after a restart')
+        
+        signer = TokenSigner([app.config['SECRET_KEY']] + list(app.config['SECRET_KEY_FALLBACKS']))
+        with app.app_context():
+            revocations = RevocationList(db.engine, app.config['TOKEN_REVOCATION_REFRESH'])
+        
+        sweeper = None
+        if app.config['SESSION_SWEEP_INTERVAL']:
+            sweeper = SessionSweeper(revocations, app.config['SESSION_SWEEP_INTERVAL'])
+            sweeper.start()
+        
+        app.extensions[cls.EXTENSION_KEY] = cls(signer, revocations, app.config['SESSION_TTL'], sweeper)
+    
+    @classmethod
+    def current(cls):
+        """
+        Get the token store of the current application
+        
+        Returns:
+            SignedTokenStore: Configured store
+        """
+        return current_app.extensions[cls.EXTENSION_KEY]
+    
+    def issue(self, user_id):
+        """
+        Issue a signed token
+        
+        Args:
+            user_id (int): User ID
+        
+        Returns:
+            str: Signed bearer token
+        """
+        return self.signer.sign(user_id, self.ttl)
+    
+    def get_user_id(self, token):
+        """
+        Resolve a token to its user
+        
+        Args:
+            token (str): Signed token
+        
+        Returns:
+            int or None: User ID if the token is valid, unexpired and not revoked
+        """
+        claims = self.signer.verify(token)
+        if claims is None:
+            return None
+        
+        user_id, _, token_id = claims
+        if self.revocations.is_revoked(token_id):
+            return None
+        return user_id
+    
+    def revoke(self, token):
+        """
+        Revoke a token until it expires
+        
+        Args:
+            token (str): Signed token
+        """
+        claims = self.signer.verify(token)
+        if claims is not None:
+            _, expires, token_id = claims
+            self.revocations.revoke(token_id, expires)
+    
+    def count(self):
+        """
+        Count active sessions
+        
+        Returns:
+            None: Signed tokens are not tracked, so the count is unknown
+        """
+        return None
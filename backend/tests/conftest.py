@@ -0,0 +1,93 @@
+"""
+Shared pytest fixtures
+
+Run from the backend directory:
+    python -m pytest -q
+"""
+import os
+import sys
+from datetime import date, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Importing the application module must not open the development database
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+from app import create_app
+from config import TestingConfig
+from models import db, User, Experience
+
+COMPANIES = ('Google', 'Meta', 'Amazon', 'Apple')
+DIFFICULTIES = ('Easy', 'Medium', 'Hard')
+
+
+def seed(app, experiences=30, users=3):
+    """
+    Insert users and experiences with predictable values
+    
+    Args:
+        app (Flask): Application whose database is seeded
+        experiences (int): Number of experiences
+        users (int): Number of authors (experiences are spread round-robin)
+    """
+    with app.app_context():
+        authors = []
+        for i in range(users):
+            user = User(username=f'user_{i}')
+            user.password_hash = 'not-a-login-account'
+            db.session.add(user)
+            authors.append(user)
+        db.session.flush()
+        
+        for i in range(experiences):
+            applied = date(2025, 1, 1) + timedelta(days=i)
+            db.session.add(Experience(
+                job_title=f'Engineer {i}',
+                company_name=COMPANIES[i % len(COMPANIES)],
+                experience_description=f'Interview number {i} about python and systems',
+                difficulty=DIFFICULTIES[i % len(DIFFICULTIES)],
+                offer_received=i % 3 == 0,
+                application_date=applied,
+                final_decision_date=applied + timedelta(days=i % 20),
+                user_id=authors[i % users].id
+            ))
+        db.session.commit()
+
+
+@pytest.fixture
+def make_app(monkeypatch):
+    """
+    Factory creating testing applications with configuration overrides
+    
+    Overrides are set on TestingConfig, so every application created by
+    one test shares them (e.g. two workers on one database file).
+    """
+    def factory(**overrides):
+        for name, value in overrides.items():
+            monkeypatch.setattr(TestingConfig, name, value, raising=False)
+        return create_app('testing')
+    return factory
+
+
+@pytest.fixture
+def app(make_app):
+    """Testing application on an in-memory database with seeded data"""
+    app = make_app()
+    seed(app)
+    return app
+
+
+@pytest.fixture
+def client(app):
+    """Test client of the seeded application"""
+    return app.test_client()
+
+
+@pytest.fixture
+def auth_headers(client):
+    """Authorization header of a newly registered user"""
+    response = client.post('/api/auth/register', json={
+        'username': 'tester', 'password': 'password123'
+    })
+    return {'Authorization': f"Bearer {response.get_json()['token']}"}
@@ -0,0 +1,86 @@
+"""
+Tests for the async read path (needs the optional asgiref, aiosqlite and
+greenlet packages)
+"""
+import asyncio
+import pytest
+
+pytest.importorskip('asgiref')
+pytest.importorskip('aiosqlite')
+pytest.importorskip('greenlet')
+
+import asgi
+from wsgi import LazyApplication
+from tests.conftest import seed
+
+
+def request(app, path, headers=(), method='GET'):
+    """
+    Send one bodiless request through an ASGI application
+    
+    Returns:
+        tuple: (status code, header dict, body bytes)
+    """
+    path, _, query = path.partition('?')
+    scope = {
+        'type': 'http', 'http_version': '1.1', 'method': method, 'scheme': 'http',
+        'path': path, 'root_path': '', 'query_string': query.encode(),
+        'headers': [(name.lower().encode(), value.encode()) for name, value in headers],
+        'client': ('127.0.0.1', 50000), 'server': ('testserver', 80)
+    }
+    messages = []
+    
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+    
+    async def send(message):
+        messages.append(message)
+    
+    asyncio.run(app(scope, receive, send))
+    start = messages[0]
+    headers = {name.decode(): value.decode() for name, value in start['headers']}
+    return start['status'], headers, b''.join(message.get('body', b'') for message in messages[1:])
+
+
+@pytest.fixture
+def file_app(make_app, tmp_path):
+    """Seeded testing application on a database file (aiosqlite opens it read-only)"""
+    app = make_app(SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'asgi.db'}")
+    seed(app)
+    return app
+
+
+@pytest.mark.parametrize('path', ['/api/experiences?per_page=5', '/api/experiences/3'])
+def test_read_round_trip_matches_wsgi(file_app, path):
+    async_app = asgi.AsyncReadApp(file_app)
+    expected = file_app.test_client().get(path)
+    
+    status, headers, body = request(async_app, path)
+    assert status == 200
+    assert body == expected.data
+    assert headers['etag'] == expected.headers['ETag']
+    
+    status, _, body = request(async_app, path, [('If-None-Match', headers['etag'])])
+    assert status == 304
+    assert body == b''
+
+
+def test_missing_experience(file_app):
+    status, _, _ = request(asgi.AsyncReadApp(file_app), '/api/experiences/999')
+    assert status == 404
+
+
+def test_other_routes_fall_back_to_wsgi(file_app):
+    status, _, body = request(asgi.AsyncReadApp(file_app), '/api/health/live')
+    assert status == 200
+    assert b'healthy' in body
+
+
+def test_module_app_is_built_by_the_wsgi_entry_point(file_app, monkeypatch):
+    lazy = LazyApplication('testing')
+    lazy.flask_app = file_app
+    monkeypatch.setattr(asgi, 'wsgi_application', lazy)
+    monkeypatch.setattr(asgi, '_app', None)
+    
+    assert asgi.app.flask_app is file_app
+    assert asgi.app is asgi.app
@@ -0,0 +1,93 @@
+"""
+Tests for session handling in the authentication service
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from models import db, User
+from services.auth_service import AuthService
+from services.session_store import SessionBackend, MemorySessionBackend
+
+THREADS = 8
+SESSIONS_PER_THREAD = 25
+
+BACKENDS = {
+    'memory': {'SESSION_BACKEND': 'memory'},
+    'sql': {'SESSION_BACKEND': 'sql', 'SESSION_CACHE_MAX_ENTRIES': 0},
+    'cached_sql': {'SESSION_BACKEND': 'sql', 'SESSION_CACHE_MAX_ENTRIES': 100},
+    'signed': {'AUTH_TOKEN_MODE': 'signed'}
+}
+
+
+@pytest.fixture(params=sorted(BACKENDS))
+def session_app(request, make_app, tmp_path):
+    """Application with users on a database file, for every token store"""
+    app = make_app(SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'sessions.db'}",
+                   **BACKENDS[request.param])
+    with app.app_context():
+        for i in range(THREADS):
+            user = User(username=f'user_{i}')
+            user.password_hash = 'not-a-login-account'
+            db.session.add(user)
+        db.session.commit()
+        app.user_ids = [user.id for user in User.query.order_by(User.id)]
+    return app
+
+
+def run_in_threads(app, work):
+    """Run work(thread index) in THREADS threads, each in its own app context"""
+    def run(index):
+        with app.app_context():
+            return work(index)
+    
+    with ThreadPoolExecutor(THREADS) as pool:
+        return list(pool.map(run, range(THREADS)))
+
+
+def test_concurrent_create_and_verify(session_app):
+    def create_and_verify(index):
+        user_id = session_app.user_ids[index]
+        tokens = []
+        for _ in range(SESSIONS_PER_THREAD):
+            token = AuthService._create_session(user_id)
+            assert AuthService.verify_token(token) == user_id
+            tokens.append(token)
+        return user_id, tokens
+    
+    results = run_in_threads(session_app, create_and_verify)
+    
+    all_tokens = [token for _, tokens in results for token in tokens]
+    assert len(set(all_tokens)) == THREADS * SESSIONS_PER_THREAD
+    
+    # Every token still resolves to its own user once all threads are done
+    with session_app.app_context():
+        for user_id, tokens in results:
+            assert {AuthService.verify_token(token) for token in tokens} == {user_id}
+
+
+def test_concurrent_verify_while_logging_out(session_app):
+    with session_app.app_context():
+        tokens = [AuthService._create_session(user_id) for user_id in session_app.user_ids]
+    
+    def verify_and_logout(index):
+        other = tokens[(index + 1) % THREADS]
+        for _ in range(SESSIONS_PER_THREAD):
+            assert AuthService.verify_token(other) in (session_app.user_ids[(index + 1) % THREADS], None)
+        AuthService.logout_user(tokens[index])
+        return AuthService.verify_token(tokens[index])
+    
+    assert run_in_threads(session_app, verify_and_logout) == [None] * THREADS
+
+
+def test_session_backend_is_abstract():
+    with pytest.raises(TypeError):
+        SessionBackend()
+    
+    class Incomplete(SessionBackend):
+        def create(self, token_hash, user_id, expires_at):
+            pass
+    
+    with pytest.raises(TypeError):
+        Incomplete()
+    
+    assert isinstance(MemorySessionBackend(), SessionBackend)
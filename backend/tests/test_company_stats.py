@@ -0,0 +1,46 @@
+"""
+Tests for the incrementally maintained company statistics
+"""
+from models import db, CompanyStats, Experience
+from services.experience_service import ExperienceService
+
+
+def stats_of(company_name):
+    row = db.session.execute(
+        db.select(CompanyStats.__table__).where(CompanyStats.company_name == company_name)
+    ).mappings().first()
+    return CompanyStats.to_dict(row)
+
+
+def test_record_skips_unknown_difficulty(app):
+    with app.app_context():
+        CompanyStats.record([
+            ('Initech', 'Easy', True, 10, 1),
+            ('Initech', 'Legendary', False, 20, 1)
+        ])
+        db.session.commit()
+        stats = stats_of('Initech')
+    
+    assert stats['experience_count'] == 2
+    assert stats['difficulty'] == {'Easy': 1, 'Medium': 0, 'Hard': 0}
+
+
+def test_rebuild_and_update_with_legacy_difficulty(app):
+    with app.app_context():
+        db.session.execute(
+            db.update(Experience).where(Experience.id == 1).values(difficulty='Very Hard')
+        )
+        db.session.commit()
+        with db.engine.begin() as conn:
+            CompanyStats.rebuild(conn)
+        
+        experience = db.session.get(Experience, 1)
+        before = stats_of(experience.company_name)
+        _, status = ExperienceService.update_experience(
+            1, experience.user_id, {'difficulty': 'Hard'}
+        )
+        after = stats_of(experience.company_name)
+    
+    assert status == 200
+    assert after['experience_count'] == before['experience_count']
+    assert after['difficulty']['Hard'] == before['difficulty']['Hard'] + 1
@@ -0,0 +1,87 @@
+"""
+Tests for company name autocomplete and the prefix index behind it
+"""
+import threading
+import pytest
+from models import db, CompanyStats
+from services.company_index import CompanyIndex
+from utils.prefix_index import PrefixIndex
+
+
+def test_prefix_index_search_and_add():
+    index = PrefixIndex({'Google': 3, 'GoDaddy': 5, 'Goldman Sachs': 1, 'Meta': 4, 'Gone': 0})
+    
+    assert len(index) == 4
+    assert index.search('go', 10) == [('GoDaddy', 5), ('Google', 3), ('Goldman Sachs', 1)]
+    assert index.search('GOO', 10) == [('Google', 3)]
+    assert index.search('', 2) == [('GoDaddy', 5), ('Meta', 4)]
+    assert index.search('x', 10) == []
+    
+    index.add('Gorillas', 2)
+    index.add('GoDaddy', -5)
+    index.add('Google', -1)
+    assert index.search('go', 10) == [('Google', 2), ('Gorillas', 2), ('Goldman Sachs', 1)]
+    assert len(index) == 4
+
+
+def suggest(client, **params):
+    response = client.get('/api/companies/suggest', query_string=params)
+    return response.status_code, response.get_json()
+
+
+def test_suggest_route(app, client):
+    # seed() adds rows without going through the service layer
+    with app.app_context():
+        with db.engine.begin() as conn:
+            CompanyStats.rebuild(conn)
+        CompanyIndex.current().load()
+    
+    status, body = suggest(client, prefix='a')
+    assert status == 200
+    assert body['suggestions'] == [
+        {'company_name': 'Amazon', 'experience_count': 7},
+        {'company_name': 'Apple', 'experience_count': 7}
+    ]
+    assert [item['company_name'] for item in suggest(client, limit=2)[1]['suggestions']] == \
+        ['Google', 'Meta']
+
+
+@pytest.mark.parametrize('limit', [0, 51])
+def test_suggest_route_rejects_bad_limits(client, limit):
+    status, body = suggest(client, limit=limit)
+    assert status == 400
+    assert 'error' in body
+
+
+def test_change_applied_during_a_load_is_kept(app, monkeypatch):
+    with app.app_context():
+        companies = CompanyIndex.current()
+        replacing = threading.Event()
+        resume = threading.Event()
+        replace = companies.index.replace
+        
+        def slow_replace(counts):
+            # The summary has been read; hold the load here
+            replacing.set()
+            resume.wait(5)
+            replace(counts)
+        
+        monkeypatch.setattr(companies.index, 'replace', slow_replace)
+        
+        def load():
+            with app.app_context():
+                companies.load()
+        
+        loader = threading.Thread(target=load)
+        loader.start()
+        assert replacing.wait(5)
+        writer = threading.Thread(target=companies.apply, args=([('Initech', 1)],))
+        writer.start()
+        writer.join(0.1)
+        # The change waits for the load instead of going into the old index
+        assert writer.is_alive()
+        resume.set()
+        loader.join(5)
+        writer.join(5)
+        
+        assert companies.index.search('ini', 10) == [('Initech', 1)]
@@ -0,0 +1,54 @@
+"""
+Tests for the NDJSON export route and command
+"""
+import json
+from tests.conftest import seed
+
+
+def parse_ndjson(text):
+    assert text.endswith('\n')
+    return [json.loads(line) for line in text.splitlines()]
+
+
+def test_export_route_streams_filtered_rows_by_id(client, auth_headers):
+    response = client.get('/api/experiences/export', headers=auth_headers,
+                          query_string={'difficulty': 'Hard', 'min_timeline_days': 5})
+    
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    rows = parse_ndjson(response.get_data(as_text=True))
+    # Seeded row i (ID i + 1) is Hard when i % 3 == 2 and took i % 20 days
+    assert [row['id'] for row in rows] == [i + 1 for i in range(30) if i % 3 == 2 and i % 20 >= 5]
+    
+    # Same shape as the list endpoint
+    listed = client.get('/api/experiences?per_page=1').get_json()['experiences'][0]
+    assert all(row.keys() == listed.keys() for row in rows)
+    assert all(row['difficulty'] == 'Hard' and row['application_timeline_days'] >= 5
+               for row in rows)
+
+
+def test_export_route_requires_authentication(client):
+    assert client.get('/api/experiences/export').status_code == 401
+
+
+def test_export_command_output_can_be_imported(app, make_app, tmp_path):
+    output = tmp_path / 'export.ndjson'
+    result = app.test_cli_runner().invoke(args=[
+        'export-experiences', str(output), '--company', 'Google',
+        '--offer-received', 'true', '--batch-size', '2'
+    ])
+    
+    assert result.exit_code == 0, result.output
+    rows = parse_ndjson(output.read_text(encoding='utf-8'))
+    assert [row['id'] for row in rows] == [i + 1 for i in range(30) if i % 4 == 0 and i % 3 == 0]
+    assert {(row['company_name'], row['offer_received']) for row in rows} == {('Google', True)}
+    
+    # Another database with the same authors loads the export unchanged
+    target = make_app()
+    seed(target, experiences=0)
+    imported = target.test_cli_runner().invoke(args=['import-experiences', str(output)])
+    assert imported.exit_code == 0, imported.output
+    with target.test_client() as client:
+        copied = client.get('/api/experiences?per_page=50&sort_by=date_asc').get_json()
+    assert [(row['job_title'], row['author_username']) for row in copied['experiences']] == \
+        [(row['job_title'], row['author_username']) for row in rows]
@@ -0,0 +1,104 @@
+"""
+Tests for the streaming experience importer and its command
+"""
+import json
+import pytest
+from models import db, Experience, ImportCheckpoint
+from services.experience_importer import ExperienceImporter
+
+RECORD = {
+    'username': 'user_0',
+    'job_title': 'Data Engineer',
+    'company_name': 'Initech',
+    'experience_description': 'A take-home task and two onsite interviews',
+    'difficulty': 'Hard',
+    'offer_received': False,
+    'application_date': '2025-02-01',
+    'final_decision_date': '2025-02-15'
+}
+
+
+def write_ndjson(path, records):
+    """Write records (dicts, or raw strings for malformed lines) as NDJSON"""
+    with open(path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write((record if isinstance(record, str) else json.dumps(record)) + '\n')
+    return str(path)
+
+
+def imported_titles(app):
+    with app.app_context():
+        return db.session.execute(
+            db.select(Experience.job_title).where(Experience.company_name == 'Initech')
+            .order_by(Experience.id)
+        ).scalars().all()
+
+
+def test_rejected_records_are_written_to_the_errors_file(app, tmp_path):
+    source = write_ndjson(tmp_path / 'in.ndjson', [
+        RECORD,
+        dict(RECORD, job_title=5),
+        dict(RECORD, company_name=None),
+        '{"job_title": ',
+        dict(RECORD, username='nobody'),
+        dict(RECORD, job_title='Data Scientist')
+    ])
+    errors = tmp_path / 'errors.ndjson'
+    
+    result = app.test_cli_runner().invoke(args=[
+        'import-experiences', source, '--errors', str(errors), '--chunk-size', '4'
+    ])
+    
+    assert result.exit_code == 0, result.output
+    assert imported_titles(app) == ['Data Engineer', 'Data Scientist']
+    rejected = [json.loads(line) for line in errors.read_text().splitlines()]
+    assert [item['record'] for item in rejected] == [2, 3, 4, 5]
+    assert rejected[0]['error'] == 'Field job_title must be a string'
+    assert rejected[0]['data']['job_title'] == 5
+    assert rejected[2]['data'] is None
+    assert rejected[3]['error'] == 'Unknown user: nobody'
+
+
+def test_interrupted_import_resumes_after_the_last_commit(app, tmp_path):
+    titles = [f'Engineer {i}' for i in range(7)]
+    source = write_ndjson(tmp_path / 'in.ndjson', [dict(RECORD, job_title=t) for t in titles])
+    
+    def interrupt(stats):
+        raise KeyboardInterrupt
+    
+    with app.app_context():
+        with pytest.raises(KeyboardInterrupt):
+            ExperienceImporter(db.engine, chunk_size=2, transaction_size=4,
+                               progress=interrupt).run(source)
+        checkpoint = db.session.get(ImportCheckpoint, str(tmp_path / 'in.ndjson'))
+        assert checkpoint.records_done == 4
+        assert not checkpoint.completed
+        
+        stats = ExperienceImporter(db.engine, chunk_size=2, transaction_size=4).run(source)
+    
+    assert stats['resumed_at'] == 4
+    assert stats['imported_now'] == 3
+    assert stats['completed']
+    assert imported_titles(app) == titles
+
+
+def test_reimport_is_detected(app, tmp_path):
+    path = tmp_path / 'in.ndjson'
+    source = write_ndjson(path, [RECORD])
+    runner = app.test_cli_runner()
+    
+    assert runner.invoke(args=['import-experiences', source]).exit_code == 0
+    again = runner.invoke(args=['import-experiences', source])
+    assert again.exit_code == 0
+    assert 'was already imported' in again.output
+    assert len(imported_titles(app)) == 1
+    
+    # A changed file is refused until --restart
+    write_ndjson(path, [RECORD, dict(RECORD, job_title='Data Scientist')])
+    changed = runner.invoke(args=['import-experiences', source])
+    assert changed.exit_code != 0
+    assert 'changed since its last import' in changed.output
+    
+    restarted = runner.invoke(args=['import-experiences', source, '--restart'])
+    assert restarted.exit_code == 0
+    assert imported_titles(app) == ['Data Engineer', 'Data Engineer', 'Data Scientist']
@@ -0,0 +1,67 @@
+"""
+Tests for the experience routes
+"""
+import pytest
+from sqlalchemy import event
+from models import db
+
+NEW_EXPERIENCE = {
+    'job_title': 'Backend Engineer',
+    'company_name': 'Stripe',
+    'experience_description': 'Two coding rounds and a system design interview',
+    'difficulty': 'Medium',
+    'offer_received': True,
+    'application_date': '2025-03-01',
+    'final_decision_date': '2025-03-20'
+}
+
+
+def test_batch_create(client, auth_headers):
+    response = client.post('/api/experiences/batch', headers=auth_headers, json={
+        'experiences': [NEW_EXPERIENCE, dict(NEW_EXPERIENCE, difficulty='Impossible')]
+    })
+    assert response.status_code == 207
+    assert [item['status'] for item in response.get_json()['results']] == [201, 400]
+
+
+def test_batch_create_reports_wrongly_typed_fields_per_item(app, client, auth_headers):
+    items = [
+        NEW_EXPERIENCE,
+        dict(NEW_EXPERIENCE, job_title=5),
+        dict(NEW_EXPERIENCE, company_name=None),
+        dict(NEW_EXPERIENCE, experience_description=['not', 'text']),
+        dict(NEW_EXPERIENCE, job_title='Frontend Engineer')
+    ]
+    statements = []
+    
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+    
+    with app.app_context():
+        event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            response = client.post('/api/experiences/batch', headers=auth_headers,
+                                   json={'experiences': items})
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record)
+    
+    assert response.status_code == 207
+    results = response.get_json()['results']
+    assert [item['status'] for item in results] == [201, 400, 400, 400, 201]
+    assert [item['index'] for item in results] == [0, 1, 2, 3, 4]
+    assert results[1]['error'] == 'Field job_title must be a string'
+    assert results[4]['experience']['job_title'] == 'Frontend Engineer'
+    assert len([sql for sql in statements if sql.startswith('INSERT INTO experience ')]) == 1
+
+
+@pytest.mark.parametrize('body', [[NEW_EXPERIENCE], 'experiences', 42])
+def test_batch_create_rejects_non_object_body(client, auth_headers, body):
+    response = client.post('/api/experiences/batch', headers=auth_headers, json=body)
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+def test_batch_create_rejects_non_list_experiences(client, auth_headers):
+    response = client.post('/api/experiences/batch', headers=auth_headers,
+                           json={'experiences': NEW_EXPERIENCE})
+    assert response.status_code == 400
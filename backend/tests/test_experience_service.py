@@ -0,0 +1,89 @@
+"""
+Tests for the experience service
+"""
+import json
+import pytest
+from sqlalchemy import event
+from models import db
+from services.experience_service import ExperienceService
+from services.fragment_cache import FragmentCache
+from utils.json_fragments import FragmentJSON
+from tests.conftest import seed
+
+
+class StatementCounter:
+    """Counts the SQL statements sent to an engine while active"""
+    
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+    
+    def __enter__(self):
+        event.listen(self.engine, 'before_cursor_execute', self._count)
+        return self
+    
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, 'before_cursor_execute', self._count)
+    
+    def _count(self, *args):
+        self.count += 1
+
+
+def list_page(per_page, sort_by, search=None):
+    """Run the uncached list query of get_experiences"""
+    result, status = ExperienceService._query_experiences(
+        1, per_page, None, None, search, sort_by, None, None, None, None
+    )
+    assert status == 200
+    return decoded(result)
+
+
+def decoded(result):
+    """Turn a service result holding cached JSON fragments into plain data"""
+    return json.loads(FragmentJSON.dumps(result, lambda obj: json.dumps(obj, default=str)))
+
+
+@pytest.mark.parametrize('fragments_enabled', [True, False])
+@pytest.mark.parametrize('sort_by', ['date_desc', 'date_asc', 'difficulty', 'timeline_asc'])
+def test_list_query_count_does_not_grow_with_page_size(make_app, fragments_enabled, sort_by):
+    app = make_app(FRAGMENT_CACHE_ENABLED=fragments_enabled)
+    seed(app, experiences=60, users=12)
+    
+    with app.app_context():
+        counts = []
+        for per_page in (1, 10, 50):
+            fragments = FragmentCache.current()
+            if fragments is not None:
+                fragments.fragments.clear()
+            db.session.expunge_all()
+            
+            with StatementCounter(db.engine) as counter:
+                result = list_page(per_page, sort_by)
+            assert len(result['experiences']) == per_page
+            assert all(item['author_username'] for item in result['experiences'])
+            counts.append(counter.count)
+    
+    assert len(set(counts)) == 1, counts
+    assert counts[0] <= 3
+
+
+def test_search_query_count_does_not_grow_with_page_size(app):
+    with app.app_context():
+        counts = []
+        for per_page in (1, 10):
+            with StatementCounter(db.engine) as counter:
+                result = list_page(per_page, 'date_desc', search='python')
+            assert len(result['experiences']) == per_page
+            counts.append(counter.count)
+    assert counts[0] == counts[1]
+
+
+def test_detail_is_one_query(app):
+    with app.app_context():
+        # The route looks up the entity tag first and passes it on
+        etag = ExperienceService.get_experience_etag(5)
+        with StatementCounter(db.engine) as counter:
+            result, status = ExperienceService.get_experience_by_id(5, etag)
+    assert status == 200
+    assert decoded(result)['experience']['author_username'] == 'user_1'
+    assert counter.count == 1
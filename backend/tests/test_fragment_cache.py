@@ -0,0 +1,78 @@
+"""
+Tests for fragment and response cache invalidation on username changes
+"""
+from models import db, Experience, User
+from services.fragment_cache import FragmentCache
+from tests.conftest import seed
+
+
+def authors(response):
+    """Get the author names of a list or detail response"""
+    body = response.get_json()
+    items = body['experiences'] if 'experiences' in body else [body['experience']]
+    return {item['author_username'] for item in items}
+
+
+def rename(app, old, new, commit=True):
+    with app.app_context():
+        user = User.query.filter_by(username=old).one()
+        user.username = new
+        db.session.flush()
+        fragments_after_flush = len(FragmentCache.current().fragments)
+        if commit:
+            db.session.commit()
+        else:
+            db.session.rollback()
+        return fragments_after_flush
+
+
+def test_rename_invalidates_after_commit(app, client):
+    assert 'user_0' in authors(client.get('/api/experiences?per_page=50'))
+    assert authors(client.get('/api/experiences/1')) == {'user_0'}
+    with app.app_context():
+        cached = len(FragmentCache.current().fragments)
+    
+    # Nothing is dropped during the flush, only once the commit succeeded
+    assert rename(app, 'user_0', 'renamed_0') == cached
+    with app.app_context():
+        assert len(FragmentCache.current().fragments) < cached
+    
+    assert 'renamed_0' in authors(client.get('/api/experiences?per_page=50'))
+    assert authors(client.get('/api/experiences/1')) == {'renamed_0'}
+
+
+def test_rolled_back_rename_keeps_caches(app, client):
+    client.get('/api/experiences?per_page=50')
+    with app.app_context():
+        cached = len(FragmentCache.current().fragments)
+    
+    rename(app, 'user_0', 'renamed_0', commit=False)
+    
+    with app.app_context():
+        assert len(FragmentCache.current().fragments) == cached
+        assert not db.session.info
+    assert 'user_0' in authors(client.get('/api/experiences?per_page=50'))
+
+
+def test_rename_by_another_worker_changes_validators(make_app, tmp_path):
+    uri = f"sqlite:///{tmp_path / 'shared.db'}"
+    app_a = make_app(SQLALCHEMY_DATABASE_URI=uri)
+    app_b = make_app(SQLALCHEMY_DATABASE_URI=uri)
+    seed(app_a)
+    client_b = app_b.test_client()
+    
+    listed = client_b.get('/api/experiences?per_page=50')
+    detail = client_b.get('/api/experiences/1')
+    
+    rename(app_a, 'user_0', 'renamed_0')
+    
+    listed_again = client_b.get('/api/experiences?per_page=50',
+                                headers={'If-None-Match': listed.headers['ETag']})
+    detail_again = client_b.get('/api/experiences/1',
+                                headers={'If-None-Match': detail.headers['ETag']})
+    assert listed_again.status_code == 200
+    assert detail_again.status_code == 200
+    assert 'renamed_0' in authors(listed_again)
+    assert authors(detail_again) == {'renamed_0'}
+    with app_b.app_context():
+        assert db.session.get(Experience, 1).updated_at > db.session.get(Experience, 2).updated_at
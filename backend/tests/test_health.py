@@ -0,0 +1,75 @@
+"""
+Tests for the liveness and readiness endpoints
+"""
+import sqlite3
+import pytest
+
+
+@pytest.fixture
+def database_path(tmp_path):
+    return tmp_path / 'health.db'
+
+
+def file_app(make_app, database_path, **overrides):
+    """Testing application on a database file (so every probe runs)"""
+    return make_app(SQLALCHEMY_DATABASE_URI=f'sqlite:///{database_path}', **overrides)
+
+
+def test_ready_when_every_probe_passes(make_app, database_path):
+    client = file_app(make_app, database_path).test_client()
+    
+    response = client.get('/api/health/ready')
+    
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['status'] == 'ready'
+    assert set(body['checks']) == {'database', 'write_lock', 'disk', 'session_store'}
+    assert all(check['ok'] for check in body['checks'].values())
+    assert body['checks']['disk']['free_mb'] > 0
+    assert body['active_sessions'] == 0
+
+
+def test_unavailable_while_the_write_lock_is_held(make_app, database_path):
+    client = file_app(make_app, database_path, HEALTH_WRITE_LOCK_TIMEOUT_MS=50).test_client()
+    blocker = sqlite3.connect(database_path)
+    blocker.execute('BEGIN IMMEDIATE')
+    try:
+        response = client.get('/api/health/ready')
+    finally:
+        blocker.rollback()
+        blocker.close()
+    
+    assert response.status_code == 503
+    body = response.get_json()
+    assert body['status'] == 'unavailable'
+    assert not body['checks']['write_lock']['ok']
+    assert 'locked' in body['checks']['write_lock']['error']
+    assert body['checks']['database']['ok']
+    # Liveness does not depend on the database
+    assert client.get('/api/health/live').status_code == 200
+
+
+def test_unavailable_when_the_disk_is_nearly_full(make_app, database_path):
+    client = file_app(make_app, database_path, HEALTH_MIN_FREE_DISK_MB=10 ** 12).test_client()
+    
+    response = client.get('/api/health/ready')
+    
+    assert response.status_code == 503
+    assert response.get_json()['checks']['disk']['error'].startswith('OSError: ')
+
+
+def test_readiness_result_is_cached(make_app, database_path):
+    client = file_app(make_app, database_path, HEALTH_CHECK_CACHE_SECONDS=60,
+                      HEALTH_WRITE_LOCK_TIMEOUT_MS=50).test_client()
+    assert client.get('/api/health/ready').status_code == 200
+    
+    blocker = sqlite3.connect(database_path)
+    blocker.execute('BEGIN IMMEDIATE')
+    try:
+        cached = client.get('/api/health/ready')
+    finally:
+        blocker.rollback()
+        blocker.close()
+    
+    assert cached.status_code == 200
+    assert cached.get_json()['age_seconds'] >= 0
@@ -0,0 +1,67 @@
+"""
+Tests for the per-request SQL instrumentation
+"""
+import logging
+import re
+from flask import jsonify
+from models import db, Experience
+from services.query_instrumentation import QueryInstrumentation
+from tests.conftest import seed
+
+
+def make_instrumented_app(make_app, **overrides):
+    """Seeded application with a route that loads experiences one by one"""
+    app = make_app(**overrides)
+    seed(app)
+    
+    def one_by_one():
+        titles = [
+            db.session.execute(
+                db.select(Experience.job_title).where(Experience.id == experience_id)
+            ).scalar()
+            for experience_id in range(1, 5)
+        ]
+        return jsonify(titles)
+    
+    app.add_url_rule('/test/one-by-one', 'one_by_one', one_by_one)
+    return app
+
+
+def test_server_timing_reports_the_request_queries(make_app):
+    app = make_instrumented_app(make_app)
+    response = app.test_client().get('/test/one-by-one')
+    
+    assert response.status_code == 200
+    assert re.fullmatch(r'db;dur=\d+\.\d;desc="4 queries"', response.headers['Server-Timing'])
+    assert 'X-DB-Query-Count' not in response.headers
+
+
+def test_repeated_statements_are_flagged(make_app, caplog):
+    app = make_instrumented_app(make_app, SQL_DEBUG_HEADERS=True,
+                                SQL_REPEATED_STATEMENT_THRESHOLD=3)
+    
+    with caplog.at_level(logging.WARNING, logger='services.query_instrumentation'):
+        response = app.test_client().get('/test/one-by-one')
+    
+    assert response.headers['X-DB-Query-Count'] == '4'
+    assert response.headers['X-DB-Repeated-Statements'] == '1'
+    assert float(response.headers['X-DB-Time-Ms']) >= 0
+    warnings = [record.getMessage() for record in caplog.records if 'possible N+1' in record.getMessage()]
+    assert len(warnings) == 1
+    assert 'ran 4 times' in warnings[0]
+    assert 'route=GET one_by_one' in warnings[0]
+
+
+def test_slow_statements_are_logged_with_their_route(make_app, caplog):
+    app = make_instrumented_app(make_app)
+    with app.app_context():
+        # Treat every statement as slow
+        QueryInstrumentation.current().slow_query_seconds = 0.0
+    
+    with caplog.at_level(logging.WARNING, logger='services.query_instrumentation.slow'):
+        app.test_client().get('/test/one-by-one')
+    
+    slow = [record.getMessage() for record in caplog.records
+            if record.name == 'services.query_instrumentation.slow']
+    assert len(slow) == 4
+    assert all('route=GET one_by_one' in message and 'parameters=' in message for message in slow)
@@ -0,0 +1,53 @@
+"""
+Tests for the experience list query plans (flask check-query-plans)
+"""
+import pytest
+from app import create_app
+from commands.check_query_plans import plan_combinations
+from models import db
+from services.experience_service import ExperienceService
+from tests.conftest import seed
+
+COMBINATIONS = plan_combinations('Google')
+
+
+def combination_id(combination):
+    filters, seek = combination
+    named = [f'{name}={value}' for name, value in filters.items() if value is not None]
+    return ','.join(named) + (',cursor' if seek else ',page')
+
+
+@pytest.fixture(scope='module')
+def plan_app():
+    """Seeded application with planner statistics (shared by the module)"""
+    app = create_app('testing')
+    seed(app, experiences=200, users=10)
+    with app.app_context():
+        with db.engine.begin() as conn:
+            conn.execute(db.text('ANALYZE experience'))
+    return app
+
+
+@pytest.mark.parametrize('combination', COMBINATIONS, ids=combination_id)
+def test_list_query_reads_rows_in_index_order(plan_app, combination):
+    filters, seek = combination
+    with plan_app.app_context():
+        plan = ExperienceService.explain_experiences(seek=seek, **filters)
+    assert plan
+    assert not any('TEMP B-TREE' in step for step in plan), plan
+
+
+def test_command_reports_every_combination(plan_app):
+    result = plan_app.test_cli_runner().invoke(args=['check-query-plans'])
+    assert result.exit_code == 0, result.output
+    assert 'Every combination reads rows in index order' in result.output
+    assert len(result.output.splitlines()) == len(COMBINATIONS) + 1
+
+
+def test_command_fails_when_a_combination_sorts(app):
+    with app.app_context():
+        with db.engine.begin() as conn:
+            conn.execute(db.text('DROP INDEX ix_experience_timeline_days'))
+    result = app.test_cli_runner().invoke(args=['check-query-plans'])
+    assert result.exit_code == 1
+    assert 'SORT' in result.output
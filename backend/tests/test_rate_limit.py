@@ -0,0 +1,83 @@
+"""
+Tests for the token bucket limiter and the rate_limit decorator
+"""
+import pytest
+from utils.rate_limit import TokenBucketLimiter
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to"""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr('utils.rate_limit.time.monotonic', clock)
+    return clock
+
+
+def test_bucket_allows_burst_then_refills(clock):
+    limiter = TokenBucketLimiter(rate=0.5, burst=3, max_keys=10)
+    
+    assert [limiter.hit('a') for _ in range(3)] == [0, 0, 0]
+    assert limiter.hit('a') == 2
+    # Other keys have their own bucket
+    assert limiter.hit('b') == 0
+    
+    clock.now += 2
+    assert limiter.hit('a') == 0
+    assert limiter.hit('a') == 2
+    assert limiter.stats()['limited'] == 2
+
+
+def test_least_recently_used_bucket_is_evicted(clock):
+    limiter = TokenBucketLimiter(rate=0.5, burst=1, max_keys=2)
+    
+    limiter.hit('a')
+    limiter.hit('b')
+    limiter.hit('c')
+    
+    assert limiter.stats()['keys'] == 2
+    assert limiter.stats()['evictions'] == 1
+    # 'a' was evicted, so it starts again with a full bucket
+    assert limiter.hit('a') == 0
+    assert limiter.hit('c') > 0
+
+
+@pytest.fixture
+def limited_client(make_app):
+    app = make_app(RATE_LIMIT_ENABLED=True, RATE_LIMITS={
+        'login_ip': (0.001, 5),
+        'login_username': (0.001, 2)
+    })
+    return app.test_client()
+
+
+def login(client, username, ip='10.0.0.1'):
+    return client.post('/api/auth/login', json={
+        'username': username, 'password': 'password123'
+    }, environ_base={'REMOTE_ADDR': ip})
+
+
+def test_login_is_limited_per_username(limited_client):
+    assert [login(limited_client, 'alice').status_code for _ in range(2)] == [401, 401]
+    
+    limited = login(limited_client, 'alice')
+    assert limited.status_code == 429
+    assert int(limited.headers['Retry-After']) > 0
+    # The username bucket is shared by every client address
+    assert login(limited_client, 'Alice', ip='10.0.0.2').status_code == 429
+    assert login(limited_client, 'bob').status_code == 401
+
+
+def test_login_is_limited_per_client_ip(limited_client):
+    statuses = [login(limited_client, f'user{i}').status_code for i in range(6)]
+    assert statuses == [401] * 5 + [429]
+    
+    assert login(limited_client, 'user6', ip='10.0.0.2').status_code == 401
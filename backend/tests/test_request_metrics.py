@@ -0,0 +1,54 @@
+"""
+Tests for the Prometheus metrics and the /api/metrics endpoint
+"""
+from services.request_metrics import RequestMetrics
+from utils.metrics import Counter, Histogram
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram('latency_seconds', 'Latency.', ('route',), (0.1, 1.0))
+    for value in (0.05, 0.5, 2.0):
+        histogram.observe(('list',), value)
+    
+    assert histogram.render() == [
+        '# HELP latency_seconds Latency.',
+        '# TYPE latency_seconds histogram',
+        'latency_seconds_bucket{route="list",le="0.1"} 1',
+        'latency_seconds_bucket{route="list",le="1"} 2',
+        'latency_seconds_bucket{route="list",le="+Inf"} 3',
+        'latency_seconds_sum{route="list"} 2.55',
+        'latency_seconds_count{route="list"} 3'
+    ]
+
+
+def test_counter_escapes_label_values():
+    counter = Counter('hits_total', 'Hits.', ('path',))
+    counter.inc(('say "hi"\\\n',), 2)
+    
+    assert counter.render()[-1] == 'hits_total{path="say \\"hi\\"\\\\\\n"} 2'
+
+
+def test_metrics_endpoint_counts_requests(client):
+    client.get('/api/experiences')
+    client.get('/api/experiences?page=2')
+    client.get('/api/no-such-route')
+    
+    response = client.get('/api/metrics')
+    
+    assert response.status_code == 200
+    assert response.headers['Content-Type'] == RequestMetrics.CONTENT_TYPE
+    lines = response.get_data(as_text=True).splitlines()
+    assert 'http_requests_total{blueprint="experience",endpoint="experience.get_experiences",' \
+        'method="GET",status="200"} 2' in lines
+    assert 'http_request_duration_seconds_count{blueprint="experience",' \
+        'endpoint="experience.get_experiences",method="GET"} 2' in lines
+    assert 'http_requests_total{blueprint="",endpoint="<unmatched>",method="GET",status="404"} 1' in lines
+    # The scrape itself is the only request in flight
+    assert 'http_requests_in_flight{blueprint="health",endpoint="health.metrics"} 1' in lines
+    assert any(line.startswith('db_pool_checkouts_total{engine="primary"} ') for line in lines)
+    assert '# TYPE auth_active_sessions gauge' in lines
+
+
+def test_metrics_endpoint_is_off_when_disabled(make_app):
+    client = make_app(METRICS_ENABLED=False).test_client()
+    assert client.get('/api/metrics').status_code == 404
@@ -0,0 +1,68 @@
+"""
+Tests for the response and fragment caches across workers
+"""
+import pytest
+from models import db, Experience
+from services.experience_service import ExperienceService
+from services.response_cache import ResponseCache
+from tests.conftest import seed
+
+
+def titled(response, experience_id):
+    """Get the job title of one experience in a list response"""
+    for experience in response.get_json()['experiences']:
+        if experience['id'] == experience_id:
+            return experience['job_title']
+    return None
+
+
+@pytest.mark.parametrize('fragments_enabled', [True, False])
+def test_write_by_another_worker_is_not_served_from_cache(make_app, tmp_path, fragments_enabled):
+    # Two workers (applications) on one database file
+    uri = f"sqlite:///{tmp_path / 'shared.db'}"
+    app_a = make_app(SQLALCHEMY_DATABASE_URI=uri, FRAGMENT_CACHE_ENABLED=fragments_enabled)
+    app_b = make_app(SQLALCHEMY_DATABASE_URI=uri, FRAGMENT_CACHE_ENABLED=fragments_enabled)
+    seed(app_a)
+    client_b = app_b.test_client()
+    
+    listed = client_b.get('/api/experiences?per_page=50')
+    detail = client_b.get('/api/experiences/1')
+    assert titled(listed, 1) == 'Engineer 0'
+    assert detail.get_json()['experience']['job_title'] == 'Engineer 0'
+    
+    with app_a.app_context():
+        owner_id = db.session.get(Experience, 1).user_id
+        _, status = ExperienceService.update_experience(1, owner_id, {'job_title': 'Renamed'})
+    assert status == 200
+    
+    listed_again = client_b.get('/api/experiences?per_page=50',
+                                headers={'If-None-Match': listed.headers['ETag']})
+    assert listed_again.status_code == 200
+    assert listed_again.headers['ETag'] != listed.headers['ETag']
+    assert titled(listed_again, 1) == 'Renamed'
+    
+    detail_again = client_b.get('/api/experiences/1',
+                                headers={'If-None-Match': detail.headers['ETag']})
+    assert detail_again.status_code == 200
+    assert detail_again.headers['ETag'] != detail.headers['ETag']
+    assert detail_again.get_json()['experience']['job_title'] == 'Renamed'
+
+
+def test_unchanged_detail_is_served_from_cache(app, client):
+    first = client.get('/api/experiences/2')
+    second = client.get('/api/experiences/2')
+    assert second.get_json() == first.get_json()
+    assert second.headers['ETag'] == first.headers['ETag']
+    with app.app_context():
+        assert ResponseCache.current().details.stats()['hits'] >= 1
+
+
+def test_result_read_before_a_write_is_not_stored():
+    cache = ResponseCache(max_entries=8, ttl=60)
+    generation = cache.generation
+    cache.invalidate_experience(1)
+    cache.store(cache.details, 1, ('etag', {'experience': {}}), generation)
+    assert cache.details.get(1) is None
+    
+    cache.store(cache.details, 1, ('etag', {'experience': {}}), cache.generation)
+    assert cache.details.get(1) is not None
@@ -0,0 +1,55 @@
+"""
+Tests for the full-text search index and its ILIKE fallback
+"""
+from models import db, Experience
+from services.experience_service import ExperienceService
+from services.search_index import SearchIndex
+from tests.conftest import seed
+
+
+def searched_ids(client, search):
+    """Get the IDs of every experience matching a search term"""
+    response = client.get('/api/experiences', query_string={'search': search, 'per_page': 50})
+    assert response.status_code == 200
+    return sorted(experience['id'] for experience in response.get_json()['experiences'])
+
+
+def test_search_matches_word_prefixes(app, client):
+    with app.app_context():
+        assert SearchIndex.is_enabled(db.engine, app.config['FULL_TEXT_SEARCH_ENABLED'])
+    
+    google = searched_ids(client, 'goo')
+    assert google == list(range(1, 31, 4))
+    assert searched_ids(client, 'goo engineer 4') == [5]
+    # Text inside a word is not matched
+    assert searched_ids(client, 'oogle') == []
+
+
+def test_search_falls_back_to_substring_match(make_app):
+    app = make_app(FULL_TEXT_SEARCH_ENABLED=False)
+    seed(app)
+    client = app.test_client()
+    
+    with app.app_context():
+        assert not SearchIndex.is_enabled(db.engine, app.config['FULL_TEXT_SEARCH_ENABLED'])
+        assert db.session.execute(db.text(
+            f"SELECT 1 FROM sqlite_master WHERE name = '{SearchIndex.TABLE_NAME}'"
+        )).first() is None
+    
+    assert searched_ids(client, 'oogle') == list(range(1, 31, 4))
+
+
+def test_index_follows_updates_and_deletes(app, client):
+    with app.app_context():
+        owner_id = db.session.get(Experience, 1).user_id
+        _, status = ExperienceService.update_experience(1, owner_id, {'job_title': 'Astronaut'})
+    assert status == 200
+    
+    assert searched_ids(client, 'astronaut') == [1]
+    assert 1 not in searched_ids(client, 'engineer')
+    
+    with app.app_context():
+        _, status = ExperienceService.delete_experience(1, owner_id)
+    assert status == 200
+    
+    assert searched_ids(client, 'astronaut') == []
@@ -0,0 +1,44 @@
+"""
+Tests for the signed token store and its revocation list
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from models import db, RevokedToken
+from services.auth_service import AuthService
+from services.signed_token_store import SignedTokenStore
+
+
+@pytest.fixture
+def signed_app(make_app, tmp_path):
+    """Signed token mode on a database file shared by threads"""
+    return make_app(SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'signed.db'}",
+                    AUTH_TOKEN_MODE='signed', TOKEN_REVOCATION_REFRESH=0)
+
+
+def revoked_rows():
+    return db.session.execute(db.select(db.func.count()).select_from(RevokedToken)).scalar()
+
+
+def test_revoking_twice_keeps_one_row(signed_app):
+    with signed_app.app_context():
+        token = AuthService._create_session(1)
+        AuthService.logout_user(token)
+        AuthService.logout_user(token)
+        
+        assert AuthService.verify_token(token) is None
+        assert revoked_rows() == 1
+
+
+def test_concurrent_revocations_of_one_token(signed_app):
+    with signed_app.app_context():
+        token = AuthService._create_session(1)
+        _, expires, token_id = SignedTokenStore.current().signer.verify(token)
+        revocations = SignedTokenStore.current().revocations
+    
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda _: revocations.revoke(token_id, expires), range(32)))
+    
+    with signed_app.app_context():
+        assert revoked_rows() == 1
+        assert AuthService.verify_token(token) is None
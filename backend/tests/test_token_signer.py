@@ -0,0 +1,49 @@
+"""
+Tests for signed bearer tokens
+"""
+import pytest
+from utils.token_signer import TokenSigner
+
+
+@pytest.fixture
+def signer():
+    return TokenSigner(['current-secret', 'previous-secret'])
+
+
+def test_round_trip(signer):
+    user_id, expires, token_id = signer.verify(signer.sign(7, 60))
+    assert user_id == 7
+    assert token_id
+
+
+def test_fallback_key_is_accepted(signer):
+    token = TokenSigner(['previous-secret']).sign(7, 60)
+    assert signer.verify(token)[0] == 7
+
+
+@pytest.mark.parametrize('mangle', [
+    lambda token: token[:-1] + 'é',
+    lambda token: token.replace('.', '·', 1),
+    lambda token: token + '.extra',
+    lambda token: token.rsplit('.', 1)[0] + '.',
+    lambda token: '',
+])
+def test_malformed_token_is_rejected(signer, mangle):
+    assert signer.verify(mangle(signer.sign(7, 60))) is None
+
+
+def test_expired_token_is_rejected(signer):
+    assert signer.verify(signer.sign(7, -1)) is None
+
+
+def test_malformed_token_is_unauthorized_on_routes(make_app):
+    app = make_app(AUTH_TOKEN_MODE='signed')
+    client = app.test_client()
+    token = client.post('/api/auth/register', json={
+        'username': 'signer', 'password': 'password123'
+    }).get_json()['token']
+    bad = {'Authorization': f'Bearer {token[:-1]}é'}
+    
+    assert client.get('/api/auth/me', headers={'Authorization': f'Bearer {token}'}).status_code == 200
+    assert client.get('/api/auth/me', headers=bad).status_code == 401
+    assert client.post('/api/experiences', json={}, headers=bad).status_code == 401
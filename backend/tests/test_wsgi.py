@@ -0,0 +1,62 @@
+"""
+Tests for the lazy WSGI entry point
+"""
+import threading
+from werkzeug.test import Client
+from config import TestingConfig
+from utils.startup_timer import StartupTimer
+from wsgi import LazyApplication
+
+
+def test_application_is_created_on_first_request():
+    lazy = LazyApplication('testing')
+    assert lazy.flask_app is None
+    
+    response = Client(lazy).get('/api/health/live')
+    
+    assert response.status_code == 200
+    assert lazy.flask_app is not None
+    assert lazy.load() is lazy.flask_app
+    with lazy.flask_app.app_context():
+        phases = StartupTimer.current().phases
+    assert 'import' in phases and len(phases) > 1
+
+
+def test_concurrent_first_requests_create_one_application(monkeypatch):
+    lazy = LazyApplication('testing')
+    created = []
+    create = lazy._create
+    
+    def counting_create():
+        created.append(threading.current_thread().name)
+        return create()
+    
+    monkeypatch.setattr(lazy, '_create', counting_create)
+    threads = [threading.Thread(target=lazy.load) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len(created) == 1
+
+
+def test_forked_worker_gets_a_running_sweeper(monkeypatch):
+    monkeypatch.setattr(TestingConfig, 'SESSION_SWEEP_INTERVAL', 3600)
+    lazy = LazyApplication('testing')
+    flask_app = lazy.load()
+    store = flask_app.extensions[LazyApplication.TOKEN_STORE_EXTENSION]
+    inherited = store.sweeper
+    
+    # What preload() does in the master and the fork hook in each worker
+    assert lazy._sweeper_stores(flask_app) == [store]
+    inherited.stop()
+    inherited.join()
+    lazy._after_fork()
+    
+    try:
+        assert store.sweeper is not inherited
+        assert store.sweeper.is_alive()
+        assert Client(lazy).get('/api/health/live').status_code == 200
+    finally:
+        store.sweeper.stop()
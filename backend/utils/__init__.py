@@ -1,8 +1,12 @@
 """
 Utilities package initialization
 """
-from utils.decorators import require_auth
+from utils.decorators import require_auth, rate_limit
 from utils.validators import Validator
+from utils.cursor import Cursor
+from utils.http_cache import ConditionalResponse
+from utils.json_fragments import JSONFragment, FragmentJSON
 
-__all__ = ['require_auth', 'Validator']
+__all__ = ['require_auth', 'rate_limit', 'Validator', 'Cursor', 'ConditionalResponse',
+           'JSONFragment', 'FragmentJSON']
 
@@ -0,0 +1,130 @@
+"""
+Cache Utilities
+Implements a bounded in-process cache with OOP principles:
+- Single Responsibility: Only stores and expires cached values
+- Encapsulation: Eviction order and locking are internal
+"""
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache with a time-to-live
+    
+    Entries are evicted when the cache is full (least recently used first)
+    and ignored once they are older than the TTL. Hit, miss, eviction and
+    expiration counts are kept for monitoring.
+    """
+    
+    def __init__(self, max_entries, ttl):
+        """
+        Initialize an empty cache
+        
+        Args:
+            max_entries (int): Maximum number of entries kept
+            ttl (float): Seconds an entry stays valid (0 disables expiry)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key, default=None):
+        """
+        Get a cached value and mark it as recently used
+        
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+        
+        Returns:
+            Cached value, or default if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            
+            if entry is None:
+                self.misses += 1
+                return default
+            
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def set(self, key, value):
+        """
+        Store a value, evicting the least recently used entry if full
+        
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def invalidate(self, key):
+        """
+        Remove a single entry
+        
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def discard_where(self, predicate):
+        """
+        Remove every entry whose value matches a predicate
+        
+        Args:
+            predicate (callable): Takes a cached value, returns True to remove it
+        """
+        with self._lock:
+            for key in [key for key, (value, _) in self._entries.items() if predicate(value)]:
+                del self._entries[key]
+    
+    def clear(self):
+        """Remove all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self):
+        """Number of entries currently stored (including expired ones not yet purged)"""
+        return len(self._entries)
+    
+    def stats(self):
+        """
+        Get cache counters (for monitoring)
+        
+        Returns:
+            dict: Size, limits and hit/miss/eviction/expiration counts
+        """
+        return {
+            'size': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations
+        }
@@ -0,0 +1,75 @@
+"""
+Cursor Utilities
+Implements opaque keyset pagination cursors with OOP principles:
+- Single Responsibility: Only encodes and decodes cursors
+- Encapsulation: Clients never see the cursor payload format
+"""
+import base64
+import json
+from datetime import datetime
+
+
+class Cursor:
+    """
+    Utility class for opaque pagination cursors
+    
+    A cursor records the sort order it was issued for plus the sort key
+    and id of the last row a client has seen, so the next page can seek
+    past it instead of using OFFSET.
+    """
+    
+    # Sort orders whose key is a datetime (encoded as ISO 8601)
+    DATETIME_SORTS = ('date_desc', 'date_asc')
+    
+    @staticmethod
+    def encode(sort_by, sort_key, last_id):
+        """
+        Encode the position after a row as an opaque cursor
+        
+        Args:
+            sort_by (str): Sort order the cursor belongs to
+            sort_key: Sort key value of the last row
+            last_id (int): ID of the last row
+        
+        Returns:
+            str: URL-safe cursor string
+        """
+        if isinstance(sort_key, datetime):
+            sort_key = sort_key.isoformat()
+        
+        payload = json.dumps({'s': sort_by, 'k': sort_key, 'i': last_id}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+    
+    @staticmethod
+    def decode(cursor, sort_by):
+        """
+        Decode a cursor issued for the given sort order
+        
+        Args:
+            cursor (str): Cursor string from the client
+            sort_by (str): Sort order of the current request
+        
+        Returns:
+            tuple: (sort_key, last_id)
+        
+        Raises:
+            ValueError: If the cursor is malformed or was issued for another sort order
+        """
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            cursor_sort, sort_key, last_id = payload['s'], payload['k'], payload['i']
+        except (ValueError, TypeError, KeyError):
+            raise ValueError('Invalid cursor')
+        
+        if cursor_sort != sort_by or not isinstance(last_id, int):
+            raise ValueError('Invalid cursor')
+        
+        if sort_by in Cursor.DATETIME_SORTS:
+            if not isinstance(sort_key, str):
+                raise ValueError('Invalid cursor')
+            sort_key = datetime.fromisoformat(sort_key)
+        elif not isinstance(sort_key, int):
+            raise ValueError('Invalid cursor')
+        
+        return sort_key, last_id
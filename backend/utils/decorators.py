@@ -2,7 +2,7 @@
 Decorators Module
 Implements decorators with OOP principles:
 - DRY (Don't Repeat Yourself): Reusable authentication logic
-- Separation of Concerns: Authentication separated from business logic
+- Separation of Concerns: Authentication and throttling separated from business logic
 """
 from functools import wraps
 from flask import request, jsonify
@@ -49,3 +49,45 @@ def require_auth(f):
     
     return decorated_function
 
+
+
+def rate_limit(scope, key_func):
+    """
+    Decorator to throttle a route with a RateLimiter scope
+    Rejected requests get 429 with Retry-After before the route runs
+    (and before any password hashing in the auth routes)
+    
+    Usage:
+        @app.route('/api/auth/login', methods=['POST'])
+        @rate_limit('login_ip', RateLimiter.client_ip)
+        def login():
+            ...
+    
+    Args:
+        scope (str): Scope name configured in RATE_LIMITS
+        key_func: Callable returning the bucket key for the current request
+            (None skips the check)
+        
+    Returns:
+        Decorator
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            # Import here to avoid circular import
+            from services.rate_limiter import RateLimiter
+            
+            limiter = RateLimiter.current()
+            
+            if limiter is not None:
+                retry_after = limiter.hit(scope, key_func())
+                if retry_after:
+                    response = jsonify({'error': 'Too many requests - try again later'})
+                    response.headers['Retry-After'] = str(retry_after)
+                    return response, 429
+            
+            return f(*args, **kwargs)
+        
+        return decorated_function
+    
+    return decorator
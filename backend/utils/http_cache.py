@@ -0,0 +1,82 @@
+"""
+HTTP Caching Utilities
+Implements conditional GET helpers with OOP principles:
+- Single Responsibility: Only handles ETag validation and headers
+- DRY: Shared by every endpoint that supports If-None-Match
+"""
+from flask import current_app, request, make_response
+from utils.json_fragments import FragmentJSON
+
+
+class ConditionalResponse:
+    """
+    Utility class for ETag / If-None-Match handling
+    """
+    
+    @staticmethod
+    def is_not_modified(etag):
+        """
+        Check whether the client already has the representation for an ETag
+        
+        Args:
+            etag (str): Entity tag value (without quotes)
+        
+        Returns:
+            bool: True if If-None-Match matches the entity tag
+        """
+        return etag is not None and request.if_none_match.contains(etag)
+    
+    @staticmethod
+    def not_modified(etag):
+        """
+        Build an empty 304 Not Modified response
+        
+        Args:
+            etag (str): Entity tag value (without quotes)
+        
+        Returns:
+            Response: 304 response carrying the entity tag
+        """
+        response = make_response('', 304)
+        return ConditionalResponse._add_validators(response, etag)
+    
+    @staticmethod
+    def json(result, status_code, etag):
+        """
+        Build a JSON response that carries the entity tag on success
+        Cached JSONFragment values in the body are emitted verbatim
+        
+        Args:
+            result (dict): Response body
+            status_code (int): HTTP status code
+            etag (str): Entity tag value (without quotes)
+        
+        Returns:
+            Response: JSON response
+        """
+        body = FragmentJSON.dumps(result, current_app.json.dumps)
+        response = current_app.response_class(
+            f'{body}\n', status=status_code, mimetype=current_app.json.mimetype
+        )
+        
+        if status_code == 200 and etag is not None:
+            ConditionalResponse._add_validators(response, etag)
+        
+        return response
+    
+    @staticmethod
+    def _add_validators(response, etag):
+        """
+        Set the ETag and require clients to revalidate before reuse
+        Encapsulation: Private method
+        
+        Args:
+            response (Response): Response to update
+            etag (str): Entity tag value (without quotes)
+        
+        Returns:
+            Response: The same response
+        """
+        response.set_etag(etag)
+        response.cache_control.no_cache = True
+        return response
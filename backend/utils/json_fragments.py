@@ -0,0 +1,61 @@
+"""
+JSON Fragment Utilities
+Implements splicing of pre-encoded JSON with OOP principles:
+- Single Responsibility: Only assembles JSON documents from fragments
+- Encapsulation: Placeholder handling is internal
+"""
+import re
+import secrets
+
+
+class JSONFragment(str):
+    """
+    A string holding an already encoded JSON value
+    
+    Fragments are emitted verbatim by FragmentJSON.dumps instead of being
+    encoded again as JSON strings.
+    """
+    
+    __slots__ = ()
+
+
+class FragmentJSON:
+    """
+    Utility class for encoding documents that contain JSONFragment values
+    """
+    
+    @staticmethod
+    def dumps(obj, dumps):
+        """
+        Encode an object, splicing JSONFragment values in verbatim
+        
+        Args:
+            obj: Object to encode (fragments may appear anywhere inside it)
+            dumps (callable): Encoder used for everything that is not a fragment
+        
+        Returns:
+            str: JSON document
+        """
+        fragments = []
+        nonce = secrets.token_hex(8)
+        
+        def mark(value):
+            if isinstance(value, JSONFragment):
+                fragments.append(value)
+                return f'__fragment_{nonce}_{len(fragments) - 1}__'
+            if isinstance(value, dict):
+                return {key: mark(item) for key, item in value.items()}
+            if isinstance(value, (list, tuple)):
+                return [mark(item) for item in value]
+            return value
+        
+        encoded = dumps(mark(obj))
+        
+        if not fragments:
+            return encoded
+        
+        return re.sub(
+            f'"__fragment_{nonce}_(\\d+)__"',
+            lambda match: fragments[int(match.group(1))],
+            encoded
+        )
@@ -0,0 +1,89 @@
+"""
+JSON Provider
+Implements the application's JSON encoding with OOP principles:
+- Inheritance: Extends Flask's DefaultJSONProvider
+- Polymorphism: Same interface, faster encoder when one is installed
+"""
+import json
+from datetime import date
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider that uses orjson when available
+    
+    Falls back to the standard library encoder when orjson is not installed
+    (or JSON_USE_ORJSON is off). Both encoders produce compact output with
+    sorted keys and write date/datetime values as ISO 8601, so models can
+    hand dates to the encoder without formatting them first. orjson emits
+    UTF-8 directly; the standard library path keeps ASCII escapes, which is
+    faster there for mostly-ASCII text.
+    """
+    
+    def __init__(self, app):
+        """
+        Initialize the provider
+        
+        Args:
+            app (Flask): Flask application instance
+        """
+        super().__init__(app)
+        self.use_orjson = orjson is not None and app.config.get('JSON_USE_ORJSON', True)
+    
+    @staticmethod
+    def default(o):
+        """
+        Encode values the standard library does not know
+        
+        Args:
+            o: Value to encode
+        
+        Returns:
+            A JSON-serializable value
+        """
+        if isinstance(o, date):
+            return o.isoformat()
+        return DefaultJSONProvider.default(o)
+    
+    def dumps(self, obj, **kwargs):
+        """
+        Serialize data as a JSON string
+        
+        Args:
+            obj: Data to serialize
+            **kwargs: Options for json.dumps (only indent=2 and compact
+                separators are supported on the orjson path)
+        
+        Returns:
+            str: JSON document
+        """
+        if self.use_orjson and kwargs.keys() <= {'indent', 'separators'}:
+            option = orjson.OPT_SORT_KEYS
+            if kwargs.get('indent'):
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        
+        if 'indent' not in kwargs:
+            kwargs.setdefault('separators', (',', ':'))
+        return super().dumps(obj, **kwargs)
+    
+    def loads(self, s, **kwargs):
+        """
+        Deserialize a JSON string or UTF-8 bytes
+        
+        Args:
+            s (str or bytes): JSON document
+            **kwargs: Options for json.loads
+        
+        Returns:
+            Deserialized data
+        """
+        if self.use_orjson and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
@@ -0,0 +1,224 @@
+"""
+Metrics Utilities
+Implements in-process Prometheus metrics with OOP principles:
+- Single Responsibility: Only counts, measures and renders samples
+- Inheritance: Counter, Gauge and Histogram share one labelled base class
+- Encapsulation: Label storage and locking are internal
+"""
+import bisect
+import threading
+
+
+class Metric:
+    """
+    Base class for a metric family with a fixed set of label names
+    
+    Samples are stored per tuple of label values, so recording a sample is
+    one dictionary lookup under a lock.
+    """
+    
+    TYPE = 'untyped'
+    
+    def __init__(self, name, documentation, labelnames=()):
+        """
+        Initialize an empty metric family
+        
+        Args:
+            name (str): Metric name
+            documentation (str): HELP text
+            labelnames (tuple): Label names, in the order values are passed
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+    
+    def render(self):
+        """
+        Render the family in the Prometheus text exposition format
+        
+        Returns:
+            list: Lines (HELP, TYPE, then one line per sample)
+        """
+        lines = [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} {self.TYPE}'
+        ]
+        with self._lock:
+            values = sorted(
+                (labelvalues, self._snapshot(value))
+                for labelvalues, value in self._values.items()
+            )
+        for labelvalues, value in values:
+            lines.extend(self._render_sample(labelvalues, value))
+        return lines
+    
+    def clear(self):
+        """Drop every sample"""
+        with self._lock:
+            self._values = {}
+    
+    def _snapshot(self, value):
+        """
+        Copy a sample value while the lock is held
+        Encapsulation: Private method
+        """
+        return value
+    
+    def _render_sample(self, labelvalues, value):
+        """
+        Render the lines of one labelled sample
+        Encapsulation: Private method
+        """
+        return [f'{self.name}{format_labels(self.labelnames, labelvalues)} {format_value(value)}']
+
+
+class Counter(Metric):
+    """Monotonically increasing count"""
+    
+    TYPE = 'counter'
+    
+    def inc(self, labelvalues=(), amount=1):
+        """
+        Increase the count of a label set
+        
+        Args:
+            labelvalues (tuple): Label values
+            amount (float): Increment
+        """
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+
+class Gauge(Metric):
+    """Value that can go up and down"""
+    
+    TYPE = 'gauge'
+    
+    def inc(self, labelvalues=(), amount=1):
+        """
+        Change the value of a label set
+        
+        Args:
+            labelvalues (tuple): Label values
+            amount (float): Change (negative to decrease)
+        """
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+    
+    def dec(self, labelvalues=(), amount=1):
+        """Decrease the value of a label set"""
+        self.inc(labelvalues, -amount)
+    
+    def set(self, labelvalues=(), value=0):
+        """
+        Set the value of a label set
+        
+        Args:
+            labelvalues (tuple): Label values
+            value (float): New value
+        """
+        with self._lock:
+            self._values[labelvalues] = value
+
+
+class Histogram(Metric):
+    """
+    Distribution of observed values in cumulative buckets
+    
+    Each label set keeps a count per bucket plus the sum and count of all
+    observations; buckets are made cumulative when rendered.
+    """
+    
+    TYPE = 'histogram'
+    
+    def __init__(self, name, documentation, labelnames=(), buckets=()):
+        """
+        Initialize an empty histogram
+        
+        Args:
+            name (str): Metric name
+            documentation (str): HELP text
+            labelnames (tuple): Label names
+            buckets (tuple): Upper bounds, ascending (+Inf is implied)
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+    
+    def observe(self, labelvalues, value):
+        """
+        Record one observation
+        
+        Args:
+            labelvalues (tuple): Label values
+            value (float): Observed value
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labelvalues)
+            if state is None:
+                state = self._values[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+    
+    def _snapshot(self, value):
+        """
+        Copy the bucket counts of a label set
+        Encapsulation: Private method
+        """
+        counts, total, count = value
+        return list(counts), total, count
+    
+    def _render_sample(self, labelvalues, value):
+        """
+        Render the bucket, sum and count lines of one label set
+        Encapsulation: Private method
+        """
+        counts, total, count = value
+        labelnames = self.labelnames + ('le',)
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+            cumulative += bucket_count
+            le = '+Inf' if bound == float('inf') else format_value(bound)
+            lines.append(
+                f'{self.name}_bucket{format_labels(labelnames, labelvalues + (le,))} {cumulative}'
+            )
+        labels = format_labels(self.labelnames, labelvalues)
+        lines.append(f'{self.name}_sum{labels} {format_value(total)}')
+        lines.append(f'{self.name}_count{labels} {count}')
+        return lines
+
+
+def format_labels(labelnames, labelvalues):
+    """
+    Format a label set as {name="value",...}
+    
+    Args:
+        labelnames (tuple): Label names
+        labelvalues (tuple): Label values
+    
+    Returns:
+        str: Formatted labels ('' without labels)
+    """
+    if not labelnames:
+        return ''
+    pairs = ','.join(
+        f'{name}="{escape_label_value(value)}"'
+        for name, value in zip(labelnames, labelvalues)
+    )
+    return '{' + pairs + '}'
+
+
+def escape_label_value(value):
+    """Escape a label value (backslash, double quote and newline)"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_value(value):
+    """Format a sample value (integers without a decimal point)"""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
@@ -0,0 +1,89 @@
+"""
+Prefix Index Utilities
+Implements an in-memory sorted index for autocomplete with OOP principles:
+- Single Responsibility: Only stores names with counts and finds prefixes
+- Encapsulation: Sort order, case folding and locking are internal
+"""
+import bisect
+import heapq
+import threading
+
+
+class PrefixIndex:
+    """
+    Thread-safe, case-insensitive prefix index of names with counts
+    
+    Names are kept in a list sorted by their case-folded form, so the names
+    starting with a prefix form one contiguous slice found with two binary
+    searches. Lookups never touch the database.
+    """
+    
+    def __init__(self, counts=None):
+        """
+        Initialize the index
+        
+        Args:
+            counts (dict): Initial name -> count mapping
+        """
+        self._lock = threading.Lock()
+        self._counts = {}
+        self._keys = []
+        self.replace(counts or {})
+    
+    def replace(self, counts):
+        """
+        Replace the whole index
+        
+        Args:
+            counts (dict): Name -> count mapping
+        """
+        counts = {name: count for name, count in counts.items() if count > 0}
+        keys = sorted((name.casefold(), name) for name in counts)
+        with self._lock:
+            self._counts = counts
+            self._keys = keys
+    
+    def add(self, name, delta):
+        """
+        Change the count of a name, adding or removing it as needed
+        
+        Args:
+            name (str): Name
+            delta (int): Count change (negative to decrement)
+        """
+        key = (name.casefold(), name)
+        with self._lock:
+            count = self._counts.get(name, 0) + delta
+            if count > 0:
+                if name not in self._counts:
+                    bisect.insort(self._keys, key)
+                self._counts[name] = count
+            elif name in self._counts:
+                del self._counts[name]
+                index = bisect.bisect_left(self._keys, key)
+                if index < len(self._keys) and self._keys[index] == key:
+                    del self._keys[index]
+    
+    def search(self, prefix, limit):
+        """
+        Find the names with the highest counts starting with a prefix
+        
+        Args:
+            prefix (str): Case-insensitive prefix ('' matches every name)
+            limit (int): Maximum number of results
+        
+        Returns:
+            list: (name, count) tuples, highest count first, then by name
+        """
+        folded = prefix.casefold()
+        with self._lock:
+            counts = self._counts
+            start = bisect.bisect_left(self._keys, (folded,))
+            end = bisect.bisect_left(self._keys, (folded + '\U0010ffff',), start)
+            keys = self._keys if end - start == len(self._keys) else self._keys[start:end]
+            best = heapq.nsmallest(limit, keys, key=lambda key: (-counts[key[1]], key))
+            return [(name, counts[name]) for _, name in best]
+    
+    def __len__(self):
+        """Number of names in the index"""
+        return len(self._counts)
@@ -0,0 +1,95 @@
+"""
+Rate Limiting Utilities
+Implements bounded in-process token buckets with OOP principles:
+- Single Responsibility: Only tracks request budgets per key
+- Encapsulation: Bucket state, eviction and locking are internal
+"""
+import math
+import threading
+import time
+from collections import OrderedDict
+
+
+class TokenBucketLimiter:
+    """
+    Thread-safe token buckets keyed by an arbitrary string
+    
+    Each key may spend up to `burst` requests at once and regains `rate`
+    requests per second after that. At most max_keys buckets are kept; the
+    least recently used bucket is evicted first. An evicted key starts
+    again with a full bucket, so max_keys should comfortably exceed the
+    number of distinct keys active within burst / rate seconds.
+    """
+    
+    def __init__(self, rate, burst, max_keys):
+        """
+        Initialize the limiter
+        
+        Args:
+            rate (float): Requests regained per second
+            burst (int): Maximum requests allowed at once
+            max_keys (int): Maximum number of buckets kept
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+        self.allowed = 0
+        self.limited = 0
+        self.evictions = 0
+    
+    def hit(self, key):
+        """
+        Spend one request from a key's bucket
+        
+        Args:
+            key (str): Bucket key (client IP, username, ...)
+        
+        Returns:
+            int: 0 if the request is allowed, otherwise the number of seconds
+                to wait before retrying
+        """
+        now = time.monotonic()
+        
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            
+            if tokens >= 1:
+                tokens -= 1
+                retry_after = 0
+                self.allowed += 1
+            else:
+                retry_after = max(1, math.ceil((1 - tokens) / self.rate))
+                self.limited += 1
+            
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+                self.evictions += 1
+        
+        return retry_after
+    
+    def clear(self):
+        """Remove all buckets"""
+        with self._lock:
+            self._buckets.clear()
+    
+    def stats(self):
+        """
+        Get limiter statistics
+        
+        Returns:
+            dict: Key count, capacity and allowed/limited/eviction counters
+        """
+        with self._lock:
+            return {
+                'keys': len(self._buckets),
+                'max_keys': self.max_keys,
+                'allowed': self.allowed,
+                'limited': self.limited,
+                'evictions': self.evictions
+            }
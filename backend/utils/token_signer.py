@@ -0,0 +1,103 @@
+"""
+Token Signing Utilities
+Implements HMAC-signed bearer tokens with OOP principles:
+- Single Responsibility: Only issues and checks signed tokens
+- Encapsulation: Key derivation and token layout are internal
+"""
+import base64
+import hashlib
+import hmac
+import secrets
+import time
+
+
+class TokenSigner:
+    """
+    Issues and verifies self-contained, expiring bearer tokens
+    
+    Token layout: v1.<key id>.<user id>.<expiry>.<token id>.<signature>
+    The signature is HMAC-SHA256 over everything before it, with a key
+    derived from a secret. Tokens are signed with the first secret and
+    accepted with any of them, so a new SECRET_KEY can be rolled out while
+    the previous one is kept as a fallback until its tokens expire.
+    """
+    
+    VERSION = 'v1'
+    
+    def __init__(self, secret_keys):
+        """
+        Initialize the signer
+        
+        Args:
+            secret_keys (list): Secrets, current first, then fallbacks
+        """
+        self._keys = {}
+        self._signing_kid = None
+        
+        for secret in secret_keys:
+            key = hmac.new(secret.encode(), b'share-your-experience.auth-token', hashlib.sha256).digest()
+            kid = hashlib.sha256(key).hexdigest()[:8]
+            self._keys.setdefault(kid, key)
+            if self._signing_kid is None:
+                self._signing_kid = kid
+    
+    def sign(self, user_id, ttl):
+        """
+        Issue a token for a user
+        
+        Args:
+            user_id (int): User ID
+            ttl (int): Seconds until the token expires
+        
+        Returns:
+            str: Signed token
+        """
+        expires = int(time.time()) + int(ttl)
+        body = f'{self.VERSION}.{self._signing_kid}.{user_id}.{expires}.{secrets.token_hex(8)}'
+        return f'{body}.{self._signature(self._keys[self._signing_kid], body)}'
+    
+    def verify(self, token):
+        """
+        Check a token's signature and expiry
+        
+        Args:
+            token (str): Token to check
+        
+        Returns:
+            tuple or None: (user_id, expires, token_id) if the token is valid
+        """
+        # compare_digest() only accepts ASCII strings, and valid tokens are ASCII
+        if not token.isascii():
+            return None
+        
+        parts = token.split('.')
+        if len(parts) != 6 or parts[0] != self.VERSION:
+            return None
+        
+        _, kid, user_id, expires, token_id, signature = parts
+        key = self._keys.get(kid)
+        if key is None:
+            return None
+        
+        body = token[:-len(signature) - 1]
+        if not hmac.compare_digest(self._signature(key, body), signature):
+            return None
+        
+        try:
+            user_id, expires = int(user_id), int(expires)
+        except ValueError:
+            return None
+        
+        if expires <= time.time():
+            return None
+        
+        return user_id, expires, token_id
+    
+    @staticmethod
+    def _signature(key, body):
+        """
+        Compute the URL-safe signature of a token body
+        Encapsulation: Private method
+        """
+        digest = hmac.new(key, body.encode(), hashlib.sha256).digest()
+        return base64.urlsafe_b64encode(digest).decode().rstrip('=')
@@ -27,15 +27,35 @@ class Validator:
         if not username or not password:
             return False, 'Username and password are required'
         
+        is_valid, error = Validator.validate_username(username)
+        if not is_valid:
+            return False, error
+        
+        if len(password) < Config.MIN_PASSWORD_LENGTH:
+            return False, f'Password must be at least {Config.MIN_PASSWORD_LENGTH} characters long'
+        
+        return True, None
+    
+    @staticmethod
+    def validate_username(username):
+        """
+        Validate a username
+        
+        Args:
+            username (str): Username to validate
+            
+        Returns:
+            tuple: (is_valid, error_message)
+        """
+        if not isinstance(username, str) or not username:
+            return False, 'Username is required'
+        
         if len(username) < Config.MIN_USERNAME_LENGTH:
             return False, f'Username must be at least {Config.MIN_USERNAME_LENGTH} characters long'
         
         if len(username) > Config.MAX_USERNAME_LENGTH:
             return False, f'Username must be at most {Config.MAX_USERNAME_LENGTH} characters long'
         
-        if len(password) < Config.MIN_PASSWORD_LENGTH:
-            return False, f'Password must be at least {Config.MIN_PASSWORD_LENGTH} characters long'
-        
         # Check for valid username characters (alphanumeric and underscore)
         if not username.replace('_', '').isalnum():
             return False, 'Username can only contain letters, numbers, and underscores'
@@ -68,6 +88,11 @@ class Validator:
         if data['difficulty'] not in Config.VALID_DIFFICULTIES:
             return False, f'Difficulty must be one of {Config.VALID_DIFFICULTIES}'
         
+        # Validate text types (JSON bodies may carry numbers, lists or null)
+        for field in ('job_title', 'company_name', 'experience_description'):
+            if not isinstance(data[field], str):
+                return False, f'Field {field} must be a string'
+
         # Validate text lengths
         if len(data['job_title']) < 2:
             return False, 'Job title must be at least 2 characters long'
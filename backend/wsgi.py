@@ -0,0 +1,145 @@
+"""
+InterviewHub WSGI Entry Point
+Builds the production application lazily with OOP principles:
+- Single Responsibility: Only decides when and how the application is created
+- Encapsulation: Fork handling and startup reporting are internal
+
+Importing this module does not create the application or open the
+database. By default each worker process builds it on its first request.
+With WSGI_PRELOAD=1 the application is built at import time, which under
+a pre-forking server started with --preload happens once in the master
+process: workers then share its memory copy-on-write, and each child
+reopens database connections and restarts background threads after fork.
+
+The configuration is chosen with APP_CONFIG (default: production):
+    gunicorn wsgi:application --workers 4
+    WSGI_PRELOAD=1 gunicorn wsgi:application --workers 4 --preload
+"""
+import gc
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class LazyApplication:
+    """
+    WSGI callable that creates the Flask application on first use
+    
+    Startup phases (importing the application, configuration, extensions,
+    routes, database checks) are timed and logged once the application
+    exists, and are available from StartupTimer.current().
+    """
+    
+    # Extension holding the token store (SessionStore or SignedTokenStore),
+    # whose background sweeper thread must run in every process
+    TOKEN_STORE_EXTENSION = 'session_store'
+    
+    def __init__(self, config_name):
+        """
+        Initialize without creating the application
+        
+        Args:
+            config_name (str): Configuration passed to create_app()
+        """
+        self.config_name = config_name
+        self.flask_app = None
+        self._lock = threading.Lock()
+    
+    def load(self):
+        """
+        Create the application once (thread-safe)
+        
+        Returns:
+            Flask: The application
+        """
+        if self.flask_app is None:
+            with self._lock:
+                if self.flask_app is None:
+                    self.flask_app = self._create()
+        return self.flask_app
+    
+    def __call__(self, environ, start_response):
+        """Serve a request, creating the application first if needed"""
+        return self.load()(environ, start_response)
+    
+    def preload(self):
+        """
+        Create the application in the current (master) process and prepare
+        it to be forked: stop background threads, close pooled connections
+        and move the loaded objects out of the garbage collector's reach so
+        collections in the workers do not copy their memory pages
+        """
+        flask_app = self.load()
+        for store in self._sweeper_stores(flask_app):
+            store.sweeper.stop()
+            store.sweeper.join()
+        self._dispose_engines(flask_app, close=True)
+        gc.collect()
+        gc.freeze()
+        os.register_at_fork(after_in_child=self._after_fork)
+    
+    def _create(self):
+        """
+        Import and build the application, timing every phase
+        Encapsulation: Private method
+        """
+        started = time.perf_counter()
+        from app import create_app
+        from utils.startup_timer import StartupTimer
+        
+        timer = StartupTimer()
+        timer.add('import', time.perf_counter() - started)
+        flask_app = create_app(self.config_name, timer)
+        logger.info('Started %s application in process %d in %s',
+                    self.config_name, os.getpid(), timer.summary())
+        return flask_app
+    
+    def _after_fork(self):
+        """
+        Give a forked worker its own connections and sweeper threads
+        Encapsulation: Private method
+        """
+        self._lock = threading.Lock()
+        # Connections inherited from the master must not be closed by the child
+        self._dispose_engines(self.flask_app, close=False)
+        for store in self._sweeper_stores(self.flask_app):
+            store.sweeper = store.sweeper.restarted()
+    
+    def _sweeper_stores(self, flask_app):
+        """
+        Get the token store if it runs a sweeper thread
+        Encapsulation: Private method
+        
+        Returns:
+            list: The store, or nothing when sweeping is disabled
+        """
+        store = flask_app.extensions.get(self.TOKEN_STORE_EXTENSION)
+        return [store] if store is not None and store.sweeper is not None else []
+    
+    @staticmethod
+    def _dispose_engines(flask_app, close):
+        """
+        Drop the pooled connections of the primary and read engines
+        Encapsulation: Private method
+        """
+        from models import db
+        from services.database_profile import DatabaseProfile
+        
+        with flask_app.app_context():
+            db.engine.dispose(close=close)
+            profile = DatabaseProfile.current()
+            if profile is not None and profile.read_engine is not None:
+                profile.read_engine.dispose(close=close)
+
+
+logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'INFO'),
+                    format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+
+# Create the WSGI callable (gunicorn wsgi:application)
+application = LazyApplication(os.environ.get('APP_CONFIG', 'production'))
+
+if os.environ.get('WSGI_PRELOAD', '').lower() in ('1', 'true', 'yes'):
+    application.preload()